@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the conversion core.
+
+Usage:
+    uv run python scripts/benchmark.py threads [--threads 1,2,4,8] [--repeat 20]
+    uv run python scripts/benchmark.py overlays [--tenants 2000] [--entries 300]
+    uv run python scripts/benchmark.py cache [--duplicates 0.5] [--repeat 20]
+    uv run python scripts/benchmark.py bytes [--repeat 20]
+    uv run python scripts/benchmark.py daemon [--calls 50]
+    uv run python scripts/benchmark.py records [--workers 1,2,4] [--repeat 200]
+    uv run python scripts/benchmark.py markup [--repeat 50]
+    uv run python scripts/benchmark.py audit [--files 16] [--repeat 20] [--workers 1,2,4]
+    uv run python scripts/benchmark.py morphology [--pairs en_US>en_GB,en_GB>en_US] [--repeat 20]
+    uv run python scripts/benchmark.py pairs [--repeat 5]
+
+Subcommands:
+    threads   Throughput of convert() from a thread pool. On free-threaded CPython
+              (3.13t+) the speed-up column shows how well conversion scales across
+              cores; on GIL builds it should stay close to 1x.
+    overlays  Compile time and memory for many registered tenant overlays, and the
+              per-segment lookup overhead of converting through one.
+    cache     Cold and warm runs of convert() through a ResultCache over a corpus where
+              a given share of segments are exact duplicates, against no cache.
+    bytes     convert_bytes() on UTF-8 messages against decode + convert() + encode,
+              per segment and on the whole corpus as one document.
+    daemon    Wall-clock latency of separate `evc` processes converting one segment,
+              forwarded to an `evc --daemon` and converted in-process.
+    records   JSON Lines manifest throughput (records/s) across worker counts.
+    markup    Throughput (MiB/s) of convert_markup() on large Markdown and HTML documents
+              with code blocks, against convert() over the raw document.
+    audit     Throughput (MiB/s) of audit() over a directory of transcript files, against
+              reading the files and against convert(return_stats=True) on each of them.
+    morphology  The factored spelling table (residual entries plus suffix rules) against
+              the flat dict it replaces: entries and memory once loaded, lookup time on
+              the transcript words and on every crosswalk word, how many distinct
+              transcript words each one maps, and how many held-out crosswalk entries
+              the rules recover when factored from the rest.
+    pairs     Per-pair report: crosswalk rows each variant pair converts with and without
+              the en_AU/en_CA fallback chains, table size, lookup time and convert()
+              throughput relative to en_US>en_GB, plus how often the en_CA chain agrees
+              with the cells the crosswalk does fill in.
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import sysconfig
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from english_variant_converter import (  # noqa: E402
+    Overlay,
+    ResultCache,
+    audit,
+    convert,
+    convert_bytes,
+    register_overlay,
+)
+from english_variant_converter.data_loader import load_crosswalk  # noqa: E402
+from english_variant_converter.markup import convert_markup  # noqa: E402
+from english_variant_converter.morphology import SuffixTable, factor_table  # noqa: E402
+from english_variant_converter.records import convert_jsonl_stream  # noqa: E402
+from english_variant_converter.rules import (  # noqa: E402
+    SUPPORTED_VARIANTS,
+    _build_mapping,
+    build_table,
+    resolve_cell,
+)
+from english_variant_converter.tokenizer import WORD_PATTERN  # noqa: E402
+
+TRANSCRIPTS_DIR = ROOT / "samples" / "transcripts"
+
+
+def load_corpus() -> List[str]:
+    """Every line of the sample transcripts, as Whisper-sized segments."""
+    lines: List[str] = []
+    for path in sorted(TRANSCRIPTS_DIR.glob("*.txt")):
+        lines.extend(line for line in path.read_text(encoding="utf-8").splitlines() if line)
+    return lines
+
+
+def gil_status() -> str:
+    if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+        return "GIL build"
+    is_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    return "free-threaded, GIL " + ("enabled" if is_enabled() else "disabled")
+
+
+def bench_threads(args: argparse.Namespace) -> None:
+    corpus = load_corpus() * args.repeat
+    convert(corpus[0])  # warm the tables outside the timed region
+
+    def run(thread_count: int) -> float:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=thread_count) as pool:
+            for _ in pool.map(convert, corpus, chunksize=64):
+                pass
+        return time.perf_counter() - started
+
+    print(f"[bench] {len(corpus)} segments, {gil_status()}")
+    baseline = None
+    for thread_count in args.threads:
+        elapsed = run(thread_count)
+        baseline = baseline or elapsed
+        rate = len(corpus) / elapsed
+        print(
+            f"  threads={thread_count:<3} {elapsed:8.3f}s  {rate:10.0f} seg/s  "
+            f"speed-up {baseline / elapsed:4.2f}x"
+        )
+
+
+def _time_corpus(corpus: List[str], **kwargs) -> float:
+    started = time.perf_counter()
+    for segment in corpus:
+        convert(segment, **kwargs)
+    return time.perf_counter() - started
+
+
+def bench_overlays(args: argparse.Namespace) -> None:
+    rng = random.Random(0)
+    us_words = [row["en_US"].lower() for row in load_crosswalk("spelling_only")]
+    specs = []
+    for tenant in range(args.tenants):
+        additions = [
+            {"en_US": f"brand{tenant}x{idx}ize", "en_GB": f"brand{tenant}x{idx}ise"}
+            for idx in range(args.entries // 2)
+        ]
+        removals = rng.sample(us_words, args.entries // 4)
+        skip_pairs = [[word, f"{word}e"] for word in rng.sample(us_words, args.entries // 4)]
+        specs.append({"additions": additions, "removals": removals, "skip_pairs": skip_pairs})
+
+    started = time.perf_counter()
+    overlays = [register_overlay(f"tenant-{idx}", spec) for idx, spec in enumerate(specs)]
+    elapsed = time.perf_counter() - started
+    # Memory is measured on a second, traced compile so tracing does not skew timings.
+    tracemalloc.start()
+    traced = [Overlay(f"tenant-{idx}", spec) for idx, spec in enumerate(specs)]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del traced
+    print(f"[bench] {args.tenants} overlays x {args.entries} entries")
+    print(f"  compile  {elapsed:8.3f}s total  {elapsed / args.tenants * 1e3:8.3f} ms/overlay")
+    print(
+        f"  memory   {memory / 2**20:8.1f} MiB total  "
+        f"{memory / args.tenants / 1024:8.1f} KiB/overlay"
+    )
+
+    corpus = load_corpus() * args.repeat
+    convert(corpus[0])
+    base = _time_corpus(corpus)
+    layered = _time_corpus(corpus, overlay=overlays[len(overlays) // 2])
+    by_id = _time_corpus(corpus, overlay=f"tenant-{len(overlays) // 2}")
+    per_segment = 1e6 / len(corpus)
+    print(f"  base     {base * per_segment:8.2f} us/segment")
+    print(
+        f"  overlay  {layered * per_segment:8.2f} us/segment "
+        f"({(layered / base - 1) * 100:+.1f}%), by id {by_id * per_segment:.2f} us/segment"
+    )
+
+
+def bench_cache(args: argparse.Namespace) -> None:
+    rng = random.Random(0)
+    unique = [
+        f"{line} [{idx}]" for idx, line in enumerate(load_corpus() * args.repeat)
+    ]
+    duplicate_count = int(len(unique) * args.duplicates)
+    corpus = unique[: len(unique) - duplicate_count]
+    corpus += rng.choices(corpus, k=duplicate_count)
+    rng.shuffle(corpus)
+    convert(corpus[0])
+
+    base = _time_corpus(corpus)
+    print(f"[bench] {len(corpus)} segments, {args.duplicates:.0%} duplicates")
+    print(f"  no cache {base:8.3f}s")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "evc.sqlite"
+        for label in ("cold", "warm"):
+            with ResultCache(path) as cache:
+                elapsed = _time_corpus(corpus, cache=cache)
+                stats = cache.stats
+            print(
+                f"  {label:<8} {elapsed:8.3f}s  hit rate {stats.hit_rate:6.1%}  "
+                f"saved {stats.saved_seconds:.3f}s  overhead {stats.overhead_seconds:.3f}s"
+            )
+
+
+def bench_bytes(args: argparse.Namespace) -> None:
+    segments = [line.encode("utf-8") for line in load_corpus() * args.repeat]
+    document = b"\n".join(segments)
+    convert(segments[0].decode("utf-8"))
+
+    def via_str(data: bytes) -> bytes:
+        return convert(data.decode("utf-8")).encode("utf-8")
+
+    print(f"[bench] {len(segments)} segments, {len(document) / 2**20:.1f} MiB as one document")
+    for label, payloads in (("segments", segments), ("document", [document])):
+        timings = {}
+        for name, func in (("str", via_str), ("bytes", convert_bytes)):
+            started = time.perf_counter()
+            for data in payloads:
+                func(data)
+            timings[name] = time.perf_counter() - started
+        print(
+            f"  {label:<9} decode+convert+encode {timings['str']:8.3f}s  "
+            f"convert_bytes {timings['bytes']:8.3f}s  "
+            f"({timings['str'] / timings['bytes']:4.2f}x)"
+        )
+
+
+def _time_invocations(calls: int, payload: bytes, env: Dict[str, str]) -> List[float]:
+    command = [sys.executable, "-m", "english_variant_converter.daemon"]
+    timings = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        subprocess.run(command, input=payload, env=env, stdout=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - started)
+    return sorted(timings)
+
+
+def bench_daemon(args: argparse.Namespace) -> None:
+    payload = load_corpus()[0].encode("utf-8")
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, "evc.sock")
+        env = dict(os.environ, EVC_SOCKET=socket_path, PYTHONPATH=str(ROOT / "src"))
+        server = subprocess.Popen(
+            [sys.executable, "-m", "english_variant_converter.daemon", "--daemon"],
+            env=env,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            while not os.path.exists(socket_path):
+                if server.poll() is not None:
+                    raise SystemExit("evc --daemon exited before listening")
+                time.sleep(0.01)
+            runs = {
+                "daemon": _time_invocations(args.calls, payload, env),
+                "in-process": _time_invocations(
+                    args.calls, payload, dict(env, EVC_NO_DAEMON="1")
+                ),
+            }
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"[bench] {args.calls} evc calls per run, {len(payload)} byte segment")
+    for label, timings in runs.items():
+        p50 = timings[len(timings) // 2] * 1e3
+        p95 = timings[int(len(timings) * 0.95)] * 1e3
+        mean = sum(timings) / len(timings) * 1e3
+        print(f"  {label:<10} mean {mean:7.1f} ms  p50 {p50:7.1f} ms  p95 {p95:7.1f} ms")
+
+
+def bench_records(args: argparse.Namespace) -> None:
+    manifest = "".join(
+        json.dumps({"audio": f"clips/{idx:08d}.wav", "duration": 4.2, "text": line}) + "\n"
+        for idx, line in enumerate(load_corpus() * args.repeat)
+    )
+    records = manifest.count("\n")
+    print(f"[bench] {records} JSON Lines records, {len(manifest) / 2**20:.1f} MiB")
+    baseline = None
+    for workers in args.workers:
+        started = time.perf_counter()
+        convert_jsonl_stream(io.StringIO(manifest), io.StringIO(), workers=workers)
+        elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(
+            f"  workers={workers:<3} {elapsed:8.3f}s  {records / elapsed:10.0f} records/s  "
+            f"speed-up {baseline / elapsed:4.2f}x"
+        )
+
+
+def _markup_documents(repeat: int) -> Dict[str, str]:
+    corpus = load_corpus()
+    code = "def color_center(color):\n    return {'color': color, 'center': 'gray'}\n"
+    markdown = []
+    html = []
+    for idx in range(repeat):
+        for line in corpus:
+            markdown.append(f"{line} See `color_{idx}` and [notes](https://x.example/color).\n\n")
+            html.append(f'<p class="color center">{line} <code>color_{idx}</code></p>\n')
+        markdown.append(f"```python\n{code * 20}```\n\n")
+        html.append(f"<pre><code>{code * 20}</code></pre>\n")
+    return {"markdown": "".join(markdown), "html": "".join(html)}
+
+
+def bench_markup(args: argparse.Namespace) -> None:
+    convert("warm up the tables")
+    for markup, document in _markup_documents(args.repeat).items():
+        size = len(document.encode("utf-8")) / 2**20
+        started = time.perf_counter()
+        convert(document)
+        plain = time.perf_counter() - started
+        started = time.perf_counter()
+        convert_markup(document, markup)
+        aware = time.perf_counter() - started
+        print(
+            f"[bench] {markup:<8} {size:6.1f} MiB  convert() {size / plain:6.2f} MiB/s  "
+            f"convert_markup() {size / aware:6.2f} MiB/s  ({plain / aware:4.2f}x)"
+        )
+
+
+def bench_audit(args: argparse.Namespace) -> None:
+    corpus = "\n".join(load_corpus()) + "\n"
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for idx in range(args.files):
+            path = Path(directory) / f"{idx:04d}.txt"
+            path.write_text(corpus * args.repeat, encoding="utf-8")
+            paths.append(path)
+        size = sum(path.stat().st_size for path in paths) / 2**20
+        print(f"[bench] {args.files} files, {size:.1f} MiB")
+
+        started = time.perf_counter()
+        for path in paths:
+            path.read_bytes()
+        read = time.perf_counter() - started
+        started = time.perf_counter()
+        for path in paths:
+            convert(path.read_text(encoding="utf-8"), return_stats=True)
+        converted = time.perf_counter() - started
+        print(f"  read only            {size / read:8.1f} MiB/s")
+        print(f"  convert(stats)       {size / converted:8.1f} MiB/s")
+        for workers in args.workers:
+            started = time.perf_counter()
+            audit([directory], workers=workers)
+            elapsed = time.perf_counter() - started
+            print(
+                f"  audit workers={workers:<3} {size / elapsed:8.1f} MiB/s  "
+                f"({converted / elapsed:4.1f}x convert)"
+            )
+
+
+def _time_lookups(get: Callable[[str], object], words: List[str]) -> float:
+    started = time.perf_counter()
+    for word in words:
+        get(word)
+    return time.perf_counter() - started
+
+
+def _traced_load(payload: str, build: Callable[[object], object]) -> int:
+    """Bytes still allocated after decoding ``payload`` and building a table from it."""
+    tracemalloc.start()
+    table = build(json.loads(payload))
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del table
+    return memory
+
+
+def bench_morphology(args: argparse.Namespace) -> None:
+    rng = random.Random(0)
+    rows = load_crosswalk("spelling_only")
+    text_words = [word.lower() for word in WORD_PATTERN.findall("\n".join(load_corpus()))]
+    text_words *= args.repeat
+    distinct = set(text_words)
+    print(f"[bench] {len(text_words)} transcript words, {len(distinct)} distinct")
+    for pair in args.pairs:
+        source, target = pair.split(">")
+        flat = build_table(rows, source, target)
+        residual, pair_rules = factor_table(flat)
+        table = SuffixTable(residual, pair_rules)
+        stems = sum(len(stems or ()) for stems in pair_rules.values())
+        flat_memory = _traced_load(json.dumps(flat), dict)
+        factored_memory = _traced_load(
+            json.dumps([residual, pair_rules]), lambda loaded: SuffixTable(*loaded)
+        )
+        crosswalk_words = list(flat) * args.repeat
+        print(f"  {pair}")
+        print(f"    flat dict  {len(flat):6d} entries  {flat_memory / 1024:8.1f} KiB loaded")
+        print(
+            f"    factored   {len(residual):6d} entries + {stems} stems in "
+            f"{len(pair_rules)} rules  {factored_memory / 1024:8.1f} KiB loaded"
+        )
+        for label, words in (("transcript", text_words), ("crosswalk", crosswalk_words)):
+            plain = _time_lookups(flat.get, words)
+            factored = _time_lookups(table.get, words)
+            per_word = 1e9 / len(words)
+            print(
+                f"    {label:<10} lookup  flat {plain * per_word:6.0f} ns/word  "
+                f"factored {factored * per_word:6.0f} ns/word ({factored / plain:4.2f}x)"
+            )
+        flat_hits = sum(word in flat for word in distinct)
+        factored_hits = sum(word in table for word in distinct)
+        print(f"    distinct transcript words mapped: flat {flat_hits}, factored {factored_hits}")
+        # Coverage of inflections the crosswalk does not list: factor 80% of the entries
+        # and count the held-out ones the rules still get right (a flat dict gets none).
+        held_out = set(rng.sample(sorted(flat), len(flat) // 5))
+        trained = SuffixTable(*factor_table({k: v for k, v in flat.items() if k not in held_out}))
+        recovered = sum(trained.get(word) == flat[word] for word in held_out)
+        wrong = sum(trained.get(word) not in (None, flat[word]) for word in held_out)
+        print(
+            f"    held-out 20% of entries: {recovered}/{len(held_out)} recovered "
+            f"({recovered / len(held_out):.0%}), {wrong} mapped differently"
+        )
+
+
+def bench_pairs(args: argparse.Namespace) -> None:
+    rows = load_crosswalk("spelling_only")
+    explicit = [row for row in rows if row.get("en_CA", "").strip()]
+    agree = sum(
+        resolve_cell({**row, "en_CA": ""}, "en_CA").lower() == row["en_CA"].strip().lower()
+        for row in explicit
+    )
+    print(
+        f"[bench] {len(rows)} crosswalk rows; en_CA fallback agrees with "
+        f"{agree}/{len(explicit)} filled-in cells ({agree / len(explicit):.0%})"
+    )
+    corpus = load_corpus() * args.repeat
+    print(
+        f"  {'pair':<12} {'rows before':>11} {'rows after':>11} {'coverage':>8} "
+        f"{'entries':>7} {'stems':>6} {'lookup':>9} {'convert':>9}"
+    )
+    baseline = None
+    for source in SUPPORTED_VARIANTS:
+        # The transcripts are American; respell them once so each pair sees its own input.
+        segments = corpus if source == "en_US" else [
+            convert(segment, "en_US", source) for segment in corpus
+        ]
+        words = [word.lower() for word in WORD_PATTERN.findall("\n".join(segments))]
+        for target in SUPPORTED_VARIANTS:
+            if source == target:
+                continue
+            before = sum(
+                1
+                for row in rows
+                if row.get(source, "").strip()
+                and row.get(target, "").strip()
+                and row[source].strip().lower() != row[target].strip().lower()
+            )
+            after = len(build_table(rows, source, target))
+            table = _build_mapping(source, target, "spelling_only")
+            stems = sum(len(stems or ()) for stems in table.rules.values())
+            lookup = _time_lookups(table.get, words) / len(words) * 1e9
+            convert(segments[0], source, target)
+            started = time.perf_counter()
+            for segment in segments:
+                convert(segment, source, target)
+            elapsed = time.perf_counter() - started
+            if (source, target) == ("en_US", "en_GB"):
+                baseline = elapsed
+            relative = f"{elapsed / baseline:8.2f}x" if baseline else f"{elapsed:8.3f}s"
+            print(
+                f"  {source}>{target[3:]:<6} {before:11d} {after:11d} {after / len(rows):8.0%} "
+                f"{len(table.entries):7d} {stems:6d} {lookup:6.0f} ns {relative:>9}"
+            )
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part]
+
+
+BENCHMARKS: Dict[str, Callable[[argparse.Namespace], None]] = {
+    "threads": bench_threads,
+    "overlays": bench_overlays,
+    "cache": bench_cache,
+    "bytes": bench_bytes,
+    "daemon": bench_daemon,
+    "records": bench_records,
+    "markup": bench_markup,
+    "audit": bench_audit,
+    "morphology": bench_morphology,
+    "pairs": bench_pairs,
+}
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks for english-variant-converter.")
+    sub = parser.add_subparsers(dest="benchmark", required=True)
+
+    threads = sub.add_parser("threads", help="convert() throughput from a thread pool")
+    threads.add_argument("--threads", type=_int_list, default=[1, 2, 4, 8])
+    threads.add_argument("--repeat", type=int, default=20)
+
+    overlays = sub.add_parser("overlays", help="tenant overlay compile time and lookup overhead")
+    overlays.add_argument("--tenants", type=int, default=2000)
+    overlays.add_argument("--entries", type=int, default=300)
+    overlays.add_argument("--repeat", type=int, default=20)
+
+    cache = sub.add_parser("cache", help="ResultCache hit rate and time saved")
+    cache.add_argument("--duplicates", type=float, default=0.5)
+    cache.add_argument("--repeat", type=int, default=20)
+
+    bytes_ = sub.add_parser("bytes", help="convert_bytes() against decode/convert/encode")
+    bytes_.add_argument("--repeat", type=int, default=20)
+
+    daemon = sub.add_parser("daemon", help="evc latency with and without a warm daemon")
+    daemon.add_argument("--calls", type=int, default=50)
+
+    records = sub.add_parser("records", help="JSON Lines throughput across worker counts")
+    records.add_argument("--workers", type=_int_list, default=[1, 2, 4])
+    records.add_argument("--repeat", type=int, default=200)
+
+    markup = sub.add_parser("markup", help="Markdown/HTML throughput against plain convert()")
+    markup.add_argument("--repeat", type=int, default=50)
+
+    audit_ = sub.add_parser("audit", help="audit() throughput against reading and converting")
+    audit_.add_argument("--files", type=int, default=16)
+    audit_.add_argument("--repeat", type=int, default=20)
+    audit_.add_argument("--workers", type=_int_list, default=[1, 2, 4])
+
+    morphology = sub.add_parser("morphology", help="factored spelling table against a flat dict")
+    morphology.add_argument(
+        "--pairs", type=lambda value: value.split(","), default=["en_US>en_GB", "en_GB>en_US"]
+    )
+    morphology.add_argument("--repeat", type=int, default=20)
+
+    pairs = sub.add_parser("pairs", help="coverage and speed of every variant pair")
+    pairs.add_argument("--repeat", type=int, default=5)
+
+    args = parser.parse_args(argv)
+    BENCHMARKS[args.benchmark](args)
+
+
+if __name__ == "__main__":
+    main()
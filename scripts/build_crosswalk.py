@@ -4,20 +4,42 @@ Convert permissively-licensed spelling sources into the derived crosswalk CSVs u
 english-variant-converter package.
 
 Usage:
-    uv run python scripts/build_crosswalk.py
+    uv run python scripts/build_crosswalk.py [--force] [--jobs N]
+
+Each raw source is fingerprinted and its parsed rows are cached under data/.cache/, so
+only sources that changed are re-parsed (in parallel when several are stale). Only the
+outputs an input change affects are rebuilt: a change to rules.py or morphology.py (or
+an edited index) regenerates the runtime's precompiled index (crosswalk_index.json)
+from the packaged CSVs without re-parsing or merging any source. Files are only
+rewritten when their contents change. --force ignores the caches.
 """
 from __future__ import annotations
 
+import argparse
 import csv
-import shutil
+import hashlib
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import parse_varcon
 
 ROOT = Path(__file__).resolve().parents[1]
 DERIVED_DIR = ROOT / "data" / "derived"
 PACKAGE_DATA_DIR = ROOT / "src" / "english_variant_converter" / "data"
 EXCEPTIONS_PATH = ROOT / "data" / "exceptions" / "spelling_exceptions.csv"
+# Fallback chains and suffix families decide what goes into the runtime index.
+RULES_PATH = ROOT / "src" / "english_variant_converter" / "rules.py"
+MORPHOLOGY_PATH = ROOT / "src" / "english_variant_converter" / "morphology.py"
+CACHE_DIR = ROOT / "data" / ".cache"
+MANIFEST_PATH = CACHE_DIR / "manifest.json"
+# Bump when read_source() changes shape so cached intermediates are discarded.
+CACHE_FORMAT = 1
 
 VARIANT_FIELDS = ("en_US", "en_GB", "en_AU", "en_CA")
 
@@ -30,11 +52,16 @@ class SourceSpec:
     variant_map: Dict[str, str]
     lemma_field: str | None = None
     notes_field: str | None = None
+    generated_by: str | None = None
 
     @property
     def path(self) -> Path:
         return ROOT / "data" / "raw" / self.filename
 
+    @property
+    def cache_path(self) -> Path:
+        return CACHE_DIR / f"{self.name}.json"
+
 
 SOURCE_SPECS: List[SourceSpec] = [
     SourceSpec(
@@ -68,13 +95,19 @@ SOURCE_SPECS: List[SourceSpec] = [
         },
         lemma_field="lemma",
         notes_field="notes",
+        generated_by="varcon",
     ),
 ]
 SOURCE_PRIORITY = {spec.name: idx for idx, spec in enumerate(SOURCE_SPECS)}
-SKIP_EXCEPTIONS: Set[Tuple[str, str]] = set()
 
 
-def read_source(spec: SourceSpec) -> List[Dict[str, str]]:
+def fingerprint(path: Path) -> str:
+    if not path.exists():
+        return ""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def read_source(spec: SourceSpec, skip_exceptions: Set[Tuple[str, str]]) -> List[Dict[str, str]]:
     if not spec.path.exists():
         print(f"[build] Skipping {spec.name} (missing {spec.path})")
         return []
@@ -108,7 +141,7 @@ def read_source(spec: SourceSpec) -> List[Dict[str, str]]:
 
             us_value = normalized.get("en_US", "")
             gb_value = normalized.get("en_GB", "")
-            if should_skip_pair(us_value, gb_value):
+            if should_skip_pair(us_value, gb_value, skip_exceptions):
                 continue
 
             rows.append(
@@ -182,41 +215,93 @@ def collapse_rows(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
     return unique
 
 
+def write_if_changed(path: Path, data: bytes) -> bool:
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def render_csv(rows: List[Dict[str, str]]) -> bytes:
+    header = ["variant_id", "lemma", "type", *VARIANT_FIELDS, "notes", "source"]
+    buffer = io.StringIO(newline="")
+    writer = csv.DictWriter(buffer, fieldnames=header)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({key: row.get(key, "") for key in header})
+    return buffer.getvalue().encode("utf-8")
+
+
 def write_csv(path: Path, rows: List[Dict[str, str]]) -> None:
     if not rows:
         print(f"[build] No rows to write for {path.name}, skipping")
         return
 
-    path.parent.mkdir(parents=True, exist_ok=True)
-    header = ["variant_id", "lemma", "type", *VARIANT_FIELDS, "notes", "source"]
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=header)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow({key: row.get(key, "") for key in header})
-    print(f"[build] Wrote {len(rows)} rows → {path}")
+    if write_if_changed(path, render_csv(rows)):
+        print(f"[build] Wrote {len(rows)} rows → {path}")
+    else:
+        print(f"[build] {path.name} unchanged")
 
 
 def copy_to_package(source_path: Path) -> None:
-    PACKAGE_DATA_DIR.mkdir(parents=True, exist_ok=True)
     destination = PACKAGE_DATA_DIR / source_path.name
-    destination.write_bytes(source_path.read_bytes())
-    print(f"[build] Synced {source_path.name} → {destination}")
+    if write_if_changed(destination, source_path.read_bytes()):
+        print(f"[build] Synced {source_path.name} → {destination}")
 
 
 def copy_exceptions_to_package() -> None:
     if not EXCEPTIONS_PATH.exists():
         return
-    destination_dir = PACKAGE_DATA_DIR / "exceptions"
-    destination_dir.mkdir(parents=True, exist_ok=True)
-    destination = destination_dir / EXCEPTIONS_PATH.name
-    destination.write_bytes(EXCEPTIONS_PATH.read_bytes())
-    print(f"[build] Synced spelling exceptions → {destination}")
-
-
-def load_exception_policies() -> None:
+    destination = PACKAGE_DATA_DIR / "exceptions" / EXCEPTIONS_PATH.name
+    if write_if_changed(destination, EXCEPTIONS_PATH.read_bytes()):
+        print(f"[build] Synced spelling exceptions → {destination}")
+
+
+def write_runtime_index(
+    spelling_rows: List[Dict[str, str]], lexical_rows: List[Dict[str, str]]
+) -> None:
+    """Emit the per-pair tables the runtime would otherwise derive from the CSVs.
+
+    Spelling tables are stored factored: the residual entries under ``tables`` and the
+    suffix rules that produce the rest under ``morphology``.
+    """
+    sys.path.insert(0, str(ROOT / "src"))
+    from english_variant_converter import data_loader, morphology, rules
+
+    tables: Dict[str, Dict[str, Dict[str, str]]] = {}
+    rule_sets: Dict[str, Dict[str, Optional[List[str]]]] = {}
+    for kind, rows in (("spelling_only", spelling_rows), ("lexical_choice", lexical_rows)):
+        tables[kind] = {}
+        for source in VARIANT_FIELDS:
+            for target in VARIANT_FIELDS:
+                if source == target:
+                    continue
+                key = rules.index_key(source, target)
+                table = rules.build_table(rows, source, target)
+                if kind == "spelling_only":
+                    table, pair_rules = morphology.factor_table(table)
+                    if pair_rules:
+                        rule_sets[key] = pair_rules
+                if table:
+                    tables[kind][key] = table
+
+    index = {
+        "format": data_loader.INDEX_FORMAT,
+        "data_version": data_loader.data_version(),
+        "tables": tables,
+        "morphology": rule_sets,
+    }
+    destination = index_path()
+    payload = json.dumps(index, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    if write_if_changed(destination, payload):
+        print(f"[build] Wrote runtime index → {destination}")
+
+
+def load_exception_policies() -> Set[Tuple[str, str]]:
+    skip_exceptions: Set[Tuple[str, str]] = set()
     if not EXCEPTIONS_PATH.exists():
-        return
+        return skip_exceptions
     with EXCEPTIONS_PATH.open(newline="", encoding="utf-8") as handle:
         reader = csv.DictReader(handle)
         for row in reader:
@@ -226,20 +311,155 @@ def load_exception_policies() -> None:
             us = (row.get("en_US") or "").strip().lower()
             gb = (row.get("en_GB") or "").strip().lower()
             if us and gb:
-                SKIP_EXCEPTIONS.add((us, gb))
+                skip_exceptions.add((us, gb))
+    return skip_exceptions
 
 
-def should_skip_pair(us_value: str, gb_value: str) -> bool:
+def should_skip_pair(us_value: str, gb_value: str, skip_exceptions: Set[Tuple[str, str]]) -> bool:
     if not us_value or not gb_value:
         return False
-    return (us_value.lower(), gb_value.lower()) in SKIP_EXCEPTIONS
+    return (us_value.lower(), gb_value.lower()) in skip_exceptions
+
+
+def source_key(spec: SourceSpec, exceptions_fp: str) -> str:
+    return f"{CACHE_FORMAT}:{fingerprint(spec.path)}:{exceptions_fp}"
+
+
+def load_cached_rows(spec: SourceSpec, key: str) -> Optional[List[Dict[str, str]]]:
+    if not spec.cache_path.exists():
+        return None
+    cached = json.loads(spec.cache_path.read_text(encoding="utf-8"))
+    if cached.get("key") != key:
+        return None
+    print(f"[build] Reusing {len(cached['rows'])} cached rows for {spec.name}")
+    return cached["rows"]
+
+
+def store_cached_rows(spec: SourceSpec, key: str, rows: List[Dict[str, str]]) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    spec.cache_path.write_text(json.dumps({"key": key, "rows": rows}), encoding="utf-8")
+
+
+def parse_sources(
+    skip_exceptions: Set[Tuple[str, str]], exceptions_fp: str, jobs: int, force: bool
+) -> Dict[str, List[Dict[str, str]]]:
+    """Parse every raw source, reusing cached rows for unchanged inputs."""
+    parsed: Dict[str, List[Dict[str, str]]] = {}
+
+    def collect(specs: List[SourceSpec], pool: Optional[ProcessPoolExecutor]) -> None:
+        stale: List[Tuple[SourceSpec, str]] = []
+        for spec in specs:
+            key = source_key(spec, exceptions_fp)
+            rows = None if force else load_cached_rows(spec, key)
+            if rows is None:
+                stale.append((spec, key))
+            else:
+                parsed[spec.name] = rows
+        if pool is not None and len(stale) > 1:
+            futures = [
+                (spec, key, pool.submit(read_source, spec, skip_exceptions))
+                for spec, key in stale
+            ]
+            results = [(spec, key, future.result()) for spec, key, future in futures]
+        else:
+            results = [(spec, key, read_source(spec, skip_exceptions)) for spec, key in stale]
+        for spec, key, rows in results:
+            store_cached_rows(spec, key, rows)
+            parsed[spec.name] = rows
+
+    plain = [spec for spec in SOURCE_SPECS if not spec.generated_by]
+    generated = [spec for spec in SOURCE_SPECS if spec.generated_by]
+    varcon_stale = parse_varcon.INPUT_PATH.exists() and (force or parse_varcon.is_stale())
+
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            varcon = pool.submit(parse_varcon.refresh, True) if varcon_stale else None
+            collect(plain, pool)
+            if varcon is not None:
+                varcon.result()
+            collect(generated, pool)
+    else:
+        if varcon_stale:
+            parse_varcon.refresh(True)
+        collect(plain, None)
+        collect(generated, None)
+    return parsed
+
+
+def input_fingerprints() -> Dict[str, str]:
+    inputs = {spec.name: fingerprint(spec.path) for spec in SOURCE_SPECS}
+    inputs["varcon"] = fingerprint(parse_varcon.INPUT_PATH)
+    inputs["exceptions"] = fingerprint(EXCEPTIONS_PATH)
+    inputs["rules"] = fingerprint(RULES_PATH)
+    inputs["morphology"] = fingerprint(MORPHOLOGY_PATH)
+    inputs["cache_format"] = str(CACHE_FORMAT)
+    return inputs
+
+
+# Inputs that only feed the runtime index; every other input feeds the crosswalk CSVs
+# (and, through them, the index).
+INDEX_ONLY_INPUTS = ("rules", "morphology")
+
+
+def crosswalk_paths() -> List[Path]:
+    return [
+        DERIVED_DIR / "spelling_crosswalk.csv",
+        DERIVED_DIR / "lexical_crosswalk.csv",
+        PACKAGE_DATA_DIR / "spelling_crosswalk.csv",
+        PACKAGE_DATA_DIR / "lexical_crosswalk.csv",
+    ]
+
+
+def index_path() -> Path:
+    return PACKAGE_DATA_DIR / "crosswalk_index.json"
+
+
+def output_paths() -> List[Path]:
+    return [*crosswalk_paths(), index_path()]
+
+
+def load_manifest() -> Dict[str, Dict[str, str]]:
+    if not MANIFEST_PATH.exists():
+        return {}
+    return json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+
+
+def stale_stages(inputs: Dict[str, str], manifest: Dict[str, Dict[str, str]]) -> Tuple[bool, bool]:
+    """``(crosswalk stale, index stale)``: changed inputs, or outputs edited or missing."""
+    previous_inputs = manifest.get("inputs", {})
+    previous_outputs = manifest.get("outputs", {})
+    changed = {name for name, value in inputs.items() if previous_inputs.get(name) != value}
+
+    def outputs_changed(paths: List[Path]) -> bool:
+        return any(
+            not path.exists()
+            or previous_outputs.get(str(path.relative_to(ROOT))) != fingerprint(path)
+            for path in paths
+        )
+
+    crosswalk = bool(changed - set(INDEX_ONLY_INPUTS)) or outputs_changed(crosswalk_paths())
+    index = crosswalk or bool(changed) or outputs_changed([index_path()])
+    return crosswalk, index
+
 
+def write_manifest(inputs: Dict[str, str]) -> None:
+    outputs = {str(path.relative_to(ROOT)): fingerprint(path) for path in output_paths()}
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    MANIFEST_PATH.write_text(
+        json.dumps({"inputs": inputs, "outputs": outputs}, indent=2), encoding="utf-8"
+    )
+
+
+def build_crosswalk(
+    inputs: Dict[str, str], jobs: int, force: bool
+) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+    """Parse, merge and write the crosswalk CSVs; returns (spelling rows, lexical rows)."""
+    skip_exceptions = load_exception_policies()
+    parsed = parse_sources(skip_exceptions, inputs["exceptions"], jobs, force)
 
-def main() -> None:
-    load_exception_policies()
     all_rows: List[Dict[str, str]] = []
     for spec in SOURCE_SPECS:
-        all_rows.extend(read_source(spec))
+        all_rows.extend(parsed.get(spec.name, []))
 
     deduped_rows = deduplicate(all_rows)
     collapsed_rows = collapse_rows(deduped_rows)
@@ -257,6 +477,47 @@ def main() -> None:
     if lexical_rows:
         copy_to_package(lexical_path)
     copy_exceptions_to_package()
+    return spelling_rows, lexical_rows
+
+
+def read_crosswalk() -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+    """(spelling rows, lexical rows) from the up-to-date packaged CSVs."""
+    rows = []
+    for name in ("spelling_crosswalk.csv", "lexical_crosswalk.csv"):
+        path = PACKAGE_DATA_DIR / name
+        if not path.exists():
+            rows.append([])
+            continue
+        with path.open(newline="", encoding="utf-8") as handle:
+            rows.append(list(csv.DictReader(handle)))
+    print("[build] Crosswalk CSVs up to date; rebuilding the runtime index only")
+    return rows[0], rows[1]
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="Ignore fingerprints and caches.")
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1, help="Parallel parse workers."
+    )
+    args = parser.parse_args(argv)
+
+    inputs = input_fingerprints()
+    crosswalk_stale, index_stale = (
+        (True, True) if args.force else stale_stages(inputs, load_manifest())
+    )
+    if not index_stale:
+        print("[build] All outputs up to date")
+        return
+
+    if crosswalk_stale:
+        spelling_rows, lexical_rows = build_crosswalk(inputs, args.jobs, args.force)
+        # parse_varcon may have regenerated scowl_varcon.csv while parsing.
+        inputs = input_fingerprints()
+    else:
+        spelling_rows, lexical_rows = read_crosswalk()
+    write_runtime_index(spelling_rows, lexical_rows)
+    write_manifest(inputs)
 
 
 if __name__ == "__main__":
@@ -3,20 +3,27 @@
 Parse the VarCon text file into a CSV consumable by build_crosswalk.py.
 
 Usage:
-    uv run python scripts/parse_varcon.py
+    uv run python scripts/parse_varcon.py [--force]
 Requires:
     data/raw/varcon.txt  (extracted from the VarCon tarball)
+
+The parse is skipped when varcon.txt is unchanged since the last run (tracked by a
+fingerprint stamp under data/.cache/); pass --force to re-parse regardless.
 """
 from __future__ import annotations
 
 import csv
-import re
+import hashlib
+import json
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
 INPUT_PATH = ROOT / "data" / "raw" / "varcon.txt"
 OUTPUT_PATH = ROOT / "data" / "raw" / "scowl_varcon.csv"
+STAMP_PATH = ROOT / "data" / ".cache" / "varcon.json"
+OUTPUT_FIELDS = ["lemma", "en_US", "en_GB", "en_AU", "en_CA", "notes"]
 
 REGION_TO_COLUMN = {
     "A": "en_US",
@@ -65,14 +72,15 @@ def parse_line(line: str) -> List[Tuple[str, str, int]]:
     return variants
 
 
-def main() -> None:
-    if not INPUT_PATH.exists():
-        raise SystemExit(f"Missing {INPUT_PATH}. Download VarCon and place varcon.txt there.")
+def fingerprint(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
 
+
+def parse_file(path: Path) -> List[Dict[str, str]]:
     rows: List[Dict[str, str]] = []
     current_lemma = ""
 
-    with INPUT_PATH.open(encoding="latin-1") as handle:
+    with path.open(encoding="latin-1") as handle:
         for raw_line in handle:
             line = raw_line.strip()
             if not line:
@@ -114,16 +122,46 @@ def main() -> None:
                     "notes": "",
                 }
             )
+    return rows
+
+
+def is_stale() -> bool:
+    if not INPUT_PATH.exists():
+        return False
+    if not (OUTPUT_PATH.exists() and STAMP_PATH.exists()):
+        return True
+    stamp = json.loads(STAMP_PATH.read_text(encoding="utf-8"))
+    return stamp.get("input") != fingerprint(INPUT_PATH) or stamp.get("output") != fingerprint(
+        OUTPUT_PATH
+    )
 
+
+def refresh(force: bool = False) -> bool:
+    """Re-parse varcon.txt when it changed; returns True when the CSV was rewritten."""
+    if not INPUT_PATH.exists():
+        raise SystemExit(f"Missing {INPUT_PATH}. Download VarCon and place varcon.txt there.")
+    if not force and not is_stale():
+        print(f"[varcon] {OUTPUT_PATH.name} is up to date")
+        return False
+
+    rows = parse_file(INPUT_PATH)
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
     with OUTPUT_PATH.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(
-            handle, fieldnames=["lemma", "en_US", "en_GB", "en_AU", "en_CA", "notes"]
-        )
+        writer = csv.DictWriter(handle, fieldnames=OUTPUT_FIELDS)
         writer.writeheader()
         writer.writerows(rows)
 
+    STAMP_PATH.parent.mkdir(parents=True, exist_ok=True)
+    STAMP_PATH.write_text(
+        json.dumps({"input": fingerprint(INPUT_PATH), "output": fingerprint(OUTPUT_PATH)}),
+        encoding="utf-8",
+    )
     print(f"[varcon] Parsed {len(rows)} rows → {OUTPUT_PATH}")
+    return True
+
+
+def main() -> None:
+    refresh(force="--force" in sys.argv[1:])
 
 
 if __name__ == "__main__":
@@ -1,3 +1,81 @@
-from .api import ConversionStats, SwapSummary, convert
+from __future__ import annotations
 
-__all__ = ["convert", "ConversionStats", "SwapSummary"]
+from importlib import import_module
+
+# Not ``typing.TYPE_CHECKING``: importing ``typing`` alone would double the cost of a
+# daemon-forwarded ``evc`` call. Type checkers treat this constant the same way.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .api import (
+        ConversionStats,
+        Edit,
+        SwapSummary,
+        apply_edits,
+        convert,
+        find_edits,
+        merge_stats,
+    )
+    from .auditing import AuditReport, audit
+    from .cache import CacheStats, ResultCache
+    from .detect import VariantDetection, detect_variant
+    from .overlays import Overlay, register_overlay, unregister_overlay
+    from .parallel import convert_parallel
+    from .utf8 import convert_bytes
+
+# Public names are imported on first use, so that the ``evc`` entry point can forward
+# to a running daemon without paying for the conversion modules (see ``daemon.py``).
+_EXPORTS = {
+    "convert": ".api",
+    "convert_parallel": ".parallel",
+    "convert_bytes": ".utf8",
+    "find_edits": ".api",
+    "apply_edits": ".api",
+    "audit": ".auditing",
+    "detect_variant": ".detect",
+    "merge_stats": ".api",
+    "register_overlay": ".overlays",
+    "unregister_overlay": ".overlays",
+    "Overlay": ".overlays",
+    "ResultCache": ".cache",
+    "CacheStats": ".cache",
+    "ConversionStats": ".api",
+    "Edit": ".api",
+    "SwapSummary": ".api",
+    "AuditReport": ".auditing",
+    "VariantDetection": ".detect",
+}
+
+# Spelled out so linters and type checkers see the re-exports above.
+__all__ = [
+    "convert",
+    "convert_parallel",
+    "convert_bytes",
+    "find_edits",
+    "apply_edits",
+    "audit",
+    "detect_variant",
+    "merge_stats",
+    "register_overlay",
+    "unregister_overlay",
+    "Overlay",
+    "ResultCache",
+    "CacheStats",
+    "ConversionStats",
+    "Edit",
+    "SwapSummary",
+    "AuditReport",
+    "VariantDetection",
+]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
 from . import rules
-from .tokenizer import Token, tokenize
+from .cache import ResultCache
+from .detect import VariantDetection, resolve_source
+from .overlays import Overlay, resolve_overlay
+from .tokenizer import Token, count_words, tokenize
 
 SUPPORTED_VARIANTS = rules.SUPPORTED_VARIANTS
 
@@ -22,14 +26,26 @@ class ConversionStats:
     converted_tokens: int
     protected_tokens: int
     swaps: Tuple[SwapSummary, ...]
+    detection: Optional[VariantDetection] = None
 
     def to_dict(self) -> dict:
-        return {
+        result = {
             "total_tokens": self.total_tokens,
             "converted_tokens": self.converted_tokens,
             "protected_tokens": self.protected_tokens,
             "swaps": [swap.__dict__ for swap in self.swaps],
         }
+        if self.detection is not None:
+            result["detection"] = self.detection.to_dict()
+        return result
+
+
+class Edit(NamedTuple):
+    start: int
+    end: int
+    replacement: str
+    rule_type: str
+    policy: str
 
 
 def _convert_internal(
@@ -37,7 +53,15 @@ def _convert_internal(
     source: str,
     target: str,
     mode: str = "spelling_only",
-) -> Tuple[str, ConversionStats]:
+    *,
+    edits: Optional[List[Edit]] = None,
+    build_text: bool = True,
+    span: Optional[Tuple[int, int]] = None,
+    overlay: Optional[Overlay] = None,
+) -> Tuple[Optional[str], ConversionStats]:
+    # ``span`` limits conversion, stats and output to ``text[lo:hi]``; the rest of the
+    # text only supplies prev/next context. Words crossing the span edge stay as-is.
+    lo, hi = span if span is not None else (0, len(text))
     tokens = tokenize(text)
     converted_chunks = []
     swaps: Dict[Tuple[str, str], int] = {}
@@ -46,7 +70,18 @@ def _convert_internal(
     converted_tokens = 0
 
     prev_word: Optional[str] = None
+    offset = 0
     for idx, token in enumerate(tokens):
+        start = offset
+        offset += len(token.text)
+        if start >= hi:
+            break
+        if start < lo or offset > hi:
+            if offset > lo:
+                converted_chunks.append(text[max(start, lo) : min(offset, hi)])
+            if token.is_word:
+                prev_word = token.text.lower()
+            continue
         if not token.is_word:
             converted_chunks.append(token.text)
             continue
@@ -67,14 +102,20 @@ def _convert_internal(
                 break
             future_idx += 1
 
-        converted = rules.convert_token(token.text, source=source, target=target, mode=mode)
+        converted = rules.convert_token(
+            token.text, source=source, target=target, mode=mode, overlay=overlay
+        )
         if converted != token.text:
-            if not rules.is_swap_allowed(token.text, converted, prev_word, next_word):
+            policy = rules.swap_policy(token.text, converted, prev_word, next_word, overlay)
+            if policy is None:
                 converted = token.text
             else:
                 converted_tokens += 1
                 key = (token.text.lower(), converted.lower())
                 swaps[key] = swaps.get(key, 0) + 1
+                if edits is not None:
+                    rule_type = rules.rule_type(token.text, converted, source, target, overlay)
+                    edits.append(Edit(start, offset, converted, rule_type, policy))
 
         converted_chunks.append(converted)
 
@@ -87,9 +128,145 @@ def _convert_internal(
         protected_tokens=protected_tokens,
         swaps=tuple(SwapSummary(source=src, target=dst, count=count) for (src, dst), count in sorted(swaps.items())),
     )
+    if not build_text:
+        return None, stats
     return "".join(converted_chunks), stats
 
 
+def _stats_from_dict(data: dict) -> ConversionStats:
+    return ConversionStats(
+        total_tokens=data["total_tokens"],
+        converted_tokens=data["converted_tokens"],
+        protected_tokens=data["protected_tokens"],
+        swaps=tuple(SwapSummary(**swap) for swap in data["swaps"]),
+    )
+
+
+def _convert_cached(
+    cache: ResultCache,
+    text: str,
+    source: str,
+    target: str,
+    mode: str,
+    *,
+    with_edits: bool = False,
+    overlay: Optional[Overlay] = None,
+) -> Tuple[str, ConversionStats, Optional[List[Edit]]]:
+    key = cache.key(text, source, target, mode, overlay.version if overlay else "")
+    hit = cache.get(key, need_edits=with_edits)
+    if hit is not None:
+        converted, stats, edit_rows = hit
+        edits = [Edit(*row) for row in edit_rows] if with_edits else None
+        return converted, _stats_from_dict(stats), edits
+
+    started = time.perf_counter()
+    edits = [] if with_edits else None
+    converted, stats = _convert_internal(
+        text, source=source, target=target, mode=mode, edits=edits, overlay=overlay
+    )
+    cost = time.perf_counter() - started
+    edit_rows = [list(edit) for edit in edits] if edits is not None else None
+    cache.put(key, converted, stats.to_dict(), edit_rows, cost)
+    return converted, stats, edits
+
+
+def _unchanged_stats(text: str, span: Optional[Tuple[int, int]] = None) -> ConversionStats:
+    total_tokens, protected_tokens = count_words(text, span)
+    return ConversionStats(
+        total_tokens=total_tokens,
+        converted_tokens=0,
+        protected_tokens=protected_tokens,
+        swaps=(),
+    )
+
+
+def _convert_window(
+    text: str,
+    before: str,
+    after: str,
+    source: str,
+    target: str,
+    mode: str,
+    *,
+    edits: Optional[List[Edit]] = None,
+    overlay: Optional[Overlay] = None,
+) -> Tuple[str, ConversionStats]:
+    """Convert ``text`` as if ``before`` and ``after`` surrounded it.
+
+    Edit offsets are relative to ``before + text + after``.
+    """
+    window = before + text + after
+    span = (len(before), len(before) + len(text))
+    if not rules.needs_conversion(text, source, target, mode, overlay):
+        return text, _unchanged_stats(window, span)
+    converted, stats = _convert_internal(
+        window, source=source, target=target, mode=mode, edits=edits, span=span, overlay=overlay
+    )
+    return converted, stats
+
+
+def merge_stats(stats: Iterable[ConversionStats]) -> ConversionStats:
+    """Sum several ``ConversionStats`` (e.g. per segment or per shard) into one."""
+    total_tokens = 0
+    converted_tokens = 0
+    protected_tokens = 0
+    swaps: Dict[Tuple[str, str], int] = {}
+    for item in stats:
+        total_tokens += item.total_tokens
+        converted_tokens += item.converted_tokens
+        protected_tokens += item.protected_tokens
+        for swap in item.swaps:
+            key = (swap.source, swap.target)
+            swaps[key] = swaps.get(key, 0) + swap.count
+    return ConversionStats(
+        total_tokens=total_tokens,
+        converted_tokens=converted_tokens,
+        protected_tokens=protected_tokens,
+        swaps=tuple(
+            SwapSummary(source=src, target=dst, count=count)
+            for (src, dst), count in sorted(swaps.items())
+        ),
+    )
+
+
+def find_edits(
+    text: str,
+    source: str = "en_US",
+    target: str = "en_GB",
+    mode: str = "spelling_only",
+    *,
+    overlay: Union[Overlay, str, None] = None,
+) -> List[Edit]:
+    """Return the character spans ``convert()`` would replace, without rebuilding the text."""
+    overlay = resolve_overlay(overlay)
+    edits: List[Edit] = []
+    if rules.needs_conversion(text, source, target, mode, overlay):
+        _convert_internal(
+            text,
+            source=source,
+            target=target,
+            mode=mode,
+            edits=edits,
+            build_text=False,
+            overlay=overlay,
+        )
+    return edits
+
+
+def apply_edits(text: str, edits: Iterable[Edit]) -> str:
+    """Splice ``edits`` (sorted, non-overlapping spans of ``text``) into ``text``."""
+    chunks = []
+    cursor = 0
+    for edit in edits:
+        chunks.append(text[cursor : edit.start])
+        chunks.append(edit.replacement)
+        cursor = edit.end
+    if not chunks:
+        return text
+    chunks.append(text[cursor:])
+    return "".join(chunks)
+
+
 def convert(
     text: str,
     source: str = "en_US",
@@ -97,8 +274,46 @@ def convert(
     mode: str = "spelling_only",
     *,
     return_stats: bool = False,
+    return_edits: bool = False,
+    overlay: Union[Overlay, str, None] = None,
+    cache: Optional[ResultCache] = None,
 ):
+    """Convert ``text`` from ``source`` to ``target`` spelling.
+
+    Returns the converted string, followed by ``ConversionStats`` when ``return_stats``
+    is set and the list of ``Edit`` spans when ``return_edits`` is set. ``overlay`` is
+    an ``Overlay`` or the id of one registered with ``register_overlay()``.
+
+    ``source="auto"`` detects the source variant first (see ``detect_variant()``); the
+    detection is attached to the stats. Text with no variant-specific spellings is
+    returned unchanged.
+
+    With a ``ResultCache``, texts that need converting are looked up in (and added to)
+    the cache; the fast path for texts with nothing to convert never touches it.
+    """
+    source, detection = resolve_source(text, source, target)
+    overlay = resolve_overlay(overlay)
+    edits: Optional[List[Edit]] = [] if return_edits else None
+    if not rules.needs_conversion(text, source, target, mode, overlay):
+        # Fast path: nothing in the text is convertible, hand back the same object.
+        converted = text
+        stats = _unchanged_stats(text) if return_stats else None
+    elif cache is not None:
+        converted, stats, edits = _convert_cached(
+            cache, text, source, target, mode, with_edits=return_edits, overlay=overlay
+        )
+    else:
+        converted, stats = _convert_internal(
+            text, source=source, target=target, mode=mode, edits=edits, overlay=overlay
+        )
+    if stats is not None and detection is not None:
+        stats.detection = detection
+
+    if not (return_stats or return_edits):
+        return converted
+    result: tuple = (converted,)
     if return_stats:
-        return _convert_internal(text, source=source, target=target, mode=mode)
-    converted, _ = _convert_internal(text, source=source, target=target, mode=mode)
-    return converted
+        result += (stats,)
+    if return_edits:
+        result += (edits,)
+    return result
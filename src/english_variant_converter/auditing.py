@@ -0,0 +1,449 @@
+from __future__ import annotations
+
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import compress
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from . import rules
+from .exception_policies import get_exception_policies
+from .overlays import Overlay, resolve_overlay
+from .tokenizer import _should_protect
+
+DEFAULT_BLOCK_SIZE = 4 << 20
+# Distinct words a scanner remembers the suffix-rule verdict for before starting over.
+DERIVED_CACHE_SIZE = 1 << 16
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Files are scanned as UTF-8 bytes: ASCII letters never occur inside a multi-byte
+# sequence, so these patterns see the same word boundaries as TOKEN_PATTERN on the
+# decoded text (see ``utf8.py``).
+_WORD_PATTERN = re.compile(rb"[A-Za-z]+")
+_NON_LETTERS = re.compile(rb"[^A-Za-z]*")
+_BLOCK_END = re.compile(rb"\s")
+_LETTERS = frozenset(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+
+# Lowercases ASCII letters and turns every other byte into a space, so that
+# ``bytes.split(b" ")`` yields the lowercase ASCII words at C speed.
+_FOLD = bytes(
+    byte + 32 if 65 <= byte <= 90 else byte if 97 <= byte <= 122 else 32 for byte in range(256)
+)
+
+# A non-letter run that is a word of its own: non-ASCII bytes only, between ASCII words
+# or the ends of the text (decoded and checked with ``isalpha()``). Each pattern starts
+# with a character class so the regex engine can skip ahead to candidate bytes.
+_NON_ASCII_RUN = re.compile(rb"[\x80-\xff](?<![^A-Za-z][\x80-\xff])[\x80-\xff]*(?![^A-Za-z])")
+
+# ASCII words ``_should_protect()`` protects after a marker or for their case (words
+# before an "@" are found separately). ``_SPACE`` is the UTF-8 form of exactly what
+# ``str.strip()`` removes.
+_SPACE = (
+    rb"(?:[\t-\r\x1c-\x20]|\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]"
+    rb"|\xe2\x81\x9f|\xe3\x80\x80)*"
+)
+_PROTECTED_WORD = re.compile(
+    rb"[:@#A-Z](?:"
+    rb"(?<=[@#])" + _SPACE + rb"(?P<after_marker>[A-Za-z]+)"  # "#colour", "@ color"
+    rb"|(?<=:)//" + _SPACE + rb"(?P<after_scheme>[A-Za-z]+)"  # "https://color"
+    rb"|(?<![A-Za-z][A-Z])(?<=[A-Z])(?:[a-z]*[A-Z][A-Za-z]*)?(?![A-Za-z])"  # "A", "NATO"
+    rb")"
+)
+
+
+@dataclass
+class PairAudit:
+    """How often one ``source -> target`` swap would be made or blocked.
+
+    ``policy`` is the exception policy of the pair: ``""`` (unlisted), ``"skip"``,
+    ``"conditional:<rule>"`` or ``"overlay-skip"``.
+    """
+
+    source: str
+    target: str
+    policy: str
+    converted: int = 0
+    blocked: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "source": self.source,
+            "target": self.target,
+            "policy": self.policy,
+            "converted": self.converted,
+            "blocked": self.blocked,
+        }
+
+
+@dataclass
+class AuditCounts:
+    """Scan totals for one file, or for a whole audit."""
+
+    bytes_scanned: int = 0
+    seconds: float = 0.0
+    total_tokens: int = 0
+    protected_tokens: int = 0
+    pairs: Dict[Tuple[str, str], PairAudit] = field(default_factory=dict)
+
+    @property
+    def convertible_tokens(self) -> int:
+        return sum(pair.converted for pair in self.pairs.values())
+
+    @property
+    def blocked_tokens(self) -> int:
+        return sum(pair.blocked for pair in self.pairs.values())
+
+    def policies(self) -> Dict[str, Dict[str, int]]:
+        """``{policy: {"converted": n, "blocked": n}}``; unlisted pairs are ``"none"``."""
+        totals: Dict[str, Dict[str, int]] = {}
+        for pair in self.pairs.values():
+            entry = totals.setdefault(pair.policy or "none", {"converted": 0, "blocked": 0})
+            entry["converted"] += pair.converted
+            entry["blocked"] += pair.blocked
+        return dict(sorted(totals.items()))
+
+    def merge(self, other: "AuditCounts") -> None:
+        self.bytes_scanned += other.bytes_scanned
+        self.seconds += other.seconds
+        self.total_tokens += other.total_tokens
+        self.protected_tokens += other.protected_tokens
+        for key, pair in other.pairs.items():
+            mine = self.pairs.get(key)
+            if mine is None:
+                mine = self.pairs[key] = PairAudit(pair.source, pair.target, pair.policy)
+            mine.converted += pair.converted
+            mine.blocked += pair.blocked
+
+    def to_dict(self) -> dict:
+        return {
+            "bytes": self.bytes_scanned,
+            "seconds": round(self.seconds, 6),
+            "total_tokens": self.total_tokens,
+            "convertible_tokens": self.convertible_tokens,
+            "blocked_tokens": self.blocked_tokens,
+            "protected_tokens": self.protected_tokens,
+            "policies": self.policies(),
+            "swaps": [pair.to_dict() for _, pair in sorted(self.pairs.items())],
+        }
+
+
+@dataclass
+class AuditReport:
+    source: str
+    target: str
+    mode: str
+    files: Dict[str, AuditCounts]
+
+    @property
+    def totals(self) -> AuditCounts:
+        totals = AuditCounts()
+        for counts in self.files.values():
+            totals.merge(counts)
+        return totals
+
+    def to_dict(self) -> dict:
+        return {
+            "source": self.source,
+            "target": self.target,
+            "mode": self.mode,
+            "totals": self.totals.to_dict(),
+            "files": {path: counts.to_dict() for path, counts in self.files.items()},
+        }
+
+
+def _context_start(data: bytes, pos: int) -> int:
+    """Start of the last complete ASCII word before ``pos`` (``parallel._context_start``)."""
+    idx = pos
+    while idx > 0 and data[idx - 1] not in _LETTERS:
+        idx -= 1
+    while idx > 0 and data[idx - 1] in _LETTERS:
+        idx -= 1
+    return idx
+
+
+def _block_bounds(buffer: bytes, block_size: int) -> Optional[Tuple[int, int]]:
+    """``(cut, end)``: a block boundary just after whitespace, and the end of the complete
+    ASCII word that follows it. ``None`` until ``buffer`` holds both."""
+    match = _BLOCK_END.search(buffer, block_size)
+    if match is None:
+        return None
+    following = _WORD_PATTERN.search(buffer, match.end())
+    if following is None or following.end() >= len(buffer):
+        return None
+    return match.end(), following.end()
+
+
+def _iter_windows(handle: IO[bytes], block_size: int) -> Iterator[Tuple[bytes, int, int]]:
+    """``(window, lo, hi)`` per block of ``handle``, read once in order.
+
+    ``window[lo:hi]`` is the block; the bytes around it are just enough context for its
+    words to tokenize, protect and see their neighbours exactly as in the whole file.
+    """
+    before = b""
+    buffer = b""
+    eof = False
+    while True:
+        bounds = _block_bounds(buffer, block_size)
+        while bounds is None and not eof:
+            data = handle.read(block_size)
+            if data:
+                buffer += data
+                bounds = _block_bounds(buffer, block_size)
+            else:
+                eof = True
+        if bounds is None:
+            if buffer:
+                yield before + buffer, len(before), len(before) + len(buffer)
+            return
+        cut, end = bounds
+        yield before + buffer[:end], len(before), len(before) + cut
+        start = _context_start(buffer, cut)
+        if start == 0 and _WORD_PATTERN.search(buffer, 0, cut) is None:
+            before += buffer[:cut]  # no word in this block: keep the older context
+        else:
+            before = buffer[start:cut]
+        buffer = buffer[cut:]
+
+
+class _Scanner:
+    """Counts what converting a file would do, without converting it."""
+
+    def __init__(self, source: str, target: str, mode: str, overlay: Optional[Overlay]) -> None:
+        rules.validate(source, target, mode)
+        self.source = source
+        self.target = target
+        self.mode = mode
+        self.overlay = overlay
+        words = set()
+        self._table = None
+        if source != target:
+            self._table = rules._build_mapping(source, target, mode)
+            words.update(self._table.entries)
+            if overlay is not None:
+                for table in overlay.layers(source, target, mode):
+                    words.update(table)
+        self._words = frozenset(words)
+        self._encoded = frozenset(word.encode("utf-8") for word in words)
+        # Words only the suffix rules map, looked up once per distinct word.
+        self._derived: Dict[bytes, bool] = {}
+        self._policies: Dict[Tuple[str, str], str] = {}
+        self._conversions: Dict[str, str] = {}
+
+    def _maps(self, word: str) -> bool:
+        return word in self._words or (self._table is not None and word in self._table)
+
+    def _derived_matches(self, distinct: Set[bytes]) -> Set[bytes]:
+        derived = self._derived
+        matches = set()
+        for word in distinct.difference(self._encoded):
+            hit = derived.get(word)
+            if hit is None:
+                if len(derived) >= DERIVED_CACHE_SIZE:
+                    derived.clear()
+                hit = derived[word] = word.decode() in self._table
+            if hit:
+                matches.add(word)
+        return matches
+
+    def scan(self, window: bytes, lo: int, hi: int, counts: AuditCounts) -> None:
+        counts.bytes_scanned += hi - lo
+        # Every ASCII word in the block, lowercase, with b"" between adjacent separators.
+        folded = window[lo:hi].translate(_FOLD)
+        parts = folded.split(b" ")
+        counts.total_tokens += len(parts) - parts.count(b"")
+        protected = _protected_starts(window, lo, hi)
+        counts.protected_tokens += len(protected)
+
+        if not window.isascii():
+            for match in _NON_ASCII_RUN.finditer(window, lo, hi):
+                text = match.group().decode("utf-8", "replace")
+                if not text.isalpha():
+                    continue
+                counts.total_tokens += 1
+                if _should_protect(text, None, None):
+                    counts.protected_tokens += 1
+                elif self._maps(text.lower()):
+                    self._count_swap(window, match.start(), match.end(), text, counts)
+
+        distinct = set(parts)
+        found = self._encoded.intersection(distinct)
+        if self._table is not None:
+            found = found.union(self._derived_matches(distinct))
+        if not found:
+            return
+        # Words with a mapping, in order; each is the next whole-word occurrence of itself
+        # in the folded block, so ``find()`` locates them without visiting other words.
+        padded = b" " + folded + b" "
+        cursor = 0
+        for word in compress(parts, map(found.__contains__, parts)):
+            at = padded.find(b" " + word + b" ", cursor)
+            cursor = at + len(word) + 1
+            start = lo + at
+            if start not in protected:
+                end = start + len(word)
+                self._count_swap(window, start, end, window[start:end].decode(), counts)
+
+    def _count_swap(
+        self, window: bytes, start: int, end: int, text: str, counts: AuditCounts
+    ) -> None:
+        converted = self._conversions.get(text)
+        if converted is None:
+            converted = rules.convert_token(text, self.source, self.target, self.mode, self.overlay)
+            self._conversions[text] = converted
+        if converted == text:
+            return
+        key = (text.lower(), converted.lower())
+        pair = counts.pairs.get(key)
+        if pair is None:
+            pair = counts.pairs[key] = PairAudit(key[0], key[1], self._policy(text, converted))
+        # Same outcome as ``rules.swap_policy()``; only conditional pairs need the context.
+        if pair.policy.startswith("conditional:"):
+            prev_word, next_word = _previous_word(window, start), _next_word(window, end)
+            allowed = rules.swap_policy(text, converted, prev_word, next_word, self.overlay)
+        else:
+            allowed = "" if not pair.policy else None
+        if allowed is None:
+            pair.blocked += 1
+        else:
+            pair.converted += 1
+
+    def _policy(self, original: str, candidate: str) -> str:
+        key = (original.lower(), candidate.lower())
+        policy = self._policies.get(key)
+        if policy is None:
+            if self.overlay is not None and self.overlay.is_skipped(original, candidate):
+                policy = "overlay-skip"
+            else:
+                result = get_exception_policies().classify(original, candidate)
+                policy = result.action
+                if result.action == "conditional":
+                    policy = f"conditional:{result.value}"
+            self._policies[key] = policy
+        return policy
+
+
+def _protected_starts(window: bytes, lo: int, hi: int) -> Set[int]:
+    """Start offsets of the ASCII words in ``window[lo:hi]`` that ``_should_protect()`` protects."""
+    starts = set()
+    for match in _PROTECTED_WORD.finditer(window, 0, hi):
+        # The word itself starts after the marker, or at the match for cased words.
+        start = match.start(match.lastgroup) if match.lastgroup else match.start()
+        if start >= lo:
+            starts.add(start)
+    # Words right before an "@" ("color@example.com").
+    at = window.find(b"@", lo, hi)
+    while at != -1:
+        if at > 0 and window[at - 1] in _LETTERS:
+            start = _context_start(window, at)
+            if start >= lo:
+                starts.add(start)
+        at = window.find(b"@", at + 1, hi)
+    return starts
+
+
+def _previous_word(window: bytes, start: int) -> Optional[str]:
+    """The word token before the one at ``start``, lowercase, as the tokenizer sees it."""
+    idx = start
+    while idx > 0 and window[idx - 1] not in _LETTERS:
+        idx -= 1
+    if idx < start:
+        chunk = window[idx:start].decode("utf-8", "replace")
+        if chunk.isalpha():  # a non-ASCII word
+            return chunk.lower()
+    return window[_context_start(window, idx) : idx].decode().lower() or None
+
+
+def _next_word(window: bytes, end: int) -> Optional[str]:
+    """The word token after the one ending at ``end``, lowercase."""
+    run_end = _NON_LETTERS.match(window, end).end()
+    if run_end > end:
+        chunk = window[end:run_end].decode("utf-8", "replace")
+        if chunk.isalpha():  # a non-ASCII word
+            return chunk.lower()
+    following = _WORD_PATTERN.match(window, run_end)
+    return following.group().decode().lower() if following else None
+
+
+def _audit_file(path: str, scanner: _Scanner, block_size: int) -> AuditCounts:
+    counts = AuditCounts()
+    started = time.perf_counter()
+    with open(path, "rb") as handle:
+        for window, lo, hi in _iter_windows(handle, block_size):
+            scanner.scan(window, lo, hi, counts)
+    counts.seconds = time.perf_counter() - started
+    return counts
+
+
+def _audit_files(
+    paths: List[str],
+    source: str,
+    target: str,
+    mode: str,
+    overlay: Optional[Overlay],
+    block_size: int,
+) -> List[AuditCounts]:
+    scanner = _Scanner(source, target, mode, overlay)
+    return [_audit_file(path, scanner, block_size) for path in paths]
+
+
+def _iter_files(paths: Iterable[PathLike]) -> Iterator[str]:
+    """``paths`` with directories expanded to the files below them, in sorted order."""
+    for path in paths:
+        path = os.fspath(path)
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                yield os.path.join(root, name)
+
+
+def audit(
+    paths: Iterable[PathLike],
+    source: str = "en_US",
+    target: str = "en_GB",
+    mode: str = "spelling_only",
+    *,
+    workers: int = 1,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    overlay: Union[Overlay, str, None] = None,
+) -> AuditReport:
+    """Count what converting the UTF-8 files under ``paths`` would change, per file.
+
+    Nothing is converted and no output or ``Token`` list is built: each file is read
+    once in blocks of ``block_size`` bytes, word and protected counts come from C-level
+    scans of the raw bytes, and only words that have a mapping for the pair are looked
+    at one by one (exception policy, and prev/next words for conditional pairs). Paths
+    may be directories, which are walked in sorted order. The counts match
+    ``convert(..., return_stats=True)`` on the decoded file; swaps an exception policy
+    blocks are counted as ``blocked`` under their pair. With ``workers > 1`` files are
+    spread over that many processes.
+    """
+    rules.validate(source, target, mode)
+    overlay = resolve_overlay(overlay)
+    files = list(_iter_files(paths))
+    if workers <= 1 or len(files) <= 1:
+        results = _audit_files(files, source, target, mode, overlay, block_size)
+    else:
+        # A few interleaved groups per worker: the tables are set up once per group, and
+        # long runs of large files still spread over all workers.
+        groups = [files[idx :: workers * 4] for idx in range(min(len(files), workers * 4))]
+        job = partial(
+            _audit_files,
+            source=source,
+            target=target,
+            mode=mode,
+            overlay=overlay,
+            block_size=block_size,
+        )
+        by_path: Dict[str, AuditCounts] = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for group, counts in zip(groups, pool.map(job, groups)):
+                by_path.update(zip(group, counts))
+        results = [by_path[path] for path in files]
+    return AuditReport(source, target, mode, dict(zip(files, results)))
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .data_loader import INDEX_FORMAT, data_version
+
+DEFAULT_MAX_ENTRIES = 100_000
+# Bump whenever the stored payload layout changes.
+CACHE_FORMAT = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    output TEXT NOT NULL,
+    stats TEXT NOT NULL,
+    edits TEXT,
+    cost REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+"""
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    saved_seconds: float = 0.0
+    overhead_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+            "saved_seconds": round(self.saved_seconds, 6),
+            "overhead_seconds": round(self.overhead_seconds, 6),
+        }
+
+
+class ResultCache:
+    """On-disk LRU cache of conversion results, stored in SQLite.
+
+    Entries are keyed by a hash of the text, variant pair, mode, overlay version and the
+    packaged data version, and hold the converted text, its stats and (when they were
+    requested) its edit spans. Opening a cache written against different crosswalk or
+    exception CSVs empties it. At most ``max_entries`` entries are kept; the least
+    recently used ones are evicted first.
+
+    ``stats`` counts hits and misses for this handle, together with the conversion time
+    the hits avoided (``saved_seconds``, as measured when the entry was stored) and the
+    time spent in the cache itself (``overhead_seconds``).
+    """
+
+    def __init__(
+        self, path: Union[str, Path], max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._version = f"{CACHE_FORMAT}:{INDEX_FORMAT}:{data_version()}"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+        if row is None or row[0] != self._version:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.execute("DELETE FROM entries")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('version', ?)",
+                    (self._version,),
+                )
+        self._count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def key(
+        self, text: str, source: str, target: str, mode: str, overlay_version: str = ""
+    ) -> str:
+        digest = hashlib.sha256()
+        for part in (self._version, source, target, mode, overlay_version):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(
+        self, key: str, *, need_edits: bool = False
+    ) -> Optional[Tuple[str, Dict[str, Any], Optional[List[list]]]]:
+        """Return ``(output, stats dict, edit rows)`` for ``key``, or ``None`` on a miss.
+
+        An entry stored without edits counts as a miss when ``need_edits`` is set.
+        """
+        started = time.perf_counter()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT output, stats, edits, cost FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (need_edits and row[2] is None):
+                self.stats.misses += 1
+                self.stats.overhead_seconds += time.perf_counter() - started
+                return None
+            self._conn.execute(
+                "UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            self.stats.hits += 1
+            self.stats.saved_seconds += row[3]
+            self.stats.overhead_seconds += time.perf_counter() - started
+        output, stats, edits, _ = row
+        return output, json.loads(stats), json.loads(edits) if edits is not None else None
+
+    def put(
+        self,
+        key: str,
+        output: str,
+        stats: Dict[str, Any],
+        edits: Optional[List[list]],
+        cost: float,
+    ) -> None:
+        """Store a result that took ``cost`` seconds to compute, evicting LRU entries."""
+        started = time.perf_counter()
+        payload = (
+            key,
+            output,
+            json.dumps(stats, separators=(",", ":")),
+            json.dumps(edits, separators=(",", ":")) if edits is not None else None,
+            cost,
+            time.time(),
+        )
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, output, stats, edits, cost, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                payload,
+            )
+            self._count += cursor.rowcount
+            if self._count > self.max_entries:
+                self._evict()
+            self.stats.overhead_seconds += time.perf_counter() - started
+
+    def _evict(self) -> None:
+        # Other processes may share the file, so recount before deciding how many to drop.
+        self._count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        excess = self._count - self.max_entries
+        if excess <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM entries WHERE key IN "
+            "(SELECT key FROM entries ORDER BY last_used LIMIT ?)",
+            (excess,),
+        )
+        self._count -= excess
+        self.stats.evictions += excess
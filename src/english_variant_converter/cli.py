@@ -1,15 +1,28 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import sys
 from typing import Iterable
 
 from .api import SUPPORTED_VARIANTS, convert
+from .auditing import audit
+from .cache import DEFAULT_MAX_ENTRIES, ResultCache
+from .daemon import serve
+from .detect import AUTO_SOURCE
+from .markup import MARKUPS, convert_markup
+from .parallel import convert_parallel
+from .records import convert_csv_stream, convert_jsonl_stream
+from .whisper_json import convert_whisper_json_stream
 
 
 def _format_table(stats) -> str:
-    lines = [
+    lines = []
+    if stats.detection is not None:
+        detected = stats.detection.variant or "undetermined"
+        lines.append(f"Detected source: {detected} (confidence {stats.detection.confidence:.2f})")
+    lines += [
         f"Total word tokens: {stats.total_tokens}",
         f"Converted tokens: {stats.converted_tokens}",
         f"Protected tokens: {stats.protected_tokens}",
@@ -26,16 +39,28 @@ def _format_table(stats) -> str:
     return "\n".join(lines)
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="evc", description="Convert English text between spelling variants."
+def _format_cache_table(cache_stats) -> str:
+    return "\n".join(
+        [
+            f"Cache hits: {cache_stats.hits} / {cache_stats.hits + cache_stats.misses} "
+            f"({cache_stats.hit_rate:.0%})",
+            f"Cache time saved: {cache_stats.saved_seconds:.3f}s "
+            f"(cache overhead {cache_stats.overhead_seconds:.3f}s)",
+        ]
     )
+
+
+def _add_variant_arguments(parser: argparse.ArgumentParser, *, auto_source: bool) -> None:
     parser.add_argument(
         "--from",
         dest="source",
-        choices=SUPPORTED_VARIANTS,
+        choices=SUPPORTED_VARIANTS + ((AUTO_SOURCE,) if auto_source else ()),
         default="en_US",
-        help="Source variant (default: en_US)",
+        help=(
+            "Source variant, or 'auto' to detect it from the text (default: en_US)"
+            if auto_source
+            else "Source variant (default: en_US)"
+        ),
     )
     parser.add_argument(
         "--to",
@@ -50,33 +75,213 @@ def build_parser() -> argparse.ArgumentParser:
         default="spelling_only",
         help="Whether to apply only spelling changes or also lexical substitutions.",
     )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="evc",
+        description=(
+            "Convert English text between spelling variants. "
+            "Run 'evc audit --help' to count changes across files without converting them."
+        ),
+    )
+    _add_variant_arguments(parser, auto_source=True)
+    parser.add_argument(
+        "--format",
+        choices=["text", "whisper-json", "jsonl", "csv", *MARKUPS],
+        default="text",
+        help=(
+            "Input format: plain text (default), Whisper verbose JSON with word timestamps, "
+            "JSON Lines / CSV records where only --field values are converted, or "
+            "Markdown / HTML where code, tags and URLs are left untouched."
+        ),
+    )
+    parser.add_argument(
+        "--field",
+        dest="fields",
+        action="append",
+        metavar="NAME",
+        help="Record field (jsonl key or csv column) to convert; repeatable (default: text).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Shard large plain-text inputs, or batches of jsonl/csv records, across this "
+            "many processes (default: 1)."
+        ),
+    )
     parser.add_argument(
         "--stats",
         choices=["table", "json"],
         help="Emit swap statistics to stderr (table or json).",
     )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="Reuse results from (and store them in) this SQLite cache file.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_ENTRIES,
+        help=f"Maximum number of cached results (default: {DEFAULT_MAX_ENTRIES}).",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help=(
+            "Run a warm daemon on a Unix socket ($EVC_SOCKET, default "
+            "$XDG_RUNTIME_DIR/evc-<uid>.sock); other evc calls forward to it. "
+            "Set EVC_NO_DAEMON=1 to always convert in-process."
+        ),
+    )
+    return parser
+
+
+def build_audit_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="evc audit",
+        description=(
+            "Count the words converting these UTF-8 files would change, per pair, "
+            "exception policy and file, without producing any output text. "
+            "Prints a JSON report to stdout."
+        ),
+    )
+    parser.add_argument(
+        "paths", nargs="+", metavar="PATH", help="Files, or directories to scan recursively."
+    )
+    _add_variant_arguments(parser, auto_source=False)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Scan files on this many processes (default: 1).",
+    )
     return parser
 
 
+def _audit(argv: list[str]) -> None:
+    args = build_audit_parser().parse_args(argv)
+    report = audit(
+        args.paths, source=args.source, target=args.target, mode=args.mode, workers=args.workers
+    )
+    print(json.dumps(report.to_dict(), indent=2))
+
+
+def _emit_field_stats(stats_by_field, style: str) -> None:
+    if style == "json":
+        payload = {field: stats.to_dict() for field, stats in stats_by_field.items()}
+        print(json.dumps(payload, indent=2), file=sys.stderr)
+        return
+    sections = [f"[{field}]\n{_format_table(stats)}" for field, stats in stats_by_field.items()]
+    print("\n\n".join(sections), file=sys.stderr)
+
+
+def _convert_records(args) -> None:
+    # Re-open the standard streams without newline translation so that records come
+    # out byte-identical apart from the converted fields.
+    src = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    dst = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="")
+    convert_stream = convert_jsonl_stream if args.format == "jsonl" else convert_csv_stream
+    try:
+        stats_by_field = convert_stream(
+            src,
+            dst,
+            args.fields or ["text"],
+            source=args.source,
+            target=args.target,
+            mode=args.mode,
+            workers=args.workers,
+        )
+    finally:
+        dst.flush()
+        src.detach()
+        dst.detach()
+    if args.stats:
+        _emit_field_stats(stats_by_field, args.stats)
+
+
+def _emit_stats(stats, style: str, cache: ResultCache | None = None) -> None:
+    if style == "json":
+        payload = stats.to_dict()
+        if cache is not None:
+            payload["cache"] = cache.stats.to_dict()
+        print(json.dumps(payload, indent=2), file=sys.stderr)
+    else:
+        print(_format_table(stats), file=sys.stderr)
+        if cache is not None:
+            print(_format_cache_table(cache.stats), file=sys.stderr)
+
+
 def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["audit"]:
+        _audit(argv[1:])
+        return
     parser = build_parser()
     args = parser.parse_args(argv)
+    if args.daemon:
+        serve()
+        return
+    if args.source == AUTO_SOURCE and args.format not in ("text", *MARKUPS):
+        parser.error("--from auto is only supported with --format text, markdown or html")
+    if args.cache and args.format != "text":
+        parser.error("--cache is only supported with --format text")
+
+    if args.fields and args.format not in ("jsonl", "csv"):
+        parser.error("--field is only supported with --format jsonl or csv")
+
+    if args.format in ("jsonl", "csv"):
+        _convert_records(args)
+        return
 
+    if args.format == "whisper-json":
+        stats = convert_whisper_json_stream(
+            sys.stdin, sys.stdout, source=args.source, target=args.target, mode=args.mode
+        )
+        if args.stats:
+            _emit_stats(stats, args.stats)
+        return
+
+    cache = ResultCache(args.cache, max_entries=args.cache_size) if args.cache else None
     text = sys.stdin.read()
-    if args.stats:
-        converted, stats = convert(
+    if args.format in MARKUPS:
+        result = convert_markup(
+            text,
+            args.format,
+            source=args.source,
+            target=args.target,
+            mode=args.mode,
+            return_stats=bool(args.stats),
+        )
+    elif args.workers > 1:
+        result = convert_parallel(
             text,
             source=args.source,
             target=args.target,
             mode=args.mode,
-            return_stats=True,
+            workers=args.workers,
+            return_stats=bool(args.stats),
+            cache=cache,
         )
-        if args.stats == "json":
-            print(json.dumps(stats.to_dict(), indent=2), file=sys.stderr)
-        else:
-            print(_format_table(stats), file=sys.stderr)
     else:
-        converted = convert(text, source=args.source, target=args.target, mode=args.mode)
+        result = convert(
+            text,
+            source=args.source,
+            target=args.target,
+            mode=args.mode,
+            return_stats=bool(args.stats),
+            cache=cache,
+        )
+    if cache is not None:
+        cache.close()
+    if args.stats:
+        converted, stats = result
+        _emit_stats(stats, args.stats, cache)
+    else:
+        converted = result
 
     sys.stdout.write(converted)
 
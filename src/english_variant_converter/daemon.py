@@ -0,0 +1,263 @@
+"""Warm ``evc`` daemon on a Unix domain socket, and the ``evc`` entry point.
+
+Short ``evc`` calls are dominated by interpreter start-up, imports and loading the
+tables. ``evc --daemon`` keeps one warm process listening on a socket; every other
+``evc`` call that converts buffered text from stdin first tries to hand its arguments
+and stdin to that process. It converts in-process when no daemon answers, when the
+socket is not a 0600 socket owned by the current user, and for ``audit``, ``--help``
+and the streaming formats (see ``_forwardable()``). This module is the console entry point, so
+it keeps its imports light: the conversion modules are only imported by the daemon
+itself or on fallback.
+
+Protocol (one request per connection), built from frames of a 4-byte big-endian length
+and UTF-8 payload (no ``json``: its ``re`` import alone would cost more than the call):
+the client sends a frame of NUL-separated ``version, cwd, *argv`` followed by the raw
+stdin bytes, then shuts down its write side. The daemon replies with an exit code frame
+and a stderr frame, followed by the raw stdout bytes.
+"""
+from __future__ import annotations
+
+import io
+import os
+import socket
+import stat
+import sys
+
+PROTOCOL_VERSION = "1"
+SOCKET_ENV = "EVC_SOCKET"
+DISABLE_ENV = "EVC_NO_DAEMON"
+
+
+def socket_path() -> str:
+    """``$EVC_SOCKET``, else a per-user socket in ``$XDG_RUNTIME_DIR`` or ``/tmp``."""
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    directory = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.path.join(directory, f"evc-{os.getuid()}.sock")
+
+
+def _trusted(path: str) -> bool:
+    """``True`` when ``path`` is a socket only the current user can use.
+
+    The ``/tmp`` fallback is shared: another user could bind the path first and read
+    every forwarded stdin. The daemon creates its socket with mode 0600.
+    """
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(info.st_mode)
+        and info.st_uid == os.getuid()
+        and stat.S_IMODE(info.st_mode) == 0o600
+    )
+
+
+# Input formats converted as a stream, in constant memory; forwarding would buffer the
+# whole input and output on both ends of the socket.
+STREAMING_FORMATS = ("jsonl", "csv", "whisper-json")
+
+
+def _forwardable(argv) -> bool:
+    """Whether ``evc argv`` should go to the daemon.
+
+    ``audit`` and ``--help`` never read stdin, and streaming formats must not be
+    buffered, so those run in-process.
+    """
+    if argv[:1] == ["audit"]:
+        return False
+    args = iter(argv)
+    for arg in args:
+        if arg == "--":
+            break
+        if arg == "-h" or (len(arg) > 2 and "--help".startswith(arg)):
+            return False
+        name, equals, value = arg.partition("=")
+        if len(name) > 3 and "--format".startswith(name):
+            if not equals:
+                value = next(args, "")
+            if value in STREAMING_FORMATS:
+                return False
+    return True
+
+
+def _connect(path: str):
+    if not hasattr(socket, "AF_UNIX") or not _trusted(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _frame(text: str) -> bytes:
+    data = text.encode("utf-8", "surrogateescape")
+    return len(data).to_bytes(4, "big") + data
+
+
+def _read_frame(reader) -> str:
+    size = reader.read(4)
+    data = reader.read(int.from_bytes(size, "big")) if len(size) == 4 else b""
+    if len(size) != 4 or len(data) != int.from_bytes(size, "big"):
+        raise ValueError("Truncated evc daemon message")
+    return data.decode("utf-8", "surrogateescape")
+
+
+def _exchange(sock, argv, payload: bytes):
+    sock.sendall(_frame("\0".join([PROTOCOL_VERSION, os.getcwd(), *argv])))
+    sock.sendall(payload)
+    sock.shutdown(socket.SHUT_WR)
+    with sock.makefile("rb") as reader:
+        code = int(_read_frame(reader))
+        stderr = _read_frame(reader)
+        stdout = reader.read()
+    return code, stdout, stderr
+
+
+def forward(argv, payload: bytes, path: str | None = None):
+    """Run ``evc argv`` with ``payload`` as stdin on the daemon at ``path``.
+
+    Returns ``(exit code, stdout bytes, stderr text)``, or ``None`` when no daemon is
+    listening or the socket is not the current user's own (see ``_trusted()``). Raises
+    ``OSError``/``ValueError`` if the daemon fails mid-request.
+    """
+    sock = _connect(path or socket_path())
+    if sock is None:
+        return None
+    with sock:
+        return _exchange(sock, argv, payload)
+
+
+def _run_cli(argv, payload: bytes):
+    from contextlib import redirect_stderr, redirect_stdout
+
+    from .cli import main as cli_main
+
+    # A real text layer over bytes, so formats that write to ``sys.stdout.buffer`` work.
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    stderr = io.StringIO()
+    saved_stdin = sys.stdin
+    sys.stdin = io.TextIOWrapper(io.BytesIO(payload), encoding="utf-8")
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                cli_main(argv)
+                code = 0
+            except SystemExit as exc:
+                code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+                if isinstance(exc.code, str):
+                    print(exc.code, file=sys.stderr)
+            except Exception as exc:  # report to the client, keep serving
+                print(f"evc: error: {exc}", file=sys.stderr)
+                code = 1
+    finally:
+        sys.stdin = saved_stdin
+    stdout.flush()
+    return code, stdout.buffer.getvalue(), stderr.getvalue()
+
+
+def _warm_up() -> None:
+    from . import detect, rules
+    from .exception_policies import get_exception_policies
+
+    get_exception_policies()
+    detect.detect_variant("")
+    for source in rules.SUPPORTED_VARIANTS:
+        for target in rules.SUPPORTED_VARIANTS:
+            for mode in rules.SUPPORTED_MODES:
+                rules.needs_conversion("", source, target, mode)
+
+
+def make_server(path: str | None = None):
+    """Bind a warm daemon to ``path`` (default ``socket_path()``) without serving yet.
+
+    Requests are handled one at a time: conversion holds the GIL, so threads would not
+    add throughput, and serial handling lets each request own ``sys.std*`` and the
+    working directory. Clients read their whole stdin before connecting, so a slow
+    producer upstream of one ``evc`` never stalls the others.
+    """
+    import socketserver
+
+    path = path or socket_path()
+    if _connect(path) is not None:
+        raise RuntimeError(f"An evc daemon is already listening on {path}")
+    if os.path.exists(path):
+        os.unlink(path)  # stale socket left by a daemon that did not shut down cleanly
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            version, client_cwd, *argv = _read_frame(self.rfile).split("\0")
+            payload = self.rfile.read()
+            if version != PROTOCOL_VERSION:
+                code, stdout = 1, b""
+                stderr = "evc: error: client and daemon versions differ; restart the daemon\n"
+            else:
+                cwd = os.getcwd()
+                try:
+                    os.chdir(client_cwd)
+                    code, stdout, stderr = _run_cli(argv, payload)
+                finally:
+                    os.chdir(cwd)
+            self.wfile.write(_frame(str(code)) + _frame(stderr))
+            self.wfile.write(stdout)
+
+    _warm_up()
+    previous_umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(path, Handler)
+    finally:
+        os.umask(previous_umask)
+    return server
+
+
+def serve(path: str | None = None) -> None:
+    """Run the daemon until interrupted, removing the socket on exit."""
+    import signal
+
+    path = path or socket_path()
+    server = make_server(path)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    print(f"evc daemon listening on {path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def main(argv=None) -> None:
+    """``evc`` entry point: forward to a running daemon, else convert in-process."""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    path = socket_path()
+    use_daemon = "--daemon" not in argv and not os.environ.get(DISABLE_ENV)
+    if use_daemon and _forwardable(argv) and _trusted(path):
+        # Read stdin before connecting so the daemon never waits on a slow producer.
+        payload = sys.stdin.buffer.read()
+        try:
+            result = forward(argv, payload, path)
+        except (OSError, ValueError):
+            result = None  # the daemon went away mid-request
+        if result is not None:
+            code, stdout, stderr = result
+            sys.stderr.write(stderr)
+            sys.stdout.buffer.write(stdout)
+            sys.stdout.flush()
+            sys.exit(code)
+        sys.stdin = io.TextIOWrapper(
+            io.BytesIO(payload), encoding=sys.stdin.encoding, errors=sys.stdin.errors
+        )
+
+    from .cli import main as cli_main
+
+    cli_main(argv)
+
+
+if __name__ == "__main__":
+    main()
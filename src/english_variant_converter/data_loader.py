@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import json
+import threading
 from importlib import resources
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 VARIANT_FIELDS = ("en_US", "en_GB", "en_AU", "en_CA")
 
@@ -11,21 +14,85 @@ DATA_FILES = {
     "lexical_choice": "lexical_crosswalk.csv",
 }
 
-_CACHE: Dict[str, List[dict[str, str]]] = {}
+EXCEPTIONS_FILE = ("exceptions", "spelling_exceptions.csv")
+INDEX_FILE = "crosswalk_index.json"
+# Bump whenever the way tables are derived from the CSV rows changes.
+INDEX_FORMAT = 3
+
+# Caches are filled once under ``_LOCK`` (double-checked, so warm reads never block)
+# and never mutated afterwards.
+_LOCK = threading.RLock()
+_CACHE: Dict[str, Tuple[dict[str, str], ...]] = {}
+_VERSION: Dict[str, str] = {}
+_INDEX: Dict[str, Optional[Dict[str, Any]]] = {}
+
+
+def _data_path(*parts: str):
+    path = resources.files("english_variant_converter") / "data"
+    for part in parts:
+        path = path / part
+    return path
 
 
 def _load_from_package(filename: str) -> List[dict[str, str]]:
-    data_pkg = resources.files("english_variant_converter") / "data"
-    path = data_pkg / filename
+    path = _data_path(filename)
     if not path.exists():
         return []
     with path.open("r", newline="", encoding="utf-8") as handle:
         return list(csv.DictReader(handle))
 
 
-def load_crosswalk(kind: str) -> List[dict[str, str]]:
+def load_crosswalk(kind: str) -> Tuple[dict[str, str], ...]:
     if kind not in DATA_FILES:
         raise ValueError(f"Unknown crosswalk kind '{kind}'")
-    if kind not in _CACHE:
-        _CACHE[kind] = _load_from_package(DATA_FILES[kind])
-    return _CACHE[kind]
+    rows = _CACHE.get(kind)
+    if rows is None:
+        with _LOCK:
+            rows = _CACHE.get(kind)
+            if rows is None:
+                rows = tuple(_load_from_package(DATA_FILES[kind]))
+                _CACHE[kind] = rows
+    return rows
+
+
+def data_version() -> str:
+    """Short content hash of the packaged crosswalk and exception CSVs."""
+    version = _VERSION.get("version")
+    if version is not None:
+        return version
+    with _LOCK:
+        if "version" in _VERSION:
+            return _VERSION["version"]
+        digest = hashlib.sha256()
+        files = ((DATA_FILES["spelling_only"],), (DATA_FILES["lexical_choice"],), EXCEPTIONS_FILE)
+        for parts in files:
+            path = _data_path(*parts)
+            digest.update("/".join(parts).encode("utf-8"))
+            digest.update(path.read_bytes() if path.exists() else b"")
+        _VERSION["version"] = digest.hexdigest()[:16]
+        return _VERSION["version"]
+
+
+def load_index() -> Optional[Dict[str, Any]]:
+    """Return the precompiled per-pair tables written by ``scripts/build_crosswalk.py``.
+
+    ``None`` when the index is missing or was built from different CSVs, in which case
+    callers fall back to building tables from the crosswalk rows.
+    """
+    if "index" in _INDEX:
+        return _INDEX["index"]
+    with _LOCK:
+        if "index" in _INDEX:
+            return _INDEX["index"]
+        index = None
+        path = _data_path(INDEX_FILE)
+        if path.exists():
+            with path.open("r", encoding="utf-8") as handle:
+                candidate = json.load(handle)
+            if (
+                candidate.get("format") == INDEX_FORMAT
+                and candidate.get("data_version") == data_version()
+            ):
+                index = candidate
+        _INDEX["index"] = index
+        return index
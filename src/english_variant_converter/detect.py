@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, Optional, Set, Tuple
+
+from .data_loader import load_crosswalk
+from .exception_policies import get_exception_policies
+from .rules import SUPPORTED_VARIANTS, resolve_cell
+from .tokenizer import WORD_PATTERN
+
+AUTO_SOURCE = "auto"
+DEFAULT_MARGIN = 8
+
+
+@dataclass(frozen=True)
+class VariantDetection:
+    variant: Optional[str]
+    confidence: float
+    scores: Tuple[Tuple[str, int], ...]
+    words_scanned: int
+
+    def to_dict(self) -> dict:
+        return {
+            "variant": self.variant,
+            "confidence": round(self.confidence, 4),
+            "scores": dict(self.scores),
+            "words_scanned": self.words_scanned,
+        }
+
+
+@dataclass(frozen=True)
+class _ReverseIndex:
+    marks: Mapping[str, FrozenSet[str]]  # spelling -> classes it marks
+    classes: Mapping[str, str]  # variant -> its class
+
+
+_INDEX: Dict[str, _ReverseIndex] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def _build_reverse_index() -> _ReverseIndex:
+    """Map each spelling to the variants it marks.
+
+    A spelling marks a variant when the same crosswalk row spells that word differently
+    in another variant; blank en_AU/en_CA cells are resolved through their fallbacks
+    first (``rules.resolve_cell()``). Words covered by exception policies (``check``,
+    ``practice``, ...) are valid in several variants and carry no signal, so they are
+    left out. Variants that no word tells apart (en_AU spells every crosswalk word as
+    en_GB does) share a class, named after the earlier of them in ``SUPPORTED_VARIANTS``,
+    and words are indexed by class.
+    """
+    ambiguous = get_exception_policies().listed_words()
+    marks: Dict[str, Set[str]] = {}
+    for row in load_crosswalk("spelling_only"):
+        spellings = {variant: resolve_cell(row, variant).lower() for variant in SUPPORTED_VARIANTS}
+        spellings = {variant: word for variant, word in spellings.items() if word}
+        if len(set(spellings.values())) < 2:
+            continue
+        for variant, word in spellings.items():
+            if word not in ambiguous:
+                marks.setdefault(word, set()).add(variant)
+
+    signatures: Dict[str, Set[str]] = {variant: set() for variant in SUPPORTED_VARIANTS}
+    for word, variants in marks.items():
+        for variant in variants:
+            signatures[variant].add(word)
+    classes: Dict[str, str] = {}
+    for variant in SUPPORTED_VARIANTS:
+        classes[variant] = next(
+            (
+                earlier
+                for earlier in classes.values()
+                if signatures[earlier] == signatures[variant]
+            ),
+            variant,
+        )
+    class_count = len(set(classes.values()))
+    by_class = {
+        word: frozenset(classes[variant] for variant in variants)
+        for word, variants in marks.items()
+    }
+    return _ReverseIndex(
+        MappingProxyType(
+            {word: variants for word, variants in by_class.items() if len(variants) < class_count}
+        ),
+        MappingProxyType(classes),
+    )
+
+
+def _reverse_index() -> _ReverseIndex:
+    index = _INDEX.get("spelling_only")
+    if index is None:
+        with _INDEX_LOCK:
+            index = _INDEX.get("spelling_only")
+            if index is None:
+                index = _INDEX["spelling_only"] = _build_reverse_index()
+    return index
+
+
+def detect_variant(text: str, *, margin: int = DEFAULT_MARGIN) -> VariantDetection:
+    """Guess which spelling variant ``text`` is written in, in one pass over its words.
+
+    Every word that marks a variant adds a point to it; scanning stops as soon as the
+    leader is ``margin`` points ahead of every variant it can be told apart from.
+    ``confidence`` is the leader's smoothed share against the runner-up. Ties go to the
+    earlier entry of ``SUPPORTED_VARIANTS``, as do variants that share every spelling
+    (en_AU text is reported as en_GB, with equal scores); ``variant`` is ``None`` when no
+    word carried any signal.
+    """
+    index = _reverse_index()
+    marks = index.marks
+    class_scores = dict.fromkeys(dict.fromkeys(index.classes.values()), 0)
+    words_scanned = 0
+    for match in WORD_PATTERN.finditer(text):
+        words_scanned += 1
+        variants = marks.get(match.group().lower())
+        if not variants:
+            continue
+        for variant in variants:
+            class_scores[variant] += 1
+        ranked = sorted(class_scores.values(), reverse=True)
+        if ranked[0] - ranked[1] >= margin:
+            break
+
+    scores = tuple(
+        (variant, class_scores[index.classes[variant]]) for variant in SUPPORTED_VARIANTS
+    )
+    ranked_classes = sorted(class_scores, key=lambda variant: -class_scores[variant])
+    best, runner_up = ranked_classes[0], ranked_classes[1]
+    if class_scores[best] == 0:
+        return VariantDetection(None, 0.0, scores, words_scanned)
+    confidence = (class_scores[best] + 1) / (class_scores[best] + class_scores[runner_up] + 2)
+    return VariantDetection(best, confidence, scores, words_scanned)
+
+
+def resolve_source(
+    text: str, source: str, target: str
+) -> Tuple[str, Optional[VariantDetection]]:
+    """Replace ``source="auto"`` with the detected variant (the target when undecided)."""
+    if source != AUTO_SOURCE:
+        return source, None
+    detection = detect_variant(text)
+    return detection.variant or target, detection
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import csv
+import threading
 from dataclasses import dataclass
 from importlib import resources
-from typing import Dict, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, Optional, Set, Tuple
 
 
 @dataclass(frozen=True)
@@ -14,11 +16,19 @@ class ExceptionPolicyResult:
 
 class ExceptionPolicies:
     def __init__(self) -> None:
-        self._skip_pairs: Set[Tuple[str, str]] = set()
-        self._conditional_pairs: Dict[Tuple[str, str], str] = {}
-        self._load()
+        skip_pairs: Set[Tuple[str, str]] = set()
+        conditional_pairs: Dict[Tuple[str, str], str] = {}
+        self._load(skip_pairs, conditional_pairs)
+        # Frozen after load so a shared instance is safe to read from any thread.
+        self._skip_pairs: FrozenSet[Tuple[str, str]] = frozenset(skip_pairs)
+        self._conditional_pairs: Mapping[Tuple[str, str], str] = MappingProxyType(
+            conditional_pairs
+        )
 
-    def _load(self) -> None:
+    @staticmethod
+    def _load(
+        skip_pairs: Set[Tuple[str, str]], conditional_pairs: Dict[Tuple[str, str], str]
+    ) -> None:
         try:
             base = resources.files("english_variant_converter") / "data" / "exceptions"
             path = base / "spelling_exceptions.csv"
@@ -32,10 +42,10 @@ class ExceptionPolicies:
                     policy = (row.get("policy") or "").strip().lower()
                     key = (us, gb)
                     if policy == "skip":
-                        self._skip_pairs.add(key)
+                        skip_pairs.add(key)
                     elif policy.startswith("conditional:"):
                         rule = policy.split(":", 1)[1]
-                        self._conditional_pairs[key] = rule
+                        conditional_pairs[key] = rule
         except FileNotFoundError:
             return
 
@@ -53,6 +63,14 @@ class ExceptionPolicies:
             return ExceptionPolicyResult(action="conditional", value=rule)
         return ExceptionPolicyResult(action="")
 
+    def listed_words(self) -> FrozenSet[str]:
+        """Every word that appears in a skip or conditional pair."""
+        words = set()
+        for first, second in (*self._skip_pairs, *self._conditional_pairs):
+            words.add(first)
+            words.add(second)
+        return frozenset(words)
+
     def allow_conditional(
         self, rule: str, prev_word: Optional[str], next_word: Optional[str]
     ) -> bool:
@@ -110,4 +128,24 @@ class ExceptionPolicies:
         return False
 
 
-exception_policies = ExceptionPolicies()
+_INSTANCE: Optional[ExceptionPolicies] = None
+_LOCK = threading.Lock()
+
+
+def get_exception_policies() -> ExceptionPolicies:
+    """Return the shared policies, loading the CSV exactly once on first use."""
+    global _INSTANCE
+    instance = _INSTANCE
+    if instance is None:
+        with _LOCK:
+            instance = _INSTANCE
+            if instance is None:
+                instance = _INSTANCE = ExceptionPolicies()
+    return instance
+
+
+def __getattr__(name: str):
+    # ``exception_policies`` used to be created at import time; keep the name working.
+    if name == "exception_policies":
+        return get_exception_policies()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import bisect
+import re
+from typing import List, Tuple, Union
+
+from . import rules
+from .api import Edit, _convert_internal, _unchanged_stats, apply_edits
+from .detect import resolve_source
+from .overlays import Overlay, resolve_overlay
+
+MARKUPS = ("markdown", "html")
+
+# An element whose content is code, not prose; its tags are matched case-insensitively.
+_RAW_ELEMENT = r"""
+    (?i:<(?P<raw>script|style|pre|code|kbd|samp|textarea)\b
+        (?:"[^"]*"|'[^']*'|[^'">])*>[\s\S]*?</(?P=raw)\s*>)
+"""
+
+_MARKDOWN_SKIP = re.compile(
+    r"""
+      ^[ ]{0,3}(?P<fence>`{3,}|~{3,})[^\n]*\n            # fenced code block ...
+        (?:[\s\S]*?^[ ]{0,3}(?P=fence)[ \t]*$|[\s\S]*)   # ... up to its closing fence
+    | (?:\A|^[ \t]*\n)(?:[ ]{4}|\t)[^\n]*               # indented code block after a blank
+        (?:\n(?:[ \t]*\n)*(?:[ ]{4}|\t)[^\n]*)*         # line (so indented list text too)
+    | (?P<ticks>`+)[\s\S]*?(?<!`)(?P=ticks)(?!`)         # inline code
+    |"""
+    + _RAW_ELEMENT
+    + r"""                                                 # raw HTML element
+    | ^[ ]{0,3}\#{1,6}(?=[ \t]|$)                        # ATX heading marker (not a hashtag)
+    | <!--[\s\S]*?-->                                    # HTML comment
+    | <[A-Za-z/!?](?:"[^"]*"|'[^']*'|[^'">])*>           # raw HTML tag or autolink
+    | \]\([^)\s]*(?:[ ]+"[^"]*")?\)                      # link destination and title
+    | ^[ ]{0,3}\[[^\]\n]+\]:[^\n]*                       # link reference definition
+    | (?:https?|ftp)://[^\s)<>]+ | www\.[^\s)<>]+        # bare URL
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+_HTML_SKIP = re.compile(
+    r"""
+      <!--[\s\S]*?-->                                    # comment
+    |"""
+    + _RAW_ELEMENT
+    + r"""                                                 # element whose content is not prose
+    | <[A-Za-z/!?](?:"[^"]*"|'[^']*'|[^'">])*>           # tag, with its attributes
+    | &(?:[A-Za-z][A-Za-z0-9]*|\#[0-9]+|\#[xX][0-9A-Fa-f]+);  # character reference
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+_PATTERNS = {"markdown": _MARKDOWN_SKIP, "html": _HTML_SKIP}
+
+# Joins prose spans into one conversion window. Whitespace keeps words on either side of
+# a skipped span apart without hiding them from each other's prev/next word context.
+_SEPARATOR = "\n"
+
+
+def prose_spans(text: str, markup: str) -> List[Tuple[int, int]]:
+    """``(start, end)`` spans of ``text`` that are prose, found in one regex scan."""
+    try:
+        pattern = _PATTERNS[markup]
+    except KeyError:
+        raise ValueError(f"Unsupported markup '{markup}'") from None
+    spans = []
+    cursor = 0
+    for match in pattern.finditer(text):
+        if match.start() > cursor:
+            spans.append((cursor, match.start()))
+        cursor = max(cursor, match.end())
+    if cursor < len(text):
+        spans.append((cursor, len(text)))
+    return spans
+
+
+def convert_markup(
+    text: str,
+    markup: str = "markdown",
+    source: str = "en_US",
+    target: str = "en_GB",
+    mode: str = "spelling_only",
+    *,
+    return_stats: bool = False,
+    return_edits: bool = False,
+    overlay: Union[Overlay, str, None] = None,
+):
+    """Convert the prose of a Markdown or HTML document, leaving markup untouched.
+
+    Code blocks, inline code, code-like elements (``<code>``, ``<pre>``, ``<script>``,
+    ...), tags (with their attributes), comments, link destinations and URLs are
+    skipped without being tokenized. The remaining prose spans are joined
+    into a single window and converted in one pass, so words keep their neighbours
+    across skipped spans as prev/next context. Returns like ``convert()``; edit offsets
+    refer to ``text``.
+    """
+    spans = prose_spans(text, markup)
+    window = _SEPARATOR.join(text[start:end] for start, end in spans)
+    source, detection = resolve_source(window, source, target)
+    overlay = resolve_overlay(overlay)
+    edits: List[Edit] = []
+    if not rules.needs_conversion(window, source, target, mode, overlay):
+        converted = text
+        stats = _unchanged_stats(window) if return_stats else None
+    else:
+        _, stats = _convert_internal(
+            window,
+            source=source,
+            target=target,
+            mode=mode,
+            edits=edits,
+            build_text=False,
+            overlay=overlay,
+        )
+        edits = _to_document(edits, spans)
+        converted = apply_edits(text, edits)
+    if stats is not None and detection is not None:
+        stats.detection = detection
+
+    if not (return_stats or return_edits):
+        return converted
+    result: tuple = (converted,)
+    if return_stats:
+        result += (stats,)
+    if return_edits:
+        result += (edits,)
+    return result
+
+
+def _to_document(edits: List[Edit], spans: List[Tuple[int, int]]) -> List[Edit]:
+    """Shift window offsets back to document offsets (words never straddle spans)."""
+    window_starts: List[int] = []
+    offset = 0
+    for start, end in spans:
+        window_starts.append(offset)
+        offset += end - start + len(_SEPARATOR)
+    shifted = []
+    for edit in edits:
+        idx = bisect.bisect_right(window_starts, edit.start) - 1
+        shift = spans[idx][0] - window_starts[idx]
+        shifted.append(edit._replace(start=edit.start + shift, end=edit.end + shift))
+    return shifted
@@ -0,0 +1,290 @@
+"""Suffix-rule morphology: lemma stems plus inflection rules instead of every inflected form.
+
+Most of the spelling crosswalk is one alternation repeated across a paradigm:
+``colorize``/``colorized``/``colorizes``/``colorizing``/``colorization``... all swap
+``-iz-`` for ``-is-``. ``factor_table()`` splits a flat ``source → target`` table into the
+entries no rule explains (the residual) and, per suffix family, the stems it was seen
+with. ``SuffixTable`` answers lookups from the residual first, then from the rule
+endings of the word, longest first.
+
+Families are *closed* (only stems seen in the crosswalk inflect, so ``academic`` is never
+read as ``-emic``) or, in one direction, *open*: any stem of at least ``MIN_STEM``
+letters outside the family's deny list inflects, which is how unseen coinages such as
+``tokenize`` convert; a listed sibling lends it any stem change (``colorize →
+colourise`` makes ``colorizable`` ``colourisable``). Rule keys in the index are
+``"<family>>"`` for the family's own direction (American-style ending → British-style)
+and ``"<family><"`` for the reverse.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+# Rules only inflect stems at least this long: ``size``, ``prize``, ``seize``.
+MIN_STEM = 3
+# A family is only used for a pair when it explains at least this many table entries...
+MIN_FAMILY_ENTRIES = 5
+# ... and a closed family only learns a stem seen in at least this many of them.
+MIN_STEM_ENTRIES = 2
+# Possessives map through their base word: ``color's`` → ``colour's``.
+POSSESSIVE = "'s"
+
+# Stems, or ``None`` for an open rule, per rule key.
+Rules = Mapping[str, Optional[Iterable[str]]]
+
+
+@dataclass(frozen=True)
+class SuffixFamily:
+    name: str
+    suffixes: Tuple[Tuple[str, str], ...]  # (American-style ending, British-style ending)
+    open_forward: bool = False
+    open_reverse: bool = False
+    deny: FrozenSet[str] = frozenset()  # stems an open rule never inflects
+
+
+def _paradigm(american: str, british: str, endings: Iterable[str]) -> Tuple[Tuple[str, str], ...]:
+    return tuple((american + ending, british + ending) for ending in endings)
+
+
+FAMILIES: Tuple[SuffixFamily, ...] = (
+    SuffixFamily(
+        "ize",
+        _paradigm(
+            "iz", "is", ("e", "es", "ed", "ing", "er", "ers", "ation", "ations", "able")
+        ),
+        open_forward=True,
+        # ``-size`` compounds and words that merely end in ``ize``.
+        deny=frozenset(
+            {
+                "ass", "bel", "bites", "caps", "downs", "fulls", "kings", "lifes", "mids",
+                "outs", "overs", "pints", "res", "supers", "unders", "ups", "wides",
+            }
+        ),
+    ),
+    SuffixFamily(
+        "yze",
+        _paradigm("yz", "ys", ("e", "es", "ed", "ing", "er", "ers", "able")),
+        open_forward=True,
+    ),
+    SuffixFamily(
+        "our",
+        _paradigm(
+            "or",
+            "our",
+            (
+                "", "s", "ed", "ing", "ings", "er", "ers", "ful", "fully", "less",
+                "able", "ably", "ite", "ites", "ist", "ists",
+            ),
+        ),
+    ),
+    SuffixFamily(
+        "re",
+        (("er", "re"), ("ers", "res"), ("ered", "red"), ("ering", "ring")),
+    ),
+    SuffixFamily("ll", _paradigm("l", "ll", ("ed", "ing", "ings", "er", "ers"))),
+    SuffixFamily("aemia", _paradigm("emi", "aemi", ("a", "as", "c"))),
+    SuffixFamily(
+        "rrhoea",
+        _paradigm("rrhe", "rrhoe", ("a", "as", "al", "ic")),
+        open_forward=True,
+        open_reverse=True,
+    ),
+    SuffixFamily("dgement", _paradigm("dgment", "dgement", ("", "s")), open_forward=True),
+)
+
+_FAMILIES = {family.name: family for family in FAMILIES}
+
+
+def rule_keys() -> Tuple[str, ...]:
+    return tuple(family.name + arrow for family in FAMILIES for arrow in (">", "<"))
+
+
+def _parse_key(key: str) -> Tuple[SuffixFamily, bool]:
+    try:
+        return _FAMILIES[key[:-1]], key.endswith(">")
+    except KeyError:
+        raise ValueError(f"Unknown morphology rule '{key}'") from None
+
+
+def _oriented(family: SuffixFamily, forward: bool) -> Tuple[Tuple[str, str], ...]:
+    return family.suffixes if forward else tuple((b, a) for a, b in family.suffixes)
+
+
+def _is_open(family: SuffixFamily, forward: bool) -> bool:
+    return family.open_forward if forward else family.open_reverse
+
+
+class SuffixTable:
+    """Read-only ``source → target`` lookup: residual entries, then suffix rules.
+
+    Not a ``Mapping``: open rules accept words nobody enumerated, and closed rules are
+    never expanded into entries. Rule endings are bucketed by their last two letters, so
+    most words cost one extra dict lookup; nothing is memoized, so a published table is
+    never written to.
+    """
+
+    __slots__ = ("entries", "rules", "_entries", "_endings")
+
+    def __init__(
+        self,
+        entries: Mapping[str, str] = MappingProxyType({}),
+        rules: Rules = MappingProxyType({}),
+    ) -> None:
+        self._entries = dict(entries)
+        self.entries: Mapping[str, str] = MappingProxyType(self._entries)
+        self.rules: Mapping[str, Optional[FrozenSet[str]]] = MappingProxyType(
+            {key: None if stems is None else frozenset(stems) for key, stems in rules.items()}
+        )
+        by_ending: Dict[str, list] = {}
+        for key, stems in self.rules.items():
+            family, forward = _parse_key(key)
+            deny = family.deny if forward else frozenset()
+            paradigm = _oriented(family, forward)
+            for source, target in paradigm:
+                by_ending.setdefault(source, []).append((target, stems, deny, key, paradigm))
+        # last two letters -> ``(ending, length, rules)``, longest ending first; every
+        # family ending is at least two letters long.
+        endings: Dict[str, list] = {}
+        for ending in sorted(by_ending, key=len, reverse=True):
+            endings.setdefault(ending[-2:], []).append(
+                (ending, len(ending), tuple(by_ending[ending]))
+            )
+        if endings:
+            endings[POSSESSIVE] = []
+        self._endings: Mapping[str, Tuple[Tuple[str, int, tuple], ...]] = {
+            tail: tuple(candidates) for tail, candidates in endings.items()
+        }
+
+    def get(self, word: str, default: Optional[str] = None) -> Optional[str]:
+        replacement = self._entries.get(word)
+        if replacement is not None:
+            return replacement
+        candidates = self._endings.get(word[-2:])
+        if candidates is None:
+            return default
+        replacement = self._derive(word, candidates)
+        return default if replacement is None else replacement
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.get(word) is not None
+
+    def maps_any(self, words: Iterable[str]) -> bool:
+        """``True`` when any of the lowercase ``words`` has a mapping."""
+        if not self._endings:
+            return not self._entries.keys().isdisjoint(words)
+        words = set(words)
+        if not self._entries.keys().isdisjoint(words):
+            return True
+        endings = self._endings
+        for word in words:
+            candidates = endings.get(word[-2:])
+            if candidates is not None and self._derive(word, candidates) is not None:
+                return True
+        return False
+
+    def _matches(self, word: str) -> List[Tuple[int, tuple]]:
+        """``(ending length, rules)`` for each rule ending of ``word``, longest first."""
+        return [
+            (size, rules)
+            for ending, size, rules in self._endings.get(word[-2:], ())
+            if word.endswith(ending)
+        ]
+
+    def _derive(self, word: str, candidates: Tuple[Tuple[str, int, tuple], ...]) -> Optional[str]:
+        """Replacement from the rules whose endings share ``word``'s last two letters."""
+        if not candidates:  # a possessive
+            base = self.get(word[: -len(POSSESSIVE)])
+            return None if base is None else base + POSSESSIVE
+        for ending, size, rules in candidates:
+            if not word.endswith(ending):
+                continue
+            stem = word[:-size]
+            for target, stems, deny, _, paradigm in rules:
+                if stems is None:
+                    if len(stem) >= MIN_STEM and stem not in deny:
+                        return self._sibling_stem(stem, paradigm) + target
+                elif stem in stems:
+                    return stem + target
+        return None
+
+    def _sibling_stem(self, stem: str, paradigm: Tuple[Tuple[str, str], ...]) -> str:
+        """Target-side stem from a listed paradigm sibling, else ``stem`` unchanged.
+
+        Lets an open rule carry a stem change it cannot express itself: with
+        ``colorize → colourise`` listed, ``colorizing`` becomes ``colourising``.
+        """
+        for before, after in paradigm:
+            mapped = self._entries.get(stem + before)
+            if mapped is not None and mapped.endswith(after):
+                return mapped[: len(mapped) - len(after)]
+        return stem
+
+
+def factor_table(table: Mapping[str, str]) -> Tuple[Dict[str, str], Dict[str, Optional[List[str]]]]:
+    """Split ``table`` into ``(residual entries, rules)`` that look up exactly like it.
+
+    A family direction is kept when it explains at least ``MIN_FAMILY_ENTRIES`` entries;
+    closed rules record the stems seen in at least ``MIN_STEM_ENTRIES`` of them, open
+    rules ``None``. Every entry the rules do not reproduce stays in the residual, except
+    possessives whose base word already maps the same way.
+    """
+    probe = SuffixTable(rules={key: None for key in rule_keys()})
+    seen: Dict[str, set] = {}
+    for source, target in table.items():
+        if source.endswith(POSSESSIVE) and target.endswith(POSSESSIVE):
+            source, target = source[: -len(POSSESSIVE)], target[: -len(POSSESSIVE)]
+        for key, stem in _explanations(probe, source, target):
+            seen.setdefault(key, set()).add((stem, source))
+    rules: Dict[str, Optional[List[str]]] = {}
+    for key, explained in seen.items():
+        if len(explained) < MIN_FAMILY_ENTRIES:
+            continue
+        family, forward = _parse_key(key)
+        if _is_open(family, forward):
+            rules[key] = None
+            continue
+        counts = Counter(stem for stem, _ in explained)
+        rules[key] = sorted(
+            stem
+            for stem, count in counts.items()
+            if count >= MIN_STEM_ENTRIES and len(stem) >= MIN_STEM
+        )
+    # Shortest words first, so a paradigm keeps its lemma and the siblings an open rule
+    # derives from it drop out.
+    probe = SuffixTable(rules=rules)
+    kept = probe._entries
+    for source, target in sorted(table.items(), key=lambda item: (len(item[0]), item[0])):
+        if source.endswith(POSSESSIVE) or probe.get(source) != target:
+            kept[source] = target
+    # A lemma kept later can change what an earlier sibling derives from; keep those too.
+    while True:
+        compiled = SuffixTable(
+            {source: target for source, target in kept.items() if not source.endswith(POSSESSIVE)},
+            rules,
+        )
+        missing = {
+            source: target
+            for source, target in table.items()
+            if source not in kept and compiled.get(source) != target
+        }
+        if not missing:
+            break
+        kept.update(missing)
+    residual = {
+        source: target
+        for source, target in table.items()
+        if source in kept and (not source.endswith(POSSESSIVE) or compiled.get(source) != target)
+    }
+    return residual, rules
+
+
+def _explanations(probe: SuffixTable, source: str, target: str) -> List[Tuple[str, str]]:
+    """``(rule key, stem)`` for every family direction that turns ``source`` into ``target``."""
+    found = []
+    for depth, rules in probe._matches(source):
+        stem = source[:-depth]
+        if stem:
+            found.extend((key, stem) for after, _, _, key, _ in rules if stem + after == target)
+    return found
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple, Union
+
+from .data_loader import VARIANT_FIELDS
+from .rules import SUPPORTED_MODES, build_table, resolve_cell
+
+_KINDS = ("spelling_only", "lexical_choice")
+
+
+class Overlay:
+    """A compiled per-tenant dictionary layered over the shared crosswalk tables.
+
+    Built from a spec with three optional keys:
+
+    - ``additions``: crosswalk-style rows (``{"en_US": ..., "en_GB": ..., "type": ...}``);
+      ``type`` defaults to ``spelling_only``, ``lexical_choice`` rows only apply in
+      ``spelling_and_lexical`` mode.
+    - ``removals``: words that are never converted, whatever the base tables say.
+    - ``skip_pairs``: ``[word, word]`` pairs blocked in both directions, like a ``skip``
+      exception policy.
+
+    Lookups consult the overlay first and fall through to the base tables, which are
+    never copied.
+    """
+
+    __slots__ = ("overlay_id", "version", "_layers", "_removals", "_skip_pairs", "_spec")
+
+    def __init__(self, overlay_id: str, spec: Mapping[str, Any]) -> None:
+        self.overlay_id = overlay_id
+        canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+        self.version = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+        self._spec = spec
+
+        rows_by_kind: Dict[str, list] = {kind: [] for kind in _KINDS}
+        additions = spec.get("additions", ())
+        for row in additions:
+            kind = row.get("type") or "spelling_only"
+            if kind not in rows_by_kind:
+                raise ValueError(f"Unknown overlay addition type '{kind}'")
+            rows_by_kind[kind].append(row)
+
+        # One tuple of tables per (source, target, mode); lexical entries win over
+        # spelling ones, mirroring how the base tables are merged.
+        layers: Dict[Tuple[str, str, str], Tuple[Mapping[str, str], ...]] = {}
+        present = [
+            field for field in VARIANT_FIELDS if any(resolve_cell(row, field) for row in additions)
+        ]
+        for source in present:
+            for target in present:
+                if source == target:
+                    continue
+                spelling = build_table(rows_by_kind["spelling_only"], source, target)
+                lexical = build_table(rows_by_kind["lexical_choice"], source, target)
+                for mode in SUPPORTED_MODES:
+                    tables = [lexical] if mode == "spelling_and_lexical" else []
+                    tables.append(spelling)
+                    tables = [MappingProxyType(table) for table in tables if table]
+                    if tables:
+                        layers[(source, target, mode)] = tuple(tables)
+        self._layers = MappingProxyType(layers)
+        self._removals: FrozenSet[str] = frozenset(
+            word.strip().lower() for word in spec.get("removals", ()) if word.strip()
+        )
+        skip_pairs = set()
+        for first, second in spec.get("skip_pairs", ()):
+            pair = (first.strip().lower(), second.strip().lower())
+            skip_pairs.add(pair)
+            skip_pairs.add((pair[1], pair[0]))
+        self._skip_pairs: FrozenSet[Tuple[str, str]] = frozenset(skip_pairs)
+
+    def __reduce__(self):
+        return (Overlay, (self.overlay_id, self._spec))
+
+    def __repr__(self) -> str:
+        return f"Overlay({self.overlay_id!r}, version={self.version!r})"
+
+    def lookup(self, word: str, source: str, target: str, mode: str) -> Optional[str]:
+        """Overlay replacement for lowercase ``word``; ``""`` means "removed, keep as is"."""
+        if word in self._removals:
+            return ""
+        for table in self._layers.get((source, target, mode), ()):
+            replacement = table.get(word)
+            if replacement:
+                return replacement
+        return None
+
+    def layers(self, source: str, target: str, mode: str) -> Tuple[Mapping[str, str], ...]:
+        return self._layers.get((source, target, mode), ())
+
+    def is_skipped(self, original: str, candidate: str) -> bool:
+        return (original.lower(), candidate.lower()) in self._skip_pairs
+
+
+_REGISTRY: Dict[str, Overlay] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def register_overlay(overlay_id: str, spec: Mapping[str, Any]) -> Overlay:
+    """Compile ``spec`` and publish it under ``overlay_id``, replacing any previous one.
+
+    Re-registering an id is how overlays are hot-reloaded: conversions already running
+    keep the overlay they resolved, new ones pick up the replacement.
+    """
+    overlay = Overlay(overlay_id, spec)
+    with _REGISTRY_LOCK:
+        _REGISTRY[overlay_id] = overlay
+    return overlay
+
+
+def unregister_overlay(overlay_id: str) -> None:
+    with _REGISTRY_LOCK:
+        _REGISTRY.pop(overlay_id, None)
+
+
+def get_overlay(overlay_id: str) -> Overlay:
+    try:
+        return _REGISTRY[overlay_id]
+    except KeyError:
+        raise ValueError(f"Unknown overlay '{overlay_id}'") from None
+
+
+def resolve_overlay(overlay: Union[Overlay, str, None]) -> Optional[Overlay]:
+    if overlay is None or isinstance(overlay, Overlay):
+        return overlay
+    return get_overlay(overlay)
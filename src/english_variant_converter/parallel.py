@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple, Union
+
+from . import rules
+from .api import ConversionStats, _convert_window, _stats_from_dict, convert, merge_stats
+from .cache import ResultCache
+from .detect import VariantDetection, resolve_source
+from .overlays import Overlay, resolve_overlay
+
+DEFAULT_SHARD_SIZE = 1 << 20
+_WHITESPACE = re.compile(r"\s")
+_LETTERS = re.compile(r"[A-Za-z]+")
+
+
+def _is_letter(char: str) -> bool:
+    return ("a" <= char <= "z") or ("A" <= char <= "Z")
+
+
+def _split_points(text: str, shard_size: int) -> List[int]:
+    """Shard boundaries, each just after a whitespace character (never inside a word)."""
+    points = [0]
+    while True:
+        match = _WHITESPACE.search(text, points[-1] + shard_size)
+        if match is None or match.end() >= len(text):
+            break
+        points.append(match.end())
+    points.append(len(text))
+    return points
+
+
+def _context_start(text: str, pos: int) -> int:
+    """Start of the last complete ASCII word before ``pos``.
+
+    Everything from there on tokenizes exactly as it does in the full text, so the
+    shard sees the same previous word and neighbouring chunks as a serial pass.
+    """
+    idx = pos
+    while idx > 0 and not _is_letter(text[idx - 1]):
+        idx -= 1
+    while idx > 0 and _is_letter(text[idx - 1]):
+        idx -= 1
+    return idx
+
+
+def _context_end(text: str, pos: int) -> int:
+    """End of the first complete ASCII word at or after ``pos``."""
+    match = _LETTERS.search(text, pos)
+    return match.end() if match else len(text)
+
+
+def _iter_shards(text: str, shard_size: int) -> Iterator[Tuple[str, str, str]]:
+    points = _split_points(text, shard_size)
+    for start, end in zip(points, points[1:]):
+        before = text[_context_start(text, start) : start]
+        after = text[end : _context_end(text, end)]
+        yield before, text[start:end], after
+
+
+def _convert_shard(
+    shard: Tuple[str, str, str], source: str, target: str, mode: str, overlay: Optional[Overlay]
+) -> Tuple[str, ConversionStats]:
+    before, body, after = shard
+    return _convert_window(
+        body, before, after, source=source, target=target, mode=mode, overlay=overlay
+    )
+
+
+def _convert_shard_args(args) -> Tuple[str, ConversionStats]:
+    return _convert_shard(*args)
+
+
+def _result(
+    converted: str,
+    stats: ConversionStats,
+    detection: Optional[VariantDetection],
+    return_stats: bool,
+):
+    if not return_stats:
+        return converted
+    stats.detection = detection
+    return converted, stats
+
+
+def convert_parallel(
+    text: str,
+    source: str = "en_US",
+    target: str = "en_GB",
+    mode: str = "spelling_only",
+    *,
+    workers: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    return_stats: bool = False,
+    overlay: Union[Overlay, str, None] = None,
+    cache: Optional[ResultCache] = None,
+):
+    """Convert one large document by sharding it across worker processes.
+
+    Shards are cut after whitespace and carry one word of context on each side, so the
+    result (and stats) are identical to ``convert()`` on the whole text. ``source="auto"``
+    is detected once on the whole document before sharding.
+    """
+    source, detection = resolve_source(text, source, target)
+    rules.validate(source, target, mode)
+    if shard_size <= 0:
+        raise ValueError("shard_size must be positive")
+    overlay = resolve_overlay(overlay)
+    workers = workers or os.cpu_count() or 1
+    if len(text) <= shard_size or not rules.needs_conversion(text, source, target, mode, overlay):
+        result = convert(
+            text,
+            source=source,
+            target=target,
+            mode=mode,
+            return_stats=return_stats,
+            overlay=overlay,
+            cache=cache,
+        )
+        if return_stats:
+            result[1].detection = detection
+        return result
+
+    key = None
+    if cache is not None:
+        key = cache.key(text, source, target, mode, overlay.version if overlay else "")
+        hit = cache.get(key)
+        if hit is not None:
+            converted, stats = hit[0], _stats_from_dict(hit[1])
+            return _result(converted, stats, detection, return_stats)
+
+    started = time.perf_counter()
+    jobs = ((shard, source, target, mode, overlay) for shard in _iter_shards(text, shard_size))
+    if workers == 1:
+        results = [_convert_shard_args(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_convert_shard_args, jobs))
+
+    converted = "".join(chunk for chunk, _ in results)
+    stats = merge_stats(stats for _, stats in results)
+    if cache is not None:
+        cache.put(key, converted, stats.to_dict(), None, time.perf_counter() - started)
+    return _result(converted, stats, detection, return_stats)
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import json
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from . import rules
+from .api import ConversionStats, convert, merge_stats
+from .overlays import Overlay, resolve_overlay
+
+DEFAULT_BATCH_SIZE = 1000
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+# (first record number, raw records) -> (converted records, stats per field)
+Batch = Tuple[int, List[str]]
+BatchResult = Tuple[List[str], Dict[str, ConversionStats]]
+
+
+def _convert_value(
+    value: str, field: str, collected: Dict[str, List[ConversionStats]], options: dict
+) -> str:
+    converted, stats = convert(value, return_stats=True, **options)
+    collected.setdefault(field, []).append(stats)
+    return converted
+
+
+def _json_field_spans(line: str, fields: Sequence[str]) -> List[Tuple[str, int, int, object]]:
+    """``(field, start, end, value)`` for the selected top-level members of a JSON object."""
+    pos = _WHITESPACE.match(line).end()
+    if line[pos : pos + 1] != "{":
+        raise ValueError("Expected a JSON object")
+    pos = _WHITESPACE.match(line, pos + 1).end()
+    spans = []
+    if line[pos : pos + 1] == "}":
+        pos += 1
+    else:
+        while True:
+            key, pos = _DECODER.raw_decode(line, _WHITESPACE.match(line, pos).end())
+            if not isinstance(key, str):
+                raise ValueError("Expected a string key in JSON object")
+            pos = _WHITESPACE.match(line, pos).end()
+            if line[pos : pos + 1] != ":":
+                raise ValueError("Expected ':' in JSON object")
+            start = _WHITESPACE.match(line, pos + 1).end()
+            value, pos = _DECODER.raw_decode(line, start)
+            if key in fields:
+                spans.append((key, start, pos, value))
+            pos = _WHITESPACE.match(line, pos).end()
+            separator = line[pos : pos + 1]
+            pos += 1
+            if separator == "}":
+                break
+            if separator != ",":
+                raise ValueError("Expected ',' or '}' in JSON object")
+    if _WHITESPACE.match(line, pos).end() != len(line):
+        raise ValueError("Unexpected data after JSON object")
+    return spans
+
+
+def _convert_jsonl_batch(batch: Batch, fields: Sequence[str], options: dict) -> BatchResult:
+    first, lines = batch
+    collected: Dict[str, List[ConversionStats]] = {}
+    output = []
+    for number, line in enumerate(lines, first):
+        if not line.strip():
+            output.append(line)
+            continue
+        try:
+            spans = _json_field_spans(line, fields)
+        except ValueError as exc:
+            raise ValueError(f"Line {number}: {exc}") from None
+        chunks = []
+        cursor = 0
+        for field, start, end, value in spans:
+            if not isinstance(value, str):
+                continue
+            converted = _convert_value(value, field, collected, options)
+            if converted == value:
+                continue
+            # Keep the field's escaping style: \uXXXX escapes stay escaped.
+            ensure_ascii = "\\u" in line[start:end]
+            chunks.append(line[cursor:start])
+            chunks.append(json.dumps(converted, ensure_ascii=ensure_ascii))
+            cursor = end
+        if chunks:
+            chunks.append(line[cursor:])
+            line = "".join(chunks)
+        output.append(line)
+    return output, {field: merge_stats(stats) for field, stats in collected.items()}
+
+
+def _csv_field_pattern(delimiter: str) -> "re.Pattern[str]":
+    escaped = re.escape(delimiter)
+    return re.compile(rf'"(?:[^"]|"")*"|[^{escaped}"\r\n]*')
+
+
+def _csv_field_spans(
+    record: str, pattern: "re.Pattern[str]", delimiter: str, columns: int
+) -> List[Tuple[int, int]]:
+    """Spans of the first ``columns`` fields of ``record`` (RFC 4180 quoting)."""
+    body_end = len(record.rstrip("\r\n"))
+    spans = []
+    pos = 0
+    while len(spans) < columns:
+        match = pattern.match(record, pos)
+        spans.append(match.span())
+        pos = match.end()
+        if pos == body_end:
+            break
+        if record[pos] != delimiter:
+            raise ValueError("Malformed CSV field")
+        pos += 1
+    return spans
+
+
+def _convert_csv_batch(
+    batch: Batch, columns: Dict[str, int], delimiter: str, options: dict
+) -> BatchResult:
+    first, records = batch
+    pattern = _csv_field_pattern(delimiter)
+    wanted = max(columns.values()) + 1
+    collected: Dict[str, List[ConversionStats]] = {}
+    output = []
+    for number, record in enumerate(records, first):
+        if not record.strip("\r\n"):
+            output.append(record)
+            continue
+        try:
+            spans = _csv_field_spans(record, pattern, delimiter, wanted)
+        except ValueError as exc:
+            raise ValueError(f"Record {number}: {exc}") from None
+        edits = []
+        for field, column in columns.items():
+            if column >= len(spans):
+                continue
+            start, end = spans[column]
+            raw = record[start:end]
+            quoted = raw.startswith('"')
+            value = raw[1:-1].replace('""', '"') if quoted else raw
+            converted = _convert_value(value, field, collected, options)
+            if converted != value:
+                if quoted:
+                    converted = '"' + converted.replace('"', '""') + '"'
+                edits.append((start, end, converted))
+        if edits:
+            chunks = []
+            cursor = 0
+            for start, end, replacement in sorted(edits):
+                chunks.append(record[cursor:start])
+                chunks.append(replacement)
+                cursor = end
+            chunks.append(record[cursor:])
+            record = "".join(chunks)
+        output.append(record)
+    return output, {field: merge_stats(stats) for field, stats in collected.items()}
+
+
+def _iter_csv_records(src: IO[str]) -> Iterator[str]:
+    """Whole CSV records, joining physical lines while a quoted field is open."""
+    pending: List[str] = []
+    quotes = 0
+    for line in src:
+        pending.append(line)
+        quotes += line.count('"')
+        if quotes % 2 == 0:
+            yield "".join(pending)
+            pending = []
+            quotes = 0
+    if pending:
+        yield "".join(pending)
+
+
+def _batches(records: Iterable[str], batch_size: int, first: int = 1) -> Iterator[Batch]:
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, batch_size))
+        if not chunk:
+            return
+        yield first, chunk
+        first += len(chunk)
+
+
+def _map_ordered(
+    func: Callable[[Batch], BatchResult], batches: Iterable[Batch], workers: int
+) -> Iterator[BatchResult]:
+    if workers == 1:
+        yield from map(func, batches)
+        return
+    # At most two batches per worker are in flight, so memory stays bounded.
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        for batch in batches:
+            pending.append(pool.submit(func, batch))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _write_batches(
+    dst: IO[str], results: Iterable[BatchResult], fields: Sequence[str]
+) -> Dict[str, ConversionStats]:
+    collected: Dict[str, List[ConversionStats]] = {field: [] for field in fields}
+    for lines, stats in results:
+        dst.writelines(lines)
+        for field, field_stats in stats.items():
+            collected[field].append(field_stats)
+    return {field: merge_stats(stats) for field, stats in collected.items()}
+
+
+def _options(source: str, target: str, mode: str, overlay: Union[Overlay, str, None]) -> dict:
+    rules.validate(source, target, mode)
+    return {"source": source, "target": target, "mode": mode, "overlay": resolve_overlay(overlay)}
+
+
+def convert_jsonl_stream(
+    src: IO[str],
+    dst: IO[str],
+    fields: Sequence[str] = ("text",),
+    source: str = "en_US",
+    target: str = "en_GB",
+    mode: str = "spelling_only",
+    *,
+    workers: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    overlay: Union[Overlay, str, None] = None,
+) -> Dict[str, ConversionStats]:
+    """Convert the top-level string ``fields`` of each JSON Lines record.
+
+    Everything outside the converted values (keys, other fields, whitespace, line
+    endings) is copied byte for byte; open the streams with ``newline=""`` to keep
+    ``\\r\\n`` endings. Records are processed in batches, on ``workers`` processes when
+    more than one, and written in input order with a bounded number of batches in
+    flight. Returns the aggregated stats per field.
+    """
+    options = _options(source, target, mode, overlay)
+    func = partial(_convert_jsonl_batch, fields=tuple(fields), options=options)
+    results = _map_ordered(func, _batches(src, batch_size), workers)
+    return _write_batches(dst, results, fields)
+
+
+def convert_csv_stream(
+    src: IO[str],
+    dst: IO[str],
+    fields: Sequence[str] = ("text",),
+    source: str = "en_US",
+    target: str = "en_GB",
+    mode: str = "spelling_only",
+    *,
+    delimiter: str = ",",
+    workers: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    overlay: Union[Overlay, str, None] = None,
+) -> Dict[str, ConversionStats]:
+    """Convert the named columns of a CSV file with a header row.
+
+    Like ``convert_jsonl_stream()``, only the converted cells change: quoting, the
+    header, other columns and line endings are left exactly as they were.
+    """
+    options = _options(source, target, mode, overlay)
+    records = _iter_csv_records(src)
+    header: Optional[str] = next(records, None)
+    if header is None:
+        return {field: merge_stats(()) for field in fields}
+    names = [
+        name[1:-1].replace('""', '"') if name.startswith('"') else name
+        for name in (
+            header[start:end]
+            for start, end in _csv_field_spans(
+                header, _csv_field_pattern(delimiter), delimiter, len(header) + 1
+            )
+        )
+    ]
+    missing = [field for field in fields if field not in names]
+    if missing:
+        raise ValueError(f"CSV header has no column(s): {', '.join(missing)}")
+    dst.write(header)
+    columns = {field: names.index(field) for field in fields}
+    func = partial(_convert_csv_batch, columns=columns, delimiter=delimiter, options=options)
+    results = _map_ordered(func, _batches(records, batch_size, first=2), workers)
+    return _write_batches(dst, results, fields)
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import threading
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
 from functools import lru_cache
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Tuple
 
-from .data_loader import VARIANT_FIELDS, load_crosswalk
-from .exception_policies import exception_policies
+from .data_loader import VARIANT_FIELDS, load_crosswalk, load_index
+from .exception_policies import get_exception_policies
+from .morphology import SuffixTable, factor_table
+from .tokenizer import WORD_PATTERN
+
+if TYPE_CHECKING:
+    from .overlays import Overlay
 
 SUPPORTED_VARIANTS = ("en_US", "en_GB", "en_AU", "en_CA")
 SUPPORTED_MODES = ("spelling_only", "spelling_and_lexical")
@@ -34,42 +43,220 @@ def _apply_case(word: str, pattern: str) -> str:
     return word
 
 
-@lru_cache(maxsize=None)
-def _build_mapping(source: str, target: str, mode: str) -> Dict[str, str]:
-    if source == target:
-        return {}
+@dataclass(frozen=True)
+class Fallback:
+    """Where a variant's blank spelling cells come from when tables are built.
+
+    Without ``patterns`` the cell is copied from ``default`` (itself resolved the same
+    way). With them, the cell is spliced from the en_US and en_GB spellings: each
+    stretch where those two differ is looked up as ``(en_US text, en_GB text)`` and
+    taken from the variant it names, else from ``default``.
+    """
+
+    default: str
+    patterns: Mapping[Tuple[str, str], str] = field(default_factory=dict)
+
+
+# Declared fallback chains for the variants whose crosswalk cells are mostly blank.
+# Canadian spelling keeps British -our, -re, doubled -l-, -ce nouns and a few others,
+# and American spelling everywhere else (-ize, -yze, e for ae/oe, plow, draft, tire).
+FALLBACKS: Mapping[str, Fallback] = MappingProxyType(
+    {
+        "en_AU": Fallback("en_GB"),
+        "en_CA": Fallback(
+            "en_US",
+            {
+                ("", "u"): "en_GB",  # colour, mould
+                ("er", "re"): "en_GB",  # centre
+                ("", "l"): "en_GB",  # travelled
+                ("s", "c"): "en_GB",  # defence
+                ("c", "s"): "en_GB",  # practise (verb)
+                ("f", "ph"): "en_GB",  # sulphur
+                ("ck", "que"): "en_GB",  # cheque
+                ("a", "e"): "en_GB",  # grey
+                ("", "te"): "en_GB",  # omelette
+                ("", "ue"): "en_GB",  # catalogue
+                ("ji", "gy"): "en_GB",  # gybe
+                ("u", "ough"): "en_GB",  # through
+            },
+        ),
+    }
+)
+
+
+def _differing_stretches(us: str, gb: str) -> List[Tuple[int, int, int, int]]:
+    """``(us start, us end, gb start, gb end)`` of each stretch where the spellings differ.
+
+    Stretches one shared letter apart are one change (``center``/``centre``).
+    """
+    stretches: List[Tuple[int, int, int, int]] = []
+    matcher = SequenceMatcher(None, us, gb, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        if stretches and i1 - stretches[-1][1] <= 1 and j1 - stretches[-1][3] <= 1:
+            stretches[-1] = (stretches[-1][0], i2, stretches[-1][2], j2)
+        else:
+            stretches.append((i1, i2, j1, j2))
+    return stretches
+
+
+@lru_cache(maxsize=1 << 16)
+def _splice(variant: str, us: str, gb: str) -> str:
+    fallback = FALLBACKS[variant]
+    pieces = []
+    cursor = 0
+    for i1, i2, j1, j2 in _differing_stretches(us.lower(), gb.lower()):
+        pieces.append(us[cursor:i1])
+        choice = fallback.patterns.get((us[i1:i2].lower(), gb[j1:j2].lower()), fallback.default)
+        pieces.append(gb[j1:j2] if choice == "en_GB" else us[i1:i2])
+        cursor = i2
+    pieces.append(us[cursor:])
+    return "".join(pieces)
+
+
+def resolve_cell(row: Mapping[str, str], variant: str) -> str:
+    """``row``'s spelling for ``variant``, following ``FALLBACKS`` when the cell is blank.
+
+    Lexical rows are never filled in: word choice does not follow spelling patterns.
+    """
+    value = (row.get(variant) or "").strip()
+    fallback = FALLBACKS.get(variant)
+    if value or fallback is None or row.get("type") == "lexical_choice":
+        return value
+    if fallback.patterns:
+        us = (row.get("en_US") or "").strip()
+        gb = (row.get("en_GB") or "").strip()
+        if us and gb:
+            return _splice(variant, us, gb)
+    return resolve_cell(row, fallback.default)
 
+
+def build_table(rows, source: str, target: str) -> Dict[str, str]:
+    """Lowercase ``source`` → ``target`` table from crosswalk rows (later rows win).
+
+    Blank en_AU/en_CA cells are filled from their ``FALLBACKS`` chain first, so every
+    pair gets one direct table.
+    """
     mapping: Dict[str, str] = {}
+    for row in rows:
+        src = resolve_cell(row, source)
+        dst = resolve_cell(row, target)
+        if not src or not dst:
+            continue
+        src_norm = _normalize(src)
+        dst_norm = dst.lower()
+        if src_norm == dst_norm:
+            continue
+        mapping[src_norm] = dst_norm
+    return mapping
 
-    def ingest(rows):
-        for row in rows:
-            src = row.get(source, "").strip()
-            dst = row.get(target, "").strip()
-            if not src or not dst:
-                continue
-            src_norm = _normalize(src)
-            dst_norm = dst.lower()
-            if src_norm == dst_norm:
-                continue
-            mapping[src_norm] = dst_norm
-
-    ingest(load_crosswalk("spelling_only"))
-    if mode == "spelling_and_lexical":
-        ingest(load_crosswalk("lexical_choice"))
+
+def index_key(source: str, target: str) -> str:
+    return f"{source}>{target}"
+
+
+# Compiled tables are published once under ``_MAPPINGS_LOCK`` and are read-only
+# afterwards, so the hot path never takes a lock.
+_MAPPINGS: Dict[Tuple[str, str, str], SuffixTable] = {}
+_MAPPINGS_LOCK = threading.Lock()
+
+
+def _build_mapping(source: str, target: str, mode: str) -> SuffixTable:
+    key = (source, target, mode)
+    mapping = _MAPPINGS.get(key)
+    if mapping is None:
+        with _MAPPINGS_LOCK:
+            mapping = _MAPPINGS.get(key)
+            if mapping is None:
+                mapping = _compile_mapping(source, target, mode)
+                _MAPPINGS[key] = mapping
     return mapping
 
 
-def convert_token(token: str, source: str, target: str, mode: str = "spelling_only") -> str:
+def _compile_mapping(source: str, target: str, mode: str) -> SuffixTable:
+    """Spelling residual and suffix rules for the pair, with lexical entries on top."""
+    if source == target:
+        return SuffixTable()
+
+    key = index_key(source, target)
+    index = load_index()
+    if index is not None:
+        entries = dict(index["tables"]["spelling_only"].get(key, {}))
+        morphology = index["morphology"].get(key, {})
+        if mode == "spelling_and_lexical":
+            entries.update(index["tables"]["lexical_choice"].get(key, {}))
+        return SuffixTable(entries, morphology)
+
+    entries, morphology = factor_table(
+        build_table(load_crosswalk("spelling_only"), source, target)
+    )
+    if mode == "spelling_and_lexical":
+        entries.update(build_table(load_crosswalk("lexical_choice"), source, target))
+    return SuffixTable(entries, morphology)
+
+
+def validate(source: str, target: str, mode: str = "spelling_only") -> None:
     if source not in SUPPORTED_VARIANTS or target not in SUPPORTED_VARIANTS:
         raise ValueError(f"Unsupported variant(s): {source}, {target}")
     if mode not in SUPPORTED_MODES:
         raise ValueError(f"Unsupported mode '{mode}'")
+
+
+def needs_conversion(
+    text: str,
+    source: str,
+    target: str,
+    mode: str = "spelling_only",
+    overlay: Optional[Overlay] = None,
+) -> bool:
+    """Cheap pre-scan: ``False`` proves no word in ``text`` has a mapping for this pair.
+
+    Only ASCII letter runs can become word tokens with a crosswalk entry, so scanning
+    them against the residual entries and suffix rules is enough to rule out any
+    replacement.
+    """
+    words = map(str.lower, WORD_PATTERN.findall(text))
+    return has_mapped_word(words, source, target, mode, overlay)
+
+
+def has_mapped_word(
+    words: Iterable[str],
+    source: str,
+    target: str,
+    mode: str = "spelling_only",
+    overlay: Optional[Overlay] = None,
+) -> bool:
+    """``True`` when any of the lowercase ``words`` has a mapping for this pair."""
+    validate(source, target, mode)
+    if source == target:
+        return False
+    mapping = _build_mapping(source, target, mode)
+    if overlay is None:
+        return mapping.maps_any(words)
+    words = set(words)
+    if mapping.maps_any(words):
+        return True
+    return any(not table.keys().isdisjoint(words) for table in overlay.layers(source, target, mode))
+
+
+def convert_token(
+    token: str,
+    source: str,
+    target: str,
+    mode: str = "spelling_only",
+    overlay: Optional[Overlay] = None,
+) -> str:
+    validate(source, target, mode)
     if not token or source == target:
         return token
 
-    mapping = _build_mapping(source, target, mode)
     normalized = _normalize(token)
-    replacement = mapping.get(normalized)
+    replacement = None
+    if overlay is not None:
+        replacement = overlay.lookup(normalized, source, target, mode)
+    if replacement is None:
+        replacement = _build_mapping(source, target, mode).get(normalized)
     if not replacement:
         return token
 
@@ -77,17 +264,54 @@ def convert_token(token: str, source: str, target: str, mode: str = "spelling_on
     return _apply_case(replacement, pattern)
 
 
-def is_swap_allowed(
+def rule_type(
+    token: str,
+    converted: str,
+    source: str,
+    target: str,
+    overlay: Optional[Overlay] = None,
+) -> str:
+    """Name the table (``spelling_only``/``lexical_choice``/``overlay``) behind a swap."""
+    if overlay is not None:
+        for mode in SUPPORTED_MODES:
+            if overlay.lookup(_normalize(token), source, target, mode) == converted.lower():
+                return "overlay"
+    spelling = _build_mapping(source, target, "spelling_only")
+    if spelling.get(_normalize(token)) == converted.lower():
+        return "spelling_only"
+    return "lexical_choice"
+
+
+def swap_policy(
     original: str,
     candidate: str,
     prev_word: Optional[str],
     next_word: Optional[str],
-) -> bool:
+    overlay: Optional[Overlay] = None,
+) -> Optional[str]:
+    """Return the policy label that admitted the swap, or ``None`` when it is blocked.
+
+    Unlisted pairs come back as ``""``; conditional pairs as ``"conditional:<rule>"``.
+    """
+    if overlay is not None and overlay.is_skipped(original, candidate):
+        return None
+    exception_policies = get_exception_policies()
     policy = exception_policies.classify(original, candidate)
     if policy.action == "skip":
-        return False
+        return None
     if policy.action == "conditional":
         prev_norm = (prev_word or "").lower() or None
         next_norm = (next_word or "").lower() or None
-        return exception_policies.allow_conditional(policy.value or "", prev_norm, next_norm)
-    return True
+        if not exception_policies.allow_conditional(policy.value or "", prev_norm, next_norm):
+            return None
+        return f"conditional:{policy.value}"
+    return ""
+
+
+def is_swap_allowed(
+    original: str,
+    candidate: str,
+    prev_word: Optional[str],
+    next_word: Optional[str],
+) -> bool:
+    return swap_policy(original, candidate, prev_word, next_word) is not None
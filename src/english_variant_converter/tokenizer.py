@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import re
-from typing import List
+from typing import List, Optional, Tuple
 
 PROTECTED_WORD_MARKERS = ("http://", "https://", "ftp://", "www.")
 PROTECTED_PREVIOUS_MARKERS = ("://", "@", "#")
 TOKEN_PATTERN = re.compile(r"[A-Za-z]+|[^A-Za-z]+")
+WORD_PATTERN = re.compile(r"[A-Za-z]+")
 
 
 @dataclass
@@ -53,3 +54,28 @@ def tokenize(text: str) -> List[Token]:
         protected = _should_protect(chunk, prev_chunk, next_chunk)
         tokens.append(Token(text=chunk, is_word=True, is_protected=protected))
     return tokens
+
+
+def count_words(text: str, span: Optional[Tuple[int, int]] = None) -> Tuple[int, int]:
+    """Return ``(word_tokens, protected_tokens)`` without building ``Token`` objects.
+
+    With ``span``, only words lying entirely inside ``text[lo:hi]`` are counted.
+    """
+    lo, hi = span if span is not None else (0, len(text))
+    chunks = TOKEN_PATTERN.findall(text)
+    total = 0
+    protected = 0
+    offset = 0
+    for idx, chunk in enumerate(chunks):
+        start = offset
+        offset += len(chunk)
+        if start >= hi:
+            break
+        if start < lo or offset > hi or not chunk.isalpha():
+            continue
+        total += 1
+        prev_chunk = chunks[idx - 1] if idx > 0 else None
+        next_chunk = chunks[idx + 1] if (idx + 1) < len(chunks) else None
+        if _should_protect(chunk, prev_chunk, next_chunk):
+            protected += 1
+    return total, protected
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Tuple, Union
+
+from . import rules
+from .api import ConversionStats, SwapSummary
+from .overlays import Overlay, resolve_overlay
+from .tokenizer import _should_protect
+
+# ASCII letters are single bytes in UTF-8 and never occur inside a multi-byte sequence,
+# so these split UTF-8 input at exactly the places TOKEN_PATTERN splits the decoded text.
+_TOKEN_PATTERN = re.compile(rb"[A-Za-z]+|[^A-Za-z]+")
+_WORD_PATTERN = re.compile(rb"[A-Za-z]+")
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def _is_word(chunk: bytes) -> bool:
+    # bytes.isalpha() only knows ASCII letters; non-ASCII runs can still be alphabetic
+    # once decoded (e.g. the "é" in "café" is a word token of its own).
+    if chunk.isalpha():
+        return True
+    return not chunk.isascii() and chunk.decode("utf-8").isalpha()
+
+
+def _convert_chunks(
+    data: BytesLike,
+    source: str,
+    target: str,
+    mode: str,
+    overlay: Optional[Overlay],
+    *,
+    with_stats: bool,
+    convert_words: bool = True,
+) -> Tuple[List[Tuple[int, int, bytes]], Optional[ConversionStats]]:
+    chunks = _TOKEN_PATTERN.findall(data)
+    words: List[Tuple[int, int, int, str]] = []  # (chunk index, start, end, text)
+    offset = 0
+    for idx, chunk in enumerate(chunks):
+        if _is_word(chunk):
+            words.append((idx, offset, offset + len(chunk), chunk.decode("utf-8")))
+        offset += len(chunk)
+
+    def is_protected(idx: int, text: str) -> bool:
+        prev_chunk = chunks[idx - 1].decode("utf-8") if idx > 0 else None
+        next_chunk = chunks[idx + 1].decode("utf-8") if idx + 1 < len(chunks) else None
+        return _should_protect(text, prev_chunk, next_chunk)
+
+    edits: List[Tuple[int, int, bytes]] = []
+    swaps: Dict[Tuple[str, str], int] = {}
+    protected_tokens = 0
+    prev_word: Optional[str] = None
+    for position, (idx, start, end, text) in enumerate(words):
+        # Protection only matters for stats and for words that would change, so it is
+        # checked lazily unless every word has to be classified.
+        protected = is_protected(idx, text) if with_stats else None
+        if protected:
+            protected_tokens += 1
+            prev_word = text.lower()
+            continue
+        if not convert_words:
+            continue
+        converted = rules.convert_token(
+            text, source=source, target=target, mode=mode, overlay=overlay
+        )
+        if converted != text and (protected is False or not is_protected(idx, text)):
+            next_word = words[position + 1][3].lower() if position + 1 < len(words) else None
+            if rules.swap_policy(text, converted, prev_word, next_word, overlay) is not None:
+                edits.append((start, end, converted.encode("utf-8")))
+                key = (text.lower(), converted.lower())
+                swaps[key] = swaps.get(key, 0) + 1
+        prev_word = text.lower()
+
+    if not with_stats:
+        return edits, None
+    stats = ConversionStats(
+        total_tokens=len(words),
+        converted_tokens=len(edits),
+        protected_tokens=protected_tokens,
+        swaps=tuple(
+            SwapSummary(source=src, target=dst, count=count)
+            for (src, dst), count in sorted(swaps.items())
+        ),
+    )
+    return edits, stats
+
+
+def convert_bytes(
+    data: BytesLike,
+    source: str = "en_US",
+    target: str = "en_GB",
+    mode: str = "spelling_only",
+    *,
+    return_stats: bool = False,
+    overlay: Union[Overlay, str, None] = None,
+):
+    """Convert UTF-8 encoded ``data`` without decoding it as a whole.
+
+    Only the words themselves are decoded; the output is assembled from the converted
+    words and zero-copy views of the untouched bytes between them, so
+    ``convert_bytes(data)`` equals ``convert(data.decode()).encode()``. Input that needs
+    no conversion is returned as is (``bytes`` input) or copied once (other buffers).
+    ``data`` must be valid UTF-8; it is not validated up front.
+    """
+    overlay = resolve_overlay(overlay)
+    view = memoryview(data).cast("B")
+    words = map(bytes.decode, map(bytes.lower, _WORD_PATTERN.findall(view)))
+    needed = rules.has_mapped_word(words, source, target, mode, overlay)
+    if not (needed or return_stats):
+        return data if isinstance(data, bytes) else view.tobytes()
+
+    edits, stats = _convert_chunks(
+        view, source, target, mode, overlay, with_stats=return_stats, convert_words=needed
+    )
+    if not edits:
+        converted = data if isinstance(data, bytes) else view.tobytes()
+    else:
+        parts: List[BytesLike] = []
+        cursor = 0
+        for start, end, replacement in edits:
+            parts.append(view[cursor:start])
+            parts.append(replacement)
+            cursor = end
+        parts.append(view[cursor:])
+        converted = b"".join(parts)
+    if return_stats:
+        return converted, stats
+    return converted
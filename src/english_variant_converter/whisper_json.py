@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+import bisect
+import json
+import re
+from dataclasses import replace
+from typing import IO, Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from . import rules
+from .api import ConversionStats, Edit, SwapSummary, _convert_window, convert, merge_stats
+from .overlays import Overlay, resolve_overlay
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+class _JsonStream:
+    """Minimal pull reader over a JSON text stream.
+
+    Values are decoded one at a time with ``raw_decode`` so that only the current
+    value (e.g. a single segment) has to be held in memory.
+    """
+
+    def __init__(self, handle: IO[str], chunk_size: int = 1 << 16) -> None:
+        self._handle = handle
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        data = self._handle.read(max(self._chunk_size, len(self._buffer) - self._pos))
+        if not data:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + data
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON input")
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in JSON input, found '{found}'")
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number (or literal) ending at the buffer edge may continue in the next read.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def iter_array(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            separator = self.peek()
+            self._pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or ']' in JSON array, found '{separator}'")
+
+    def at_end(self) -> bool:
+        try:
+            self.peek()
+        except ValueError:
+            return True
+        return False
+
+
+class _SegmentTexts(NamedTuple):
+    words: Optional[List[str]]  # word entries, each starting with its separator
+    pad: int  # separator length added to every entry (1 when none had leading space)
+    joined: str  # the entries joined, as context for the neighbouring segments
+    text: str
+
+
+def _segment_texts(segment: Dict[str, Any]) -> _SegmentTexts:
+    """Return the word texts, their joined form and the segment text.
+
+    Whisper's verbose JSON gives every word a leading space (a piece without one
+    continues the previous word); other tools emit bare words. When no entry has leading
+    whitespace, each word is read as if prefixed with a space.
+    """
+    text = segment.get("text") or ""
+    words = segment.get("words")
+    if not words:
+        return _SegmentTexts(None, 0, text, text)
+    word_texts = [entry.get("word") or "" for entry in words]
+    pad = 0 if any(word[:1].isspace() for word in word_texts) else 1
+    if pad:
+        word_texts = [" " + word for word in word_texts]
+    return _SegmentTexts(word_texts, pad, "".join(word_texts), text)
+
+
+def _narrow(edit: Edit, original: str) -> Edit:
+    """``edit`` without the leading and trailing letters it leaves unchanged."""
+    replacement = edit.replacement
+    head = 0
+    limit = min(len(original), len(replacement))
+    while head < limit and original[head] == replacement[head]:
+        head += 1
+    tail = 0
+    while tail < limit - head and original[-1 - tail] == replacement[-1 - tail]:
+        tail += 1
+    return edit._replace(
+        start=edit.start + head,
+        end=edit.end - tail,
+        replacement=replacement[head : len(replacement) - tail],
+    )
+
+
+def _apply_word_edits(
+    words: List[Dict[str, Any]], word_texts: List[str], pad: int, edits: List[Edit]
+) -> List[Edit]:
+    """Rewrite ``words`` in place; returns the edits left out because they span entries.
+
+    A word split across entries (``" col"``, ``"or"``) is still edited when the letters
+    that change lie within one entry (``" col"``, ``"our"``).
+    """
+    starts = []
+    offset = 0
+    for word in word_texts:
+        starts.append(offset)
+        offset += len(word)
+    joined = "".join(word_texts)
+
+    skipped: List[Edit] = []
+    per_word: Dict[int, List[Edit]] = {}
+    for edit in edits:
+        narrowed = _narrow(edit, joined[edit.start : edit.end])
+        idx = bisect.bisect_right(starts, narrowed.start) - 1
+        word_start = starts[idx]
+        if narrowed.end > word_start + len(word_texts[idx]):
+            # The change itself straddles two timestamp entries; leave both untouched.
+            skipped.append(edit)
+            continue
+        edit = narrowed
+        per_word.setdefault(idx, []).append(
+            edit._replace(start=edit.start - word_start, end=edit.end - word_start)
+        )
+
+    for idx, word_edits in per_word.items():
+        chunks = []
+        cursor = 0
+        text = word_texts[idx]
+        for edit in word_edits:
+            chunks.append(text[cursor : edit.start])
+            chunks.append(edit.replacement)
+            cursor = edit.end
+        chunks.append(text[cursor:])
+        words[idx]["word"] = "".join(chunks)[pad:]
+    return skipped
+
+
+def _without_swaps(stats: ConversionStats, swaps: List[Tuple[str, str]]) -> ConversionStats:
+    """``stats`` minus one conversion per ``(source, target)`` in ``swaps``."""
+    counts = {(swap.source, swap.target): swap.count for swap in stats.swaps}
+    for key in swaps:
+        counts[key] -= 1
+    return replace(
+        stats,
+        converted_tokens=stats.converted_tokens - len(swaps),
+        swaps=tuple(
+            SwapSummary(source=src, target=dst, count=count)
+            for (src, dst), count in sorted(counts.items())
+            if count
+        ),
+    )
+
+
+def _spaced(before: str, text: str, after: str) -> Tuple[str, str]:
+    """Context strings that cannot run into ``text`` (bare-word segment texts)."""
+    if before and not before[-1:].isspace() and text and not text[:1].isspace():
+        before += " "
+    if after and not after[:1].isspace() and text and not text[-1:].isspace():
+        after = " " + after
+    return before, after
+
+
+def _convert_segment(
+    segment: Dict[str, Any],
+    texts: _SegmentTexts,
+    prev_texts: Optional[_SegmentTexts],
+    next_texts: Optional[_SegmentTexts],
+    source: str,
+    target: str,
+    mode: str,
+    overlay: Optional[Overlay],
+) -> ConversionStats:
+    before_text, after_text = _spaced(
+        prev_texts.text if prev_texts else "", texts.text, next_texts.text if next_texts else ""
+    )
+    converted_text, stats = _convert_window(
+        texts.text,
+        before_text,
+        after_text,
+        source=source,
+        target=target,
+        mode=mode,
+        overlay=overlay,
+    )
+    if "text" in segment:
+        segment["text"] = converted_text
+
+    if texts.words is None:
+        return stats
+
+    before_joined, after_joined = _spaced(
+        prev_texts.joined if prev_texts else "",
+        texts.joined,
+        next_texts.joined if next_texts else "",
+    )
+    edits: List[Edit] = []
+    _, stats = _convert_window(
+        texts.joined,
+        before_joined,
+        after_joined,
+        source=source,
+        target=target,
+        mode=mode,
+        edits=edits,
+        overlay=overlay,
+    )
+    offset = len(before_joined)
+    skipped = _apply_word_edits(
+        segment["words"],
+        texts.words,
+        texts.pad,
+        [edit._replace(start=edit.start - offset, end=edit.end - offset) for edit in edits],
+    )
+    if skipped:
+        # Keep words that were never rewritten out of the counts.
+        stats = _without_swaps(
+            stats,
+            [
+                (texts.joined[edit.start : edit.end].lower(), edit.replacement.lower())
+                for edit in skipped
+            ],
+        )
+    return stats
+
+
+def iter_convert_segments(
+    segments: Iterable[Dict[str, Any]],
+    source: str = "en_US",
+    target: str = "en_GB",
+    mode: str = "spelling_only",
+    overlay: Union[Overlay, str, None] = None,
+) -> Iterator[Tuple[Dict[str, Any], ConversionStats]]:
+    """Convert Whisper segments in place, yielding each with its word-level stats.
+
+    Segments are consumed lazily with one segment of lookahead, so the prev/next word
+    context seen by the exception policies spans segment and word boundaries.
+    """
+    rules.validate(source, target, mode)
+    overlay = resolve_overlay(overlay)
+    prev_texts = None
+    current = None
+    current_texts = None
+    for upcoming in segments:
+        upcoming_texts = _segment_texts(upcoming)
+        if current is not None:
+            stats = _convert_segment(
+                current, current_texts, prev_texts, upcoming_texts, source, target, mode, overlay
+            )
+            yield current, stats
+        prev_texts = current_texts
+        current, current_texts = upcoming, upcoming_texts
+    if current is not None:
+        stats = _convert_segment(
+            current, current_texts, prev_texts, None, source, target, mode, overlay
+        )
+        yield current, stats
+
+
+def convert_whisper_json(
+    payload: Dict[str, Any],
+    source: str = "en_US",
+    target: str = "en_GB",
+    mode: str = "spelling_only",
+    *,
+    return_stats: bool = False,
+    overlay: Union[Overlay, str, None] = None,
+):
+    """Convert a parsed Whisper ``verbose_json`` payload.
+
+    Segment and word ``text``/``word`` fields are rewritten; timestamps, token ids and
+    probabilities are left untouched. The payload is modified in place and returned.
+    """
+    overlay = resolve_overlay(overlay)
+    collected: List[ConversionStats] = []
+    if isinstance(payload.get("text"), str):
+        payload["text"] = convert(
+            payload["text"], source=source, target=target, mode=mode, overlay=overlay
+        )
+    segments = payload.get("segments")
+    if isinstance(segments, list):
+        converted = iter_convert_segments(segments, source, target, mode, overlay)
+        for _, stats in converted:
+            collected.append(stats)
+    if return_stats:
+        return payload, merge_stats(collected)
+    return payload
+
+
+def convert_whisper_json_stream(
+    src: IO[str],
+    dst: IO[str],
+    source: str = "en_US",
+    target: str = "en_GB",
+    mode: str = "spelling_only",
+    overlay: Union[Overlay, str, None] = None,
+) -> ConversionStats:
+    """Stream a Whisper ``verbose_json`` document from ``src`` to ``dst``.
+
+    Only one segment is decoded at a time, so arbitrarily long transcripts convert in
+    constant memory. Returns the aggregated word-level stats.
+    """
+    rules.validate(source, target, mode)
+    overlay = resolve_overlay(overlay)
+    reader = _JsonStream(src)
+    collected: List[ConversionStats] = []
+
+    reader.expect("{")
+    dst.write("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+    else:
+        first = True
+        while True:
+            key = reader.value()
+            if not isinstance(key, str):
+                raise ValueError("Expected a string key in Whisper JSON object")
+            reader.expect(":")
+            if not first:
+                dst.write(", ")
+            first = False
+            dst.write(f"{json.dumps(key)}: ")
+
+            if key == "segments" and reader.peek() == "[":
+                dst.write("[")
+                converted = iter_convert_segments(
+                    reader.iter_array(), source, target, mode, overlay
+                )
+                for idx, (segment, stats) in enumerate(converted):
+                    if idx:
+                        dst.write(", ")
+                    dst.write(json.dumps(segment, ensure_ascii=False))
+                    collected.append(stats)
+                dst.write("]")
+            else:
+                value = reader.value()
+                if key == "text" and isinstance(value, str):
+                    value = convert(
+                        value, source=source, target=target, mode=mode, overlay=overlay
+                    )
+                dst.write(json.dumps(value, ensure_ascii=False))
+
+            separator = reader.peek()
+            reader.expect(separator)
+            if separator == "}":
+                break
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' in JSON object, found '{separator}'")
+    dst.write("}\n")
+    if not reader.at_end():
+        raise ValueError("Unexpected data after Whisper JSON object")
+    return merge_stats(collected)
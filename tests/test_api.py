@@ -1,4 +1,5 @@
-from english_variant_converter import convert
+import english_variant_converter
+from english_variant_converter import Edit, apply_edits, convert, find_edits
 
 
 def test_convert_round_trip():
@@ -43,3 +44,37 @@ def test_exception_conditional_applies_in_both_directions():
 
     verb_gb = "He will cheque the invoices."
     assert convert(verb_gb, source="en_GB", target="en_US") == verb_gb
+
+
+def test_fast_path_returns_input_object_with_stats():
+    text = "Nothing to change here, see https://example.com #tag."
+    assert convert(text, source="en_US", target="en_GB") is text
+
+    converted, stats = convert(text, source="en_US", target="en_GB", return_stats=True)
+    assert converted is text
+    assert stats.converted_tokens == 0
+    assert stats.swaps == ()
+    assert stats.total_tokens == 9
+    assert stats.protected_tokens == 2
+
+
+def test_edits_report_spans_and_round_trip():
+    sentence = "The check for the truck color."
+    converted, edits = convert(
+        sentence, source="en_US", target="en_GB", mode="spelling_and_lexical", return_edits=True
+    )
+    assert converted == "The cheque for the lorry colour."
+    assert edits == [
+        Edit(4, 9, "cheque", "spelling_only", "conditional:check_noun"),
+        Edit(18, 23, "lorry", "lexical_choice", ""),
+        Edit(24, 29, "colour", "spelling_only", ""),
+    ]
+    assert find_edits(sentence, "en_US", "en_GB", "spelling_and_lexical") == edits
+    assert apply_edits(sentence, edits) == converted
+    assert find_edits("Nothing here.", "en_US", "en_GB") == []
+
+
+def test_public_names_resolve_lazily():
+    package = english_variant_converter
+    assert sorted(package.__all__) == sorted(package._EXPORTS)
+    assert all(getattr(package, name) is not None for name in package.__all__)
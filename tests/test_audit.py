@@ -0,0 +1,121 @@
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from english_variant_converter import Overlay, audit, convert
+from english_variant_converter.cli import main
+
+TRANSCRIPTS_DIR = Path(__file__).resolve().parents[1] / "samples" / "transcripts"
+
+EDGE_CASES = [
+    "",
+    "Nothing to convert here.",
+    "The café served 😀 color-coded flavored naïve treats at the center.",
+    "Visit http://color.example/center or mail color@example.com #color #  color",
+    "COLOR Color color colorK Kcolor",
+    "He wrote a check; the check cleared. Practice makes perfect, practice.",
+    "Ünïcödé wörds around color and ＡＢＣ full-width letters.",
+    "@x",
+    "@color and color@",
+]
+
+TEXTS = EDGE_CASES + [
+    path.read_text(encoding="utf-8") for path in sorted(TRANSCRIPTS_DIR.glob("*.txt"))
+]
+
+
+def _write(tmp_path, texts):
+    paths = []
+    for idx, text in enumerate(texts):
+        path = tmp_path / f"{idx:03d}.txt"
+        path.write_text(text, encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+@pytest.mark.parametrize("block_size", [8, 1 << 20])
+@pytest.mark.parametrize(
+    "source,target,mode",
+    [
+        ("en_US", "en_GB", "spelling_only"),
+        ("en_GB", "en_US", "spelling_and_lexical"),
+    ],
+)
+def test_counts_match_convert_stats(tmp_path, block_size, source, target, mode):
+    paths = _write(tmp_path, TEXTS)
+    report = audit(paths, source, target, mode, block_size=block_size)
+    for path, text in zip(paths, TEXTS):
+        _, stats = convert(text, source, target, mode, return_stats=True)
+        counts = report.files[path]
+        assert counts.total_tokens == stats.total_tokens
+        assert counts.protected_tokens == stats.protected_tokens
+        assert counts.convertible_tokens == stats.converted_tokens
+        converted = {
+            (pair.source, pair.target): pair.converted
+            for pair in counts.pairs.values()
+            if pair.converted
+        }
+        assert converted == {(swap.source, swap.target): swap.count for swap in stats.swaps}
+
+
+def test_random_texts_match_convert_stats(tmp_path):
+    # The byte patterns in ``auditing.py`` mirror ``tokenizer._should_protect()``.
+    pieces = [
+        "color", "Color", "COLOR", "colorK", "center", "a", "naïve", "é", "@", "@ ", "#",
+        "#\t", ":", "//", "http://", "www.", " ", "  ", "\u3000", "\n", "-", ".",
+    ]
+    rng = random.Random(0)
+    texts = [
+        "".join(rng.choice(pieces) for _ in range(rng.randint(1, 12))) for _ in range(300)
+    ]
+    paths = _write(tmp_path, texts)
+    report = audit(paths, block_size=8)
+    for path, text in zip(paths, texts):
+        _, stats = convert(text, return_stats=True)
+        counts = report.files[path]
+        assert (counts.total_tokens, counts.protected_tokens, counts.convertible_tokens) == (
+            stats.total_tokens,
+            stats.protected_tokens,
+            stats.converted_tokens,
+        ), text
+
+
+def test_blocked_swaps_are_counted_by_policy(tmp_path):
+    paths = _write(tmp_path, ["He wrote a check; please check the colors."])
+    totals = audit(paths).totals
+    check = totals.pairs[("check", "cheque")]
+    assert (check.policy, check.converted, check.blocked) == ("conditional:check_noun", 1, 1)
+    assert totals.policies() == {
+        "conditional:check_noun": {"converted": 1, "blocked": 1},
+        "none": {"converted": 1, "blocked": 0},
+    }
+
+
+def test_overlay_skip_is_reported(tmp_path):
+    overlay = Overlay("tenant", {"skip_pairs": [["color", "colour"]]})
+    paths = _write(tmp_path, ["the color of honor"])
+    pairs = audit(paths, overlay=overlay).totals.pairs
+    color = pairs[("color", "colour")]
+    assert (color.policy, color.converted, color.blocked) == ("overlay-skip", 0, 1)
+    assert pairs[("honor", "honour")].converted == 1
+
+
+def test_directories_and_workers(tmp_path):
+    for name, texts in (("a", TEXTS[:4]), ("b", TEXTS[4:])):
+        (tmp_path / name).mkdir()
+        _write(tmp_path / name, texts)
+    serial = audit([tmp_path])
+    parallel = audit([tmp_path], workers=2)
+    assert list(serial.files) == sorted(serial.files)
+    assert len(serial.files) == len(TEXTS)
+    assert parallel.to_dict()["totals"]["swaps"] == serial.to_dict()["totals"]["swaps"]
+
+
+def test_cli_prints_json_report(tmp_path, capsys):
+    paths = _write(tmp_path, ["The color of honor.", "Nothing here."])
+    main(["audit", *paths, "--to", "en_GB"])
+    report = json.loads(capsys.readouterr().out)
+    assert report["totals"]["convertible_tokens"] == 2
+    assert report["files"][paths[1]]["convertible_tokens"] == 0
@@ -0,0 +1,93 @@
+import io
+import json
+
+import pytest
+
+from english_variant_converter import ResultCache, convert, convert_parallel
+from english_variant_converter import cache as cache_module
+from english_variant_converter.cli import main
+
+TEXT = "The color of the center was gray, and the check cleared."
+
+
+def test_cache_hit_matches_fresh_conversion(tmp_path):
+    expected = convert(TEXT, return_stats=True, return_edits=True)
+    with ResultCache(tmp_path / "evc.sqlite") as cache:
+        first = convert(TEXT, return_stats=True, return_edits=True, cache=cache)
+        second = convert(TEXT, return_stats=True, return_edits=True, cache=cache)
+        assert first == expected
+        assert second == expected
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        assert cache.stats.hit_rate == 0.5
+        assert cache.stats.saved_seconds > 0
+
+
+def test_cache_is_persistent_and_keyed_on_mode(tmp_path):
+    path = tmp_path / "evc.sqlite"
+    with ResultCache(path) as cache:
+        convert(TEXT, cache=cache)
+    with ResultCache(path) as cache:
+        assert convert(TEXT, cache=cache) == convert(TEXT)
+        assert convert(TEXT, mode="spelling_and_lexical", cache=cache) == convert(
+            TEXT, mode="spelling_and_lexical"
+        )
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_entries_without_edits_do_not_serve_edit_requests(tmp_path):
+    with ResultCache(tmp_path / "evc.sqlite") as cache:
+        convert(TEXT, cache=cache)
+        _, edits = convert(TEXT, return_edits=True, cache=cache)
+        assert edits == convert(TEXT, return_edits=True)[1]
+        assert cache.stats.misses == 2
+
+
+def test_lru_eviction(tmp_path):
+    with ResultCache(tmp_path / "evc.sqlite", max_entries=2) as cache:
+        texts = [f"color number {idx}" for idx in range(3)]
+        convert(texts[0], cache=cache)
+        convert(texts[1], cache=cache)
+        convert(texts[0], cache=cache)  # refresh: texts[1] is now least recently used
+        convert(texts[2], cache=cache)
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+        convert(texts[0], cache=cache)
+        assert cache.stats.hits == 2
+
+
+def test_data_change_invalidates(tmp_path, monkeypatch):
+    path = tmp_path / "evc.sqlite"
+    with ResultCache(path) as cache:
+        convert(TEXT, cache=cache)
+    monkeypatch.setattr(cache_module, "data_version", lambda: "changed")
+    with ResultCache(path) as cache:
+        assert len(cache) == 0
+
+
+def test_parallel_uses_cache(tmp_path):
+    text = TEXT * 50
+    expected = convert_parallel(text, workers=1, shard_size=64, return_stats=True)
+    with ResultCache(tmp_path / "evc.sqlite") as cache:
+        for _ in range(2):
+            result = convert_parallel(
+                text, workers=1, shard_size=64, return_stats=True, cache=cache
+            )
+            assert result == expected
+        assert cache.stats.hits == 1
+
+
+def test_rejects_non_positive_size(tmp_path):
+    with pytest.raises(ValueError):
+        ResultCache(tmp_path / "evc.sqlite", max_entries=0)
+
+
+def test_cli_reports_cache_stats(tmp_path, monkeypatch, capsys):
+    argv = ["--cache", str(tmp_path / "evc.sqlite"), "--stats", "json"]
+    for _ in range(2):
+        monkeypatch.setattr("sys.stdin", io.StringIO(TEXT))
+        main(argv)
+        captured = capsys.readouterr()
+        assert captured.out == convert(TEXT)
+    report = json.loads(captured.err)
+    assert report["cache"]["hits"] == 1
+    assert report["converted_tokens"] == convert(TEXT, return_stats=True)[1].converted_tokens
@@ -0,0 +1,66 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from english_variant_converter import convert, data_loader, rules
+from english_variant_converter import exception_policies as exception_module
+
+SENTENCES = [
+    "Color and organize the theater program.",
+    "The check arrived today, so he will check the invoices.",
+    "The truck parked near the apartment.",
+    "Please practice the piano each day.",
+    "Visit https://example.com for color info.",
+]
+PAIRS = [("en_US", "en_GB"), ("en_GB", "en_US"), ("en_US", "en_CA")]
+MODES = ("spelling_only", "spelling_and_lexical")
+
+
+def _run_all():
+    return [
+        convert(sentence, source=source, target=target, mode=mode, return_stats=True)
+        for sentence in SENTENCES
+        for source, target in PAIRS
+        for mode in MODES
+    ]
+
+
+def test_cold_start_from_many_threads_loads_once(monkeypatch):
+    monkeypatch.setattr(data_loader, "_CACHE", {})
+    monkeypatch.setattr(data_loader, "_INDEX", {})
+    monkeypatch.setattr(data_loader, "_VERSION", {})
+    monkeypatch.setattr(data_loader, "INDEX_FILE", "missing_index.json")
+    monkeypatch.setattr(rules, "_MAPPINGS", {})
+    monkeypatch.setattr(exception_module, "_INSTANCE", None)
+
+    csv_loads = []
+    load_from_package = data_loader._load_from_package
+
+    def counting_load(filename):
+        csv_loads.append(filename)
+        return load_from_package(filename)
+
+    policy_loads = []
+
+    class CountingPolicies(exception_module.ExceptionPolicies):
+        def __init__(self):
+            policy_loads.append(1)
+            super().__init__()
+
+    monkeypatch.setattr(data_loader, "_load_from_package", counting_load)
+    monkeypatch.setattr(exception_module, "ExceptionPolicies", CountingPolicies)
+
+    threads = 16
+    barrier = threading.Barrier(threads)
+
+    def worker(_):
+        barrier.wait()
+        return _run_all()
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(worker, range(threads)))
+
+    expected = _run_all()
+    assert all(result == expected for result in results)
+    assert sorted(csv_loads) == sorted(data_loader.DATA_FILES.values())
+    assert len(policy_loads) == 1
+    assert len(rules._MAPPINGS) == len(PAIRS) * len(MODES)
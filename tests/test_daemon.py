@@ -0,0 +1,109 @@
+import io
+import os
+import sys
+import threading
+
+import pytest
+
+from english_variant_converter import convert, daemon
+
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    path = str(tmp_path / "evc.sock")
+    server = daemon.make_server(path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+
+
+def test_forward_matches_in_process(running_daemon):
+    text = "The color of the check cleared."
+    code, stdout, stderr = daemon.forward(["--stats", "table"], text.encode(), running_daemon)
+    assert code == 0
+    assert stdout.decode() == convert(text)
+    assert "color → colour (1)" in stderr
+
+
+def test_forward_reports_usage_errors(running_daemon):
+    code, stdout, stderr = daemon.forward(["--from", "en_XX"], b"", running_daemon)
+    assert code == 2
+    assert stdout == b""
+    assert "invalid choice" in stderr
+
+
+def test_second_daemon_refuses_to_start(running_daemon):
+    with pytest.raises(RuntimeError):
+        daemon.make_server(running_daemon)
+
+
+def test_forward_without_daemon(tmp_path):
+    assert daemon.forward([], b"color", str(tmp_path / "missing.sock")) is None
+
+
+def test_main_falls_back_to_in_process(tmp_path, monkeypatch, capsys):
+    stale = tmp_path / "evc.sock"
+    stale.touch()  # exists, but nothing listens on it
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(stale))
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(b"The color."), "utf-8"))
+    daemon.main([])
+    assert capsys.readouterr().out == "The colour."
+
+
+class _UnreadableStdin:
+    """Stands in for a terminal nobody types into: reading it fails the test."""
+
+    encoding = "utf-8"
+    errors = "strict"
+
+    @property
+    def buffer(self):
+        raise AssertionError("stdin was read")
+
+
+@pytest.mark.parametrize("argv", [["audit", "{path}"], ["--help"], ["--to", "en_AU", "--he"]])
+def test_main_does_not_read_stdin_when_unused(running_daemon, tmp_path, monkeypatch, argv):
+    sample = tmp_path / "sample.txt"
+    sample.write_text("color", encoding="utf-8")
+    monkeypatch.setenv(daemon.SOCKET_ENV, running_daemon)
+    monkeypatch.setattr("sys.stdin", _UnreadableStdin())
+    try:
+        daemon.main([arg.format(path=sample) for arg in argv])
+    except SystemExit as exc:
+        assert exc.code == 0
+
+
+def test_socket_must_be_private_and_owned(running_daemon, monkeypatch, capsys):
+    assert daemon.forward([], b"color", running_daemon) is not None
+    os.chmod(running_daemon, 0o666)  # anyone could have bound or opened it
+    assert daemon.forward([], b"color", running_daemon) is None
+    monkeypatch.setenv(daemon.SOCKET_ENV, running_daemon)
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(b"color"), "utf-8"))
+    monkeypatch.setattr(daemon, "forward", lambda *args: pytest.fail("forwarded"))
+    daemon.main([])
+    assert capsys.readouterr().out == "colour"
+    monkeypatch.setattr(os, "getuid", lambda: os.geteuid() + 1)
+    os.chmod(running_daemon, 0o600)
+    assert not daemon._trusted(running_daemon)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["--format", "jsonl"], ["--format=csv", "--field", "text"], ["--form", "whisper-json"]],
+)
+def test_streaming_formats_run_in_process(running_daemon, monkeypatch, argv):
+    monkeypatch.setenv(daemon.SOCKET_ENV, running_daemon)
+    monkeypatch.setattr(daemon, "forward", lambda *args: pytest.fail("forwarded"))
+    data = {
+        "jsonl": '{"text": "color"}\n',
+        "csv": "text\ncolor\n",
+        "whisper-json": '{"text": "color"}',
+    }[argv[0].partition("=")[2] or argv[1]]
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(data.encode()), "utf-8"))
+    monkeypatch.setattr("sys.stdout", io.TextIOWrapper(io.BytesIO(), "utf-8"))
+    daemon.main(argv)
+    sys.stdout.flush()
+    assert "colour" in sys.stdout.buffer.getvalue().decode()
+    assert daemon._forwardable(["--format", "text"])
@@ -0,0 +1,76 @@
+import io
+
+import pytest
+
+from english_variant_converter import convert, detect_variant
+from english_variant_converter.cli import main
+
+
+def test_detects_dominant_variant():
+    # "colour", "centre" and "grey" are Canadian too; "organised" is not.
+    detection = detect_variant("The colour of the centre was grey and organised.")
+    assert detection.variant == "en_GB"
+    assert 0.5 < detection.confidence < 1.0
+    assert detect_variant("The color of the center was gray.").variant == "en_US"
+
+
+def test_stops_once_margin_is_decisive():
+    text = "organise " * 50 + "organize " * 200
+    detection = detect_variant(text, margin=3)
+    assert detection.variant == "en_GB"
+    assert detection.words_scanned == 3
+
+
+def test_detects_canadian_text():
+    text = "The colour of the centre was organized, analyzed and traveled to the program."
+    detection = detect_variant(text)
+    assert detection.variant == "en_CA"
+    assert convert(text, source="auto", target="en_GB") == convert(
+        text, source="en_CA", target="en_GB"
+    )
+
+
+def test_australian_text_scores_with_british():
+    # en_AU shares every crosswalk spelling with en_GB, so neither wins over the other.
+    text = "The colour of the centre was organised by the travelling programme."
+    detection = detect_variant(text)
+    scores = dict(detection.scores)
+    assert detection.variant == "en_GB"
+    assert scores["en_AU"] == scores["en_GB"] > scores["en_CA"] > scores["en_US"]
+    assert convert(text, source="auto", target="en_US") == convert(
+        text, source="en_AU", target="en_US"
+    )
+    assert detect_variant("organised " * 20, margin=3).words_scanned == 3
+
+
+def test_undetermined_text_is_left_unchanged():
+    text = "Hello world, nothing to see here."
+    assert detect_variant(text).variant is None
+    converted, stats = convert(text, source="auto", target="en_US", return_stats=True)
+    assert converted is text
+    assert stats.detection.variant is None
+
+
+def test_convert_auto_matches_explicit_source():
+    text = "The colour of the centre was grey."
+    converted, stats = convert(text, source="auto", target="en_US", return_stats=True)
+    assert converted == convert(text, source="en_GB", target="en_US")
+    assert stats.detection.variant == "en_GB"
+    assert stats.to_dict()["detection"]["variant"] == "en_GB"
+    # Already in the target variant: nothing to do.
+    assert convert("The color of the center.", source="auto", target="en_US") == (
+        "The color of the center."
+    )
+
+
+def test_cli_auto_source(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("The colour was grey."))
+    main(["--from", "auto", "--to", "en_US", "--stats", "table"])
+    captured = capsys.readouterr()
+    assert captured.out == "The color was gray."
+    assert "Detected source: en_GB" in captured.err
+
+
+def test_cli_auto_rejected_for_whisper_json():
+    with pytest.raises(SystemExit):
+        main(["--from", "auto", "--format", "whisper-json"])
@@ -0,0 +1,80 @@
+import pytest
+
+from english_variant_converter import apply_edits, convert
+from english_variant_converter.markup import convert_markup, prose_spans
+
+MARKDOWN = """# Color theory
+
+The color of the `color` variable is gray. See [the color guide](https://x.example/color "color")
+and <span class="color">center</span> or www.color.example.
+
+```css
+.color { color: gray; }
+```
+
+[guide]: http://color.example/center
+Use ``a `color` b`` when the check cleared. <!-- color -->
+"""
+
+
+def test_markdown_converts_prose_only():
+    converted, stats, edits = convert_markup(MARKDOWN, return_stats=True, return_edits=True)
+    assert converted == """# Colour theory
+
+The colour of the `color` variable is grey. See [the colour guide](https://x.example/color "color")
+and <span class="color">centre</span> or www.color.example.
+
+```css
+.color { color: gray; }
+```
+
+[guide]: http://color.example/center
+Use ``a `color` b`` when the cheque cleared. <!-- color -->
+"""
+    assert stats.converted_tokens == 6
+    assert apply_edits(MARKDOWN, edits) == converted
+
+
+def test_unclosed_fence_runs_to_end():
+    text = "The color\n\n```\ncolor\n"
+    assert convert_markup(text) == "The colour\n\n```\ncolor\n"
+
+
+def test_html_skips_tags_attributes_and_code():
+    html = (
+        '<style>.color{color:gray}</style><p class="color" title="color">The <b>color</b> '
+        "of the <i>check</i> cleared &amp; gray&nbsp;center</p><PRE>color</PRE>"
+        "<script>var color = 1;</script>"
+    )
+    assert convert_markup(html, "html") == (
+        '<style>.color{color:gray}</style><p class="color" title="color">The <b>colour</b> '
+        "of the <i>cheque</i> cleared &amp; grey&nbsp;centre</p><PRE>color</PRE>"
+        "<script>var color = 1;</script>"
+    )
+
+
+def test_plain_prose_matches_convert():
+    text = "The color of the check cleared, and the center was gray."
+    assert prose_spans(text, "markdown") == [(0, len(text))]
+    assert convert_markup(text, return_stats=True) == convert(text, return_stats=True)
+
+
+def test_unknown_markup():
+    with pytest.raises(ValueError):
+        convert_markup("color", "rst")
+
+
+def test_markdown_skips_indented_code_blocks():
+    text = '    color = "gray"\n\nThe color\n\n    color = "gray"\n\n\tcenter()\nThe center\n'
+    assert convert_markup(text) == (
+        '    color = "gray"\n\nThe colour\n\n    color = "gray"\n\n\tcenter()\nThe centre\n'
+    )
+    # Indentation inside a paragraph is a continuation line, not code.
+    assert convert_markup("The color\n    of gray") == "The colour\n    of grey"
+
+
+def test_markdown_skips_raw_html_elements():
+    text = "The <code>color</code> and <PRE>gray</PRE> <script>color()</script> color."
+    assert convert_markup(text) == (
+        "The <code>color</code> and <PRE>gray</PRE> <script>color()</script> colour."
+    )
@@ -0,0 +1,60 @@
+import pytest
+
+from english_variant_converter import convert, rules
+from english_variant_converter.morphology import SuffixTable, factor_table
+
+
+def test_open_rule_converts_unseen_inflections():
+    assert convert("They tokenize, tokenized and keep tokenizing.") == (
+        "They tokenise, tokenised and keep tokenising."
+    )
+    assert rules.needs_conversion("retokenizations", "en_US", "en_GB")
+
+
+def test_open_rule_carries_stem_change_from_listed_sibling():
+    table = rules._build_mapping("en_US", "en_GB", "spelling_only")
+    assert "colorizable" not in table.entries
+    assert table.get("colorizable") == "colourisable"
+
+
+@pytest.mark.parametrize("word", ["size", "capsize", "downsized", "seize", "baize", "maize"])
+def test_open_rule_leaves_short_and_denied_stems(word):
+    assert rules.convert_token(word, "en_US", "en_GB") == word
+
+
+def test_reverse_direction_is_closed():
+    # ``-ise`` is not reliably British ``-ize``: only stems seen in the crosswalk flip.
+    assert convert("advertise surprise exercise", "en_GB", "en_US") == "advertise surprise exercise"
+    assert convert("organise", "en_GB", "en_US") == "organize"
+
+
+def test_closed_rule_inflects_listed_stems_only():
+    table = rules._build_mapping("en_US", "en_GB", "spelling_only")
+    assert "colorings" not in table.entries
+    assert table.get("colorings") == "colourings"
+    assert table.get("academic") is None
+    assert table.get("storing") is None
+
+
+def test_factor_table_round_trips_and_keeps_exceptions():
+    flat = {
+        "color": "colour",
+        "colors": "colours",
+        "colored": "coloured",
+        "honor": "honour",
+        "honors": "honours",
+        "honored": "honoured",
+        "flavor": "flavour",
+        "flavors": "flavours",
+        "color's": "colour's",
+        "oversize": "oversized",
+        "stor": "stour",
+    }
+    residual, pair_rules = factor_table(flat)
+    assert residual == {"oversize": "oversized", "stor": "stour"}
+    assert pair_rules == {"our>": ["col", "flav", "hon"]}
+    table = SuffixTable(residual, pair_rules)
+    assert all(table.get(word) == replacement for word, replacement in flat.items())
+    assert table.get("honoring") == "honouring"
+    assert table.maps_any(["plain", "flavorless"])
+    assert not table.maps_any(["plain", "storing"])
@@ -0,0 +1,51 @@
+import pickle
+
+import pytest
+
+from english_variant_converter import (
+    Overlay,
+    convert,
+    find_edits,
+    register_overlay,
+    unregister_overlay,
+)
+
+SPEC = {
+    "additions": [
+        {"en_US": "acmecolor", "en_GB": "acmecolour"},
+        {"en_US": "sidewalk", "en_GB": "pavement", "type": "lexical_choice"},
+    ],
+    "removals": ["program", "programs"],
+    "skip_pairs": [["color", "colour"]],
+}
+
+
+def test_overlay_layers_over_base_tables():
+    overlay = Overlay("tenant-a", SPEC)
+    text = "Acmecolor the program color on the sidewalk theater."
+    assert convert(text, overlay=overlay) == "Acmecolour the program color on the sidewalk theatre."
+    assert (
+        convert(text, mode="spelling_and_lexical", overlay=overlay)
+        == "Acmecolour the program color on the pavement theatre."
+    )
+    # Without the overlay the base behaviour is untouched.
+    assert convert(text) == "Acmecolor the programme colour on the sidewalk theatre."
+    assert find_edits(text, overlay=overlay)[0].rule_type == "overlay"
+
+
+def test_registered_overlays_hot_reload_by_id():
+    register_overlay("tenant-b", {"removals": ["theater"]})
+    try:
+        assert convert("The theater color.", overlay="tenant-b") == "The theater colour."
+        register_overlay("tenant-b", {"removals": ["color"]})
+        assert convert("The theater color.", overlay="tenant-b") == "The theatre color."
+    finally:
+        unregister_overlay("tenant-b")
+    with pytest.raises(ValueError):
+        convert("The theater color.", overlay="tenant-b")
+
+
+def test_overlay_pickles_for_worker_processes():
+    overlay = pickle.loads(pickle.dumps(Overlay("tenant-c", SPEC)))
+    assert overlay.version == Overlay("tenant-c", SPEC).version
+    assert convert("acmecolor", overlay=overlay) == "acmecolour"
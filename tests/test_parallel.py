@@ -0,0 +1,40 @@
+import random
+
+from english_variant_converter import convert
+from english_variant_converter.parallel import convert_parallel
+
+PIECES = [
+    "The", "check", "arrived", "color", "COLOR", "Colour", "organize", "é", "café",
+    "the check", "#color", "@color", "color@x", "https://color.example", "a", "check",
+    "number", "truck", "apartment", ",", ".", "--", "42", "\n", "practice", "theater",
+]
+
+
+def _random_text(seed: int, words: int = 400) -> str:
+    rng = random.Random(seed)
+    parts = []
+    for _ in range(words):
+        parts.append(rng.choice(PIECES))
+        parts.append(rng.choice([" ", " ", "  ", "\n", "\t", ", ", " ... "]))
+    return "".join(parts)
+
+
+def test_sharded_output_is_byte_identical_to_serial():
+    for seed in range(20):
+        text = _random_text(seed)
+        for mode in ("spelling_only", "spelling_and_lexical"):
+            expected = convert(text, mode=mode, return_stats=True)
+            for shard_size in (1, 7, 64):
+                actual = convert_parallel(
+                    text, mode=mode, workers=1, shard_size=shard_size, return_stats=True
+                )
+                assert actual == expected
+
+
+def test_process_pool_matches_serial():
+    text = _random_text(99, words=2000)
+    expected = convert(text, source="en_GB", target="en_US", return_stats=True)
+    actual = convert_parallel(
+        text, source="en_GB", target="en_US", workers=2, shard_size=500, return_stats=True
+    )
+    assert actual == expected
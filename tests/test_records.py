@@ -0,0 +1,75 @@
+import io
+
+import pytest
+
+from english_variant_converter import convert
+from english_variant_converter.records import convert_csv_stream, convert_jsonl_stream
+
+JSONL = (
+    '{"id": "clip/001\\u00e9", "text": "The color of the check", "score": 1.50}\r\n'
+    "\n"
+    '{"text":"nothing here","sentence":"gray","path":"color/color.wav"}\n'
+    '{"text": null, "nested": {"text": "color"}}\n'
+    '{ "text" : "caf\\u00e9 color" }'
+)
+
+
+def _run(func, data, *args, **kwargs):
+    dst = io.StringIO(newline="")
+    stats = func(io.StringIO(data, newline=""), dst, *args, **kwargs)
+    return dst.getvalue(), stats
+
+
+def test_jsonl_only_selected_fields_change():
+    output, stats = _run(convert_jsonl_stream, JSONL, ["text", "sentence"])
+    assert output == (
+        '{"id": "clip/001\\u00e9", "text": "The colour of the cheque", "score": 1.50}\r\n'
+        "\n"
+        '{"text":"nothing here","sentence":"grey","path":"color/color.wav"}\n'
+        '{"text": null, "nested": {"text": "color"}}\n'
+        '{ "text" : "caf\\u00e9 colour" }'
+    )
+    assert stats["text"].converted_tokens == 3
+    assert stats["sentence"].converted_tokens == 1
+
+
+def test_jsonl_reports_bad_lines():
+    with pytest.raises(ValueError, match="Line 2"):
+        _run(convert_jsonl_stream, '{"text": "a"}\n{"text": \n')
+
+
+CSV = (
+    "id,path,sentence\r\n"
+    '1,"a,b","The ""color"" center\nmore color"\r\n'
+    "2,color.wav,gray\r\n"
+    "3,y,\r\n"
+    "4,z,plain"
+)
+
+
+def test_csv_only_selected_column_changes():
+    output, stats = _run(convert_csv_stream, CSV, ["sentence"])
+    assert output == (
+        "id,path,sentence\r\n"
+        '1,"a,b","The ""colour"" centre\nmore colour"\r\n'
+        "2,color.wav,grey\r\n"
+        "3,y,\r\n"
+        "4,z,plain"
+    )
+    assert stats["sentence"].converted_tokens == 4
+
+
+def test_csv_requires_known_columns():
+    with pytest.raises(ValueError, match="sentence"):
+        _run(convert_csv_stream, "id,text\n1,color\n", ["sentence"])
+
+
+def test_parallel_batches_keep_order():
+    lines = [f'{{"id": {idx}, "text": "color number {idx}"}}\n' for idx in range(200)]
+    serial, serial_stats = _run(convert_jsonl_stream, "".join(lines), batch_size=7)
+    parallel, parallel_stats = _run(
+        convert_jsonl_stream, "".join(lines), workers=2, batch_size=7
+    )
+    assert parallel == serial
+    assert parallel_stats == serial_stats
+    assert serial.splitlines()[-1] == '{"id": 199, "text": "%s"}' % convert("color number 199")
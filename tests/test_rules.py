@@ -1,4 +1,4 @@
-from english_variant_converter import rules
+from english_variant_converter import convert, data_loader, morphology, rules
 from english_variant_converter import exception_policies as exception_module
 
 
@@ -19,3 +19,53 @@ def test_exception_policies_handle_missing_file(tmp_path, monkeypatch):
     monkeypatch.setattr(exception_module.resources, "files", fake_files)
     policies = exception_module.ExceptionPolicies()
     assert policies.classify("check", "cheque").action == ""
+
+
+def test_packaged_index_matches_crosswalk_rows():
+    index = data_loader.load_index()
+    assert index is not None, "crosswalk_index.json is stale; rerun scripts/build_crosswalk.py"
+    for kind in ("spelling_only", "lexical_choice"):
+        rows = data_loader.load_crosswalk(kind)
+        for source in rules.SUPPORTED_VARIANTS:
+            for target in rules.SUPPORTED_VARIANTS:
+                if source == target:
+                    continue
+                expected = rules.build_table(rows, source, target)
+                key = rules.index_key(source, target)
+                if kind == "spelling_only":
+                    residual, pair_rules = morphology.factor_table(expected)
+                    assert index["morphology"].get(key, {}) == pair_rules
+                    expected = residual
+                assert index["tables"][kind].get(key, {}) == expected
+
+
+def test_compiled_tables_reproduce_every_crosswalk_entry():
+    kinds = (("spelling_only", "spelling_only"), ("lexical_choice", "spelling_and_lexical"))
+    for kind, mode in kinds:
+        rows = data_loader.load_crosswalk(kind)
+        for source in rules.SUPPORTED_VARIANTS:
+            for target in rules.SUPPORTED_VARIANTS:
+                if source == target:
+                    continue
+                table = rules._build_mapping(source, target, mode)
+                for word, replacement in rules.build_table(rows, source, target).items():
+                    assert table.get(word) == replacement, (source, target, word)
+
+
+def test_fallback_chains_fill_blank_cells():
+    row = {"en_US": "colorize", "en_GB": "colourise", "en_AU": "", "en_CA": ""}
+    assert rules.resolve_cell(row, "en_AU") == "colourise"
+    assert rules.resolve_cell(row, "en_CA") == "colourize"
+    assert rules.resolve_cell({**row, "en_CA": "colorize"}, "en_CA") == "colorize"
+    assert rules.resolve_cell({**row, "type": "lexical_choice"}, "en_AU") == ""
+
+
+def test_every_pair_converts_in_one_pass():
+    text = "The traveler organized a colorful catalog at the center."
+    assert convert(text, "en_US", "en_AU") == convert(text, "en_US", "en_GB")
+    assert convert(text, "en_US", "en_CA") == (
+        "The traveller organized a colourful catalogue at the centre."
+    )
+    assert convert("The traveller organised it.", "en_AU", "en_CA") == (
+        "The traveller organized it."
+    )
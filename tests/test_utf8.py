@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import pytest
+
+from english_variant_converter import Overlay, convert, convert_bytes
+
+TRANSCRIPTS_DIR = Path(__file__).resolve().parents[1] / "samples" / "transcripts"
+
+EDGE_CASES = [
+    "",
+    "Nothing to convert here.",
+    "The café served 😀 color-coded flavored naïve treats at the center.",
+    "Visit http://color.example/center or mail color@example.com #color",
+    "COLOR Color color colorK Kcolor",
+    "He wrote a check; the check cleared. Practice makes perfect.",
+    "Ünïcödé wörds around color and ＡＢＣ full-width letters.",
+]
+
+
+TEXTS = EDGE_CASES + [
+    path.read_text(encoding="utf-8") for path in sorted(TRANSCRIPTS_DIR.glob("*.txt"))
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize(
+    "source,target,mode",
+    [
+        ("en_US", "en_GB", "spelling_only"),
+        ("en_GB", "en_US", "spelling_and_lexical"),
+    ],
+)
+def test_matches_convert(text, source, target, mode):
+    expected, expected_stats = convert(text, source, target, mode, return_stats=True)
+    data = text.encode("utf-8")
+    assert convert_bytes(data, source, target, mode) == expected.encode("utf-8")
+    converted, stats = convert_bytes(memoryview(data), source, target, mode, return_stats=True)
+    assert converted == expected.encode("utf-8")
+    assert stats == expected_stats
+
+
+def test_untouched_input_is_returned_as_is():
+    data = "Nothing to convert here.".encode("utf-8")
+    assert convert_bytes(data) is data
+    assert convert_bytes(bytearray(data)) == data
+
+
+def test_overlay():
+    overlay = Overlay("tenant", {"additions": [{"en_US": "acmecolor", "en_GB": "acmecolour"}]})
+    assert convert_bytes("Acmecolor the café".encode("utf-8"), overlay=overlay) == (
+        "Acmecolour the café".encode("utf-8")
+    )
+
+
+def test_rejects_unknown_variant():
+    with pytest.raises(ValueError):
+        convert_bytes(b"color", source="en_XX")
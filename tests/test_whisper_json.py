@@ -0,0 +1,130 @@
+import io
+import json
+
+import pytest
+
+from english_variant_converter.whisper_json import (
+    convert_whisper_json,
+    convert_whisper_json_stream,
+)
+
+
+def _payload():
+    return {
+        "text": " Pick a color. The check arrived.",
+        "segments": [
+            {
+                "id": 0,
+                "start": 0.0,
+                "end": 1.2,
+                "text": " Pick a color. The",
+                "tokens": [50364, 14895],
+                "words": [
+                    {"word": " Pick", "start": 0.0, "end": 0.3, "probability": 0.91},
+                    {"word": " a", "start": 0.3, "end": 0.4, "probability": 0.99},
+                    {"word": " color.", "start": 0.4, "end": 0.9, "probability": 0.87},
+                    {"word": " The", "start": 0.9, "end": 1.2, "probability": 0.95},
+                ],
+            },
+            {
+                "id": 1,
+                "start": 1.2,
+                "end": 2.0,
+                "text": " check arrived.",
+                "words": [
+                    {"word": " check", "start": 1.2, "end": 1.5, "probability": 0.8},
+                    {"word": " arrived.", "start": 1.5, "end": 2.0, "probability": 0.9},
+                ],
+            },
+        ],
+        "language": "en",
+    }
+
+
+def test_words_converted_with_context_across_segments():
+    payload, stats = convert_whisper_json(_payload(), return_stats=True)
+    first, second = payload["segments"]
+    assert payload["text"] == " Pick a colour. The cheque arrived."
+    assert first["text"] == " Pick a colour. The"
+    assert [w["word"] for w in first["words"]] == [" Pick", " a", " colour.", " The"]
+    # "The" ends the previous segment, so the noun rule still sees the article.
+    assert second["words"][0] == {"word": " cheque", "start": 1.2, "end": 1.5, "probability": 0.8}
+    assert first["tokens"] == [50364, 14895]
+    assert stats.total_tokens == 6
+    assert stats.converted_tokens == 2
+
+
+def test_stream_matches_in_memory_conversion():
+    src = io.StringIO(json.dumps(_payload(), indent=2))
+    dst = io.StringIO()
+    stats = convert_whisper_json_stream(src, dst)
+    assert json.loads(dst.getvalue()) == convert_whisper_json(_payload())
+    assert stats.converted_tokens == 2
+
+
+def test_words_without_leading_spaces():
+    payload = {
+        "segments": [
+            {
+                "text": "Pick a color",
+                "words": [{"word": "Pick"}, {"word": "a"}, {"word": "color"}],
+            },
+            {"text": "center", "words": [{"word": "center"}]},
+        ]
+    }
+    payload, stats = convert_whisper_json(payload, return_stats=True)
+    first, second = payload["segments"]
+    assert first["text"] == "Pick a colour"
+    assert [w["word"] for w in first["words"]] == ["Pick", "a", "colour"]
+    assert second["words"] == [{"word": "centre"}]
+    assert stats.total_tokens == 4
+    assert stats.converted_tokens == 2
+
+
+def test_words_split_across_entries():
+    payload = {
+        "segments": [
+            {
+                "text": " The color of the theater",
+                "words": [
+                    {"word": " The"},
+                    {"word": " col"},
+                    {"word": "or"},
+                    {"word": " of"},
+                    {"word": " the"},
+                    {"word": " theate"},
+                    {"word": "r"},
+                ],
+            }
+        ]
+    }
+    payload, stats = convert_whisper_json(payload, return_stats=True)
+    words = [w["word"] for w in payload["segments"][0]["words"]]
+    # The "-or" → "-our" change lies inside one entry; "-er" → "-re" straddles two.
+    assert words == [" The", " col", "our", " of", " the", " theate", "r"]
+    assert stats.converted_tokens == 1
+    assert [(swap.source, swap.target) for swap in stats.swaps] == [("color", "colour")]
+
+
+
+@pytest.mark.parametrize(
+    "text,words",
+    [
+        (" color", [" color"]),
+        ("Pick a color", ["Pick", "a", "color"]),
+    ],
+)
+def test_word_context_from_segment_without_words(text, words):
+    # A segment without ``words`` lends its text, which may lack a leading space.
+    payload = {
+        "segments": [
+            {"text": text, "words": [{"word": word} for word in words]},
+            {"text": "Honor"},
+        ]
+    }
+    payload, stats = convert_whisper_json(payload, return_stats=True)
+    first, second = payload["segments"]
+    assert first["text"] == text.replace("color", "colour")
+    assert [w["word"] for w in first["words"]] == [w.replace("color", "colour") for w in words]
+    assert second["text"] == "Honour"
+    assert stats.converted_tokens == 2